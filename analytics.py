@@ -0,0 +1,379 @@
+import time
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+import numpy as np
+from src.csfloat_api.models.history_sale_info import ItemSale
+
+__all__ = (
+    "SaleArrays",
+    "SaleSummary",
+    "SaleAnalytics",
+    "rolling_median",
+    "sticker_value",
+    "float_band_regression",
+    "sales_velocity",
+    "volatility",
+)
+
+_DAY = 86400
+
+
+def sticker_value(item) -> int:
+    """
+    Сумма цен наклеек предмета в центах по `reference.price` (0, если наклеек нет).
+    """
+    if not item.stickers:
+        return 0
+    return sum(sticker.price or 0 for sticker in item.stickers)
+
+
+class SaleArrays:
+    """
+    История продаж одного предмета в виде массивов NumPy, отсортированных по sold_at.
+
+    Цены в центах, отсутствующий float - nan, отсутствующий paint_seed - -1.
+    """
+
+    __slots__ = (
+        "price",
+        "float_value",
+        "sold_at",
+        "paint_seed",
+        "sticker_value",
+        "last_sale_id",
+    )
+
+    def __init__(
+            self,
+            *,
+            price: np.ndarray,
+            float_value: np.ndarray,
+            sold_at: np.ndarray,
+            paint_seed: np.ndarray,
+            sticker_value: np.ndarray,
+            last_sale_id: Optional[str]
+    ):
+        self.price = price
+        self.float_value = float_value
+        self.sold_at = sold_at
+        self.paint_seed = paint_seed
+        self.sticker_value = sticker_value
+        self.last_sale_id = last_sale_id
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    @classmethod
+    def from_sales(cls, sales: Sequence[ItemSale]) -> "SaleArrays":
+        count = len(sales)
+        price = np.empty(count, dtype=np.int64)
+        float_value = np.empty(count, dtype=np.float64)
+        sold_at = np.empty(count, dtype=np.int64)
+        paint_seed = np.empty(count, dtype=np.int32)
+        stickers = np.empty(count, dtype=np.int64)
+
+        # Единственный проход по объектам - дальше только векторные операции
+        for i, sale in enumerate(sales):
+            item = sale.item
+            price[i] = sale.price
+            float_value[i] = np.nan if item.float_value is None else item.float_value
+            sold_at[i] = sale.sold_at_ts
+            paint_seed[i] = -1 if item.paint_seed is None else item.paint_seed
+            stickers[i] = sticker_value(item)
+
+        order = np.argsort(sold_at, kind="stable")
+        last_sale_id = sales[order[-1]].id if count else None
+        return cls(
+            price=price[order],
+            float_value=float_value[order],
+            sold_at=sold_at[order],
+            paint_seed=paint_seed[order],
+            sticker_value=stickers[order],
+            last_sale_id=last_sale_id,
+        )
+
+
+def _rolling_median_grouped(values: np.ndarray, groups: np.ndarray, window: int) -> np.ndarray:
+    # Окна по склеенным группам строятся за один проход; окна, задевающие две группы, отбрасываются
+    result = np.full(len(values), np.nan)
+    if window <= 0 or len(values) < window:
+        return result
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+    inside = groups[window - 1:] == groups[:len(groups) - window + 1]
+    if inside.any():
+        result[window - 1:][inside] = np.median(windows[inside], axis=1)
+    return result
+
+
+def rolling_median(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Скользящая медиана. Первые window - 1 значений - nan.
+    Для многих предметов сразу - `SaleAnalytics.rolling_medians`.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    return _rolling_median_grouped(values, np.zeros(len(values), dtype=np.int64), window)
+
+
+def _float_band_regression_grouped(
+        x: np.ndarray, y: np.ndarray, groups: np.ndarray, n_groups: int, edges: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Суммы по парам (группа, диапазон) одним bincount на плоском индексе
+    n_bands = len(edges) - 1
+    mask = ~np.isnan(x) & (x >= edges[0]) & (x <= edges[-1])
+    x, y, groups = x[mask], y[mask], groups[mask]
+    band = np.clip(np.searchsorted(edges, x, side="right") - 1, 0, n_bands - 1)
+    cell = groups * n_bands + band
+    size = n_groups * n_bands
+
+    def sums(weights=None) -> np.ndarray:
+        return np.bincount(cell, weights=weights, minlength=size).reshape(n_groups, n_bands).astype(np.float64)
+
+    n, sx, sy, sxx, sxy = sums(), sums(x), sums(y), sums(x * x), sums(x * y)
+    denominator = n * sxx - sx * sx
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(denominator > 0, (n * sxy - sx * sy) / denominator, np.nan)
+        intercept = np.where(denominator > 0, (sy - slope * sx) / n, np.nan)
+    return slope, intercept, n.astype(np.int64)
+
+
+def float_band_regression(
+        float_values: np.ndarray, prices: np.ndarray, bands: Sequence[float]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Линейная регрессия цены по float внутри каждого диапазона float.
+    Для многих предметов сразу - `SaleAnalytics.float_bands`.
+
+    :param float_values: Значения float (nan пропускаются)
+    :param prices: Цены
+    :param bands: Границы диапазонов, например (0, 0.07, 0.15, 0.38, 0.45, 1)
+    :return: (slope, intercept, count) для каждого из len(bands) - 1 диапазонов;
+        для диапазонов меньше чем из двух точек slope и intercept - nan
+    """
+    x = np.asarray(float_values, dtype=np.float64)
+    y = np.asarray(prices, dtype=np.float64)
+    slope, intercept, count = _float_band_regression_grouped(
+        x, y, np.zeros(len(x), dtype=np.int64), 1, np.asarray(bands, dtype=np.float64)
+    )
+    return slope[0], intercept[0], count[0]
+
+
+def sales_velocity(sold_at: np.ndarray, *, window: int = 7 * _DAY, now: Optional[float] = None) -> float:
+    """
+    :return: Продаж в день за последние `window` секунд
+    """
+    now = time.time() if now is None else now
+    recent = np.count_nonzero(np.asarray(sold_at) >= now - window)
+    return recent * _DAY / window
+
+
+def volatility(prices: np.ndarray) -> float:
+    """
+    :return: Стандартное отклонение логарифмических доходностей между продажами
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    if len(prices) < 3:
+        return float("nan")
+    return float(np.std(np.diff(np.log(prices)), ddof=1))
+
+
+class SaleSummary:
+    __slots__ = (
+        "_sales_count",
+        "_median_price",
+        "_volatility",
+        "_velocity",
+        "_last_sale_id",
+    )
+
+    def __init__(
+            self,
+            *,
+            sales_count: int,
+            median_price: float,
+            volatility: float,
+            velocity: float,
+            last_sale_id: Optional[str]
+    ):
+        self._sales_count = sales_count
+        self._median_price = median_price
+        self._volatility = volatility
+        self._velocity = velocity
+        self._last_sale_id = last_sale_id
+
+    @property
+    def sales_count(self) -> int:
+        return self._sales_count
+
+    @property
+    def median_price(self) -> float:
+        return self._median_price
+
+    @property
+    def median_price_normal(self) -> float:
+        return round(self._median_price / 100, 2)
+
+    @property
+    def volatility(self) -> float:
+        return self._volatility
+
+    @property
+    def velocity(self) -> float:
+        return self._velocity
+
+    @property
+    def last_sale_id(self) -> Optional[str]:
+        return self._last_sale_id
+
+
+class SaleAnalytics:
+    """
+    Векторные метрики по историям продаж многих предметов сразу.
+
+    Массивы и не зависящие от времени метрики кешируются по ключу предмета
+    вместе с id последней продажи и пересчитываются только при появлении новых
+    продаж; старая запись предмета при этом заменяется.
+    """
+
+    __slots__ = (
+        "_arrays",
+        "_static",
+        "_velocity_window",
+    )
+
+    def __init__(self, *, velocity_window: int = 7 * _DAY) -> None:
+        """
+        :param velocity_window: Окно для скорости продаж в секундах
+        """
+        self._arrays: Dict[Hashable, Tuple[Optional[str], SaleArrays]] = {}
+        # Ключ предмета -> (id последней продажи, медиана, волатильность)
+        self._static: Dict[Hashable, Tuple[Optional[str], float, float]] = {}
+        self._velocity_window = velocity_window
+
+    def arrays(self, key: Hashable, sales: Sequence[ItemSale]) -> SaleArrays:
+        """
+        :param key: Ключ предмета, обычно market_hash_name
+        :param sales: История продаж из `parse_item_by_name`
+        """
+        last_sale_id = max(sales, key=lambda sale: sale.sold_at_ts).id if sales else None
+        cached = self._arrays.get(key)
+        if cached is not None and cached[0] == last_sale_id:
+            return cached[1]
+
+        arrays = SaleArrays.from_sales(sales)
+        self._arrays[key] = (last_sale_id, arrays)
+        return arrays
+
+    def summarize(
+            self, histories: Dict[Hashable, Sequence[ItemSale]], *, now: Optional[float] = None
+    ) -> Dict[Hashable, SaleSummary]:
+        """
+        :param histories: Ключ предмета -> история продаж
+        :param now: Текущее время для скорости продаж (по умолчанию time.time())
+        :return: Ключ предмета -> сводка
+        """
+        now = time.time() if now is None else now
+        keys: List[Hashable] = list(histories)
+        arrays = [self.arrays(key, histories[key]) for key in keys]
+
+        missing = []
+        for i, (key, array) in enumerate(zip(keys, arrays)):
+            cached = self._static.get(key)
+            if cached is None or cached[0] != array.last_sale_id:
+                missing.append(i)
+        if missing:
+            medians, volatilities = self._grouped_static([arrays[i] for i in missing])
+            for position, i in enumerate(missing):
+                self._static[keys[i]] = (arrays[i].last_sale_id, medians[position], volatilities[position])
+
+        velocities = self._grouped_velocity(arrays, now)
+        summaries = {}
+        for i, (key, array) in enumerate(zip(keys, arrays)):
+            _, median, vol = self._static[key]
+            summaries[key] = SaleSummary(
+                sales_count=len(array),
+                median_price=median,
+                volatility=vol,
+                velocity=float(velocities[i]),
+                last_sale_id=array.last_sale_id,
+            )
+        return summaries
+
+    def rolling_medians(
+            self, histories: Dict[Hashable, Sequence[ItemSale]], window: int
+    ) -> Dict[Hashable, np.ndarray]:
+        """
+        Скользящая медиана цены по каждому предмету, посчитанная одним проходом по всем историям.
+
+        :param histories: Ключ предмета -> история продаж
+        :param window: Размер окна в продажах
+        :return: Ключ предмета -> медианы в порядке sold_at (первые window - 1 - nan)
+        """
+        keys: List[Hashable] = list(histories)
+        arrays = [self.arrays(key, histories[key]) for key in keys]
+        prices, groups = self._concat(arrays, "price")
+        medians = _rolling_median_grouped(prices.astype(np.float64), groups, window)
+        bounds = np.cumsum([len(array) for array in arrays])[:-1]
+        return dict(zip(keys, np.split(medians, bounds)))
+
+    def float_bands(
+            self, histories: Dict[Hashable, Sequence[ItemSale]], bands: Sequence[float]
+    ) -> Dict[Hashable, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        `float_band_regression` для каждого предмета, посчитанная одним проходом по всем историям.
+
+        :param histories: Ключ предмета -> история продаж
+        :param bands: Границы диапазонов float
+        :return: Ключ предмета -> (slope, intercept, count) по диапазонам
+        """
+        keys: List[Hashable] = list(histories)
+        arrays = [self.arrays(key, histories[key]) for key in keys]
+        floats, groups = self._concat(arrays, "float_value")
+        prices, _ = self._concat(arrays, "price")
+        slope, intercept, count = _float_band_regression_grouped(
+            floats.astype(np.float64), prices.astype(np.float64), groups, len(keys),
+            np.asarray(bands, dtype=np.float64),
+        )
+        return {key: (slope[i], intercept[i], count[i]) for i, key in enumerate(keys)}
+
+    @staticmethod
+    def _concat(arrays: Sequence[SaleArrays], field: str) -> Tuple[np.ndarray, np.ndarray]:
+        lengths = np.fromiter((len(array) for array in arrays), dtype=np.int64, count=len(arrays))
+        groups = np.repeat(np.arange(len(arrays)), lengths)
+        if not len(groups):
+            return np.empty(0), groups
+        values = np.concatenate([getattr(array, field) for array in arrays])
+        return values, groups
+
+    def _grouped_static(self, arrays: Sequence[SaleArrays]) -> Tuple[np.ndarray, np.ndarray]:
+        n_groups = len(arrays)
+        prices, groups = self._concat(arrays, "price")
+        prices = prices.astype(np.float64)
+        counts = np.bincount(groups, minlength=n_groups)
+
+        # Медиана по группам: сортируем по (группа, цена) и берём середину каждой группы
+        order = np.lexsort((prices, groups))
+        sorted_prices = prices[order]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        lower = starts + np.maximum(counts - 1, 0) // 2
+        upper = starts + counts // 2
+        medians = np.full(n_groups, np.nan)
+        has_sales = counts > 0
+        if len(sorted_prices):
+            medians[has_sales] = (sorted_prices[lower[has_sales]] + sorted_prices[upper[has_sales]]) / 2
+
+        # Волатильность: доходности между соседними продажами внутри одной группы
+        returns = np.diff(np.log(prices)) if len(prices) else np.empty(0)
+        same_group = groups[1:] == groups[:-1] if len(groups) else np.empty(0, dtype=bool)
+        returns, return_groups = returns[same_group], groups[1:][same_group]
+        n = np.bincount(return_groups, minlength=n_groups).astype(np.float64)
+        total = np.bincount(return_groups, weights=returns, minlength=n_groups)
+        total_sq = np.bincount(return_groups, weights=returns * returns, minlength=n_groups)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance = (total_sq - total * total / n) / (n - 1)
+        volatilities = np.where(n >= 2, np.sqrt(np.maximum(variance, 0.0)), np.nan)
+        return medians, volatilities
+
+    def _grouped_velocity(self, arrays: Sequence[SaleArrays], now: float) -> np.ndarray:
+        sold_at, groups = self._concat(arrays, "sold_at")
+        recent = sold_at >= now - self._velocity_window
+        counts = np.bincount(groups[recent], minlength=len(arrays))
+        return counts * _DAY / self._velocity_window
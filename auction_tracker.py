@@ -0,0 +1,326 @@
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from src.csfloat_api.listing_query import MAX_PAGE_LIMIT, listing_query
+from src.csfloat_api.models.base import parse_datetime
+from src.csfloat_api.models.listing import Listing
+
+__all__ = ("AuctionTracker",)
+
+logger = logging.getLogger(__name__)
+
+
+class _Auction:
+    __slots__ = (
+        "listing_id",
+        "market_hash_name",
+        "expires_at",
+        "top_bid_id",
+        "top_bid_price",
+        "top_bidder",
+        "ending_soon_fired",
+        "batch_misses",
+        "entry",
+    )
+
+    def __init__(self, listing_id, market_hash_name: Optional[str]):
+        self.listing_id = listing_id
+        self.market_hash_name = market_hash_name
+        self.expires_at: Optional[float] = None
+        self.top_bid_id = None
+        self.top_bid_price: Optional[int] = None
+        self.top_bidder: Optional[str] = None
+        self.ending_soon_fired = False
+        self.batch_misses = 0
+        # Номер актуальной записи в куче; остальные записи аукциона устарели
+        self.entry: Optional[int] = None
+
+
+class AuctionTracker:
+    """
+    Следит за множеством аукционов, опрашивая каждый тем чаще, чем ближе его `expires_at`.
+
+    Расписание - куча по времени следующего опроса, которое считается как доля
+    оставшегося до окончания времени. Аукционы дальше `batch_horizon` секунд от
+    окончания обновляются пачками: страницы `get_all_listings(type_='auction',
+    sort_by='expires_soon', market_hash_name=...)` на предмет вместо запроса на
+    каждый аукцион. Страницы листаются, пока не найдены все отслеживаемые
+    аукционы предмета или пока страница не ушла дальше самого позднего из них.
+
+    Колбэки могут быть обычными функциями или корутинами:
+        on_bid(listing, previous_price) - новая ставка;
+        on_outbid(listing) - наша ставка (own_buyer_id) перебита;
+        on_ending_soon(listing) - до окончания осталось меньше `ending_soon` секунд;
+        on_ended(listing) - аукцион закончился (последнее известное состояние).
+    """
+
+    __slots__ = (
+        "_client",
+        "_auctions",
+        "_heap",
+        "_entries",
+        "_own_buyer_id",
+        "_ending_soon",
+        "_batch_horizon",
+        "_interval_fraction",
+        "_min_interval",
+        "_max_interval",
+        "_on_bid",
+        "_on_outbid",
+        "_on_ending_soon",
+        "_on_ended",
+    )
+
+    def __init__(
+            self,
+            client,
+            *,
+            own_buyer_id: Optional[str] = None,
+            ending_soon: float = 120.0,
+            batch_horizon: float = 3600.0,
+            interval_fraction: float = 0.1,
+            min_interval: float = 2.0,
+            max_interval: float = 900.0,
+            on_bid: Optional[Callable] = None,
+            on_outbid: Optional[Callable] = None,
+            on_ending_soon: Optional[Callable] = None,
+            on_ended: Optional[Callable] = None
+    ) -> None:
+        """
+        :param client: Экземпляр `Client` (используются его async-версии методов)
+        :param own_buyer_id: Наш obfuscated_buyer_id, чтобы узнавать о перебитых ставках
+        :param ending_soon: За сколько секунд до окончания вызывать on_ending_soon
+        :param batch_horizon: Аукционы дальше этого горизонта обновляются пачками
+        :param interval_fraction: Интервал опроса как доля оставшегося времени
+        :param min_interval: Минимальный интервал опроса в секундах
+        :param max_interval: Максимальный интервал опроса в секундах
+        """
+        self._client = client
+        self._auctions: Dict[str, _Auction] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._entries = itertools.count()
+        self._own_buyer_id = own_buyer_id
+        self._ending_soon = ending_soon
+        self._batch_horizon = batch_horizon
+        self._interval_fraction = interval_fraction
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._on_bid = on_bid
+        self._on_outbid = on_outbid
+        self._on_ending_soon = on_ending_soon
+        self._on_ended = on_ended
+
+    def __len__(self) -> int:
+        return len(self._auctions)
+
+    def __contains__(self, listing_id) -> bool:
+        return str(listing_id) in self._auctions
+
+    async def track(self, listing: Listing, *, now: Optional[float] = None) -> None:
+        """
+        Начинает следить за аукционом; события по текущему состоянию не вызываются.
+        """
+        now = time.time() if now is None else now
+        key = str(listing.id)
+        auction = self._auctions.get(key)
+        if auction is None:
+            auction = self._auctions[key] = _Auction(listing.id, listing.item.market_hash_name)
+        self._update_state(auction, listing)
+        self._schedule(auction, now)
+
+    def untrack(self, listing_id) -> None:
+        # Записи в куче удалятся лениво при следующем извлечении
+        self._auctions.pop(str(listing_id), None)
+
+    def _update_state(self, auction: _Auction, listing: Listing) -> None:
+        details = listing.auction_details
+        expires_at = parse_datetime(details.expires_at)
+        auction.expires_at = None if expires_at is None else expires_at.timestamp()
+        top_bid = details.top_bid
+        auction.top_bid_id = top_bid.id if top_bid is not None else None
+        auction.top_bid_price = top_bid.price if top_bid is not None else None
+        auction.top_bidder = top_bid.obfuscated_buyer_id if top_bid is not None else None
+
+    def _interval(self, time_left: float) -> float:
+        return min(max(time_left * self._interval_fraction, self._min_interval), self._max_interval)
+
+    def _schedule(self, auction: _Auction, now: float) -> None:
+        if auction.expires_at is None:
+            next_at = now + self._max_interval
+        else:
+            time_left = auction.expires_at - now
+            next_at = now + self._interval(time_left)
+            if time_left > self._ending_soon:
+                # Не проспать момент ending_soon
+                next_at = min(next_at, auction.expires_at - self._ending_soon)
+            elif time_left > 0:
+                # Последний опрос - сразу после окончания
+                next_at = min(next_at, auction.expires_at + self._min_interval)
+        # Повторный track() или track() после untrack() не должны давать второй опрос за интервал
+        auction.entry = next(self._entries)
+        heapq.heappush(self._heap, (next_at, auction.entry, str(auction.listing_id)))
+
+    def _is_current(self, entry: int, key: str) -> bool:
+        auction = self._auctions.get(key)
+        return auction is not None and auction.entry == entry
+
+    def next_poll_at(self) -> Optional[float]:
+        while self._heap and not self._is_current(*self._heap[0][1:]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    @staticmethod
+    async def _fire(callback: Optional[Callable], *args) -> None:
+        if callback is None:
+            return
+        try:
+            result = callback(*args)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as error:
+            logger.warning(f"auction callback {callback!r} failed: {error}")
+
+    async def _apply(self, auction: _Auction, listing: Listing, now: float) -> None:
+        previous_id, previous_price, previous_bidder = auction.top_bid_id, auction.top_bid_price, auction.top_bidder
+        self._update_state(auction, listing)
+
+        if auction.top_bid_id is not None and auction.top_bid_id != previous_id:
+            await self._fire(self._on_bid, listing, previous_price)
+            if (
+                    self._own_buyer_id is not None
+                    and previous_bidder == self._own_buyer_id
+                    and auction.top_bidder != self._own_buyer_id
+            ):
+                await self._fire(self._on_outbid, listing)
+
+        if auction.expires_at is not None:
+            time_left = auction.expires_at - now
+            if time_left <= 0:
+                self._auctions.pop(str(auction.listing_id), None)
+                await self._fire(self._on_ended, listing)
+                return
+            if time_left <= self._ending_soon and not auction.ending_soon_fired:
+                auction.ending_soon_fired = True
+                await self._fire(self._on_ending_soon, listing)
+
+        self._schedule(auction, now)
+
+    def due(self, now: Optional[float] = None) -> List[str]:
+        now = time.time() if now is None else now
+        keys = {}
+        while self._heap and self._heap[0][0] <= now:
+            _, entry, key = heapq.heappop(self._heap)
+            if self._is_current(entry, key):
+                self._auctions[key].entry = None
+                keys[key] = None
+        return list(keys)
+
+    async def _poll_one(self, auction: _Auction) -> Optional[Listing]:
+        try:
+            return await self._client.aio.get_specific_listing(auction.listing_id)
+        except Exception as error:
+            logger.warning(f"auction {auction.listing_id} poll failed: {error}")
+            return None
+
+    async def _poll_batch(self, market_hash_name: str, auctions: List[_Auction]) -> Tuple[Dict[str, Listing], int]:
+        """
+        :return: (найденные листинги по id, число запросов)
+        """
+        wanted = {str(auction.listing_id) for auction in auctions}
+        latest = max(auction.expires_at for auction in auctions)
+        query = listing_query(
+            type_="auction",
+            sort_by="expires_soon",
+            market_hash_name=market_hash_name,
+            limit=MAX_PAGE_LIMIT,
+        )
+        found: Dict[str, Listing] = {}
+        requests = 0
+        while True:
+            requests += 1
+            try:
+                listings = await self._client.aio.get_all_listings(query=query)
+            except Exception as error:
+                logger.warning(f"auction batch {market_hash_name} page {query.page} poll failed: {error}")
+                return found, requests
+            for listing in listings:
+                key = str(listing.id)
+                if key in wanted:
+                    found[key] = listing
+            if len(found) == len(wanted) or len(listings) < query.limit:
+                return found, requests
+            # Страницы отсортированы по окончанию: дальше самого позднего из наших искать нечего
+            last = parse_datetime(listings[-1].auction_details.expires_at)
+            if last is not None and last.timestamp() > latest:
+                return found, requests
+            query = query.next_page()
+
+    async def run_once(self, *, now: Optional[float] = None) -> int:
+        """
+        Обновляет все аукционы, которым пора, и вызывает колбэки.
+
+        :return: Количество сделанных запросов
+        """
+        simulated = now is not None
+        now = time.time() if now is None else now
+        near: List[_Auction] = []
+        far: Dict[str, List[_Auction]] = {}
+        for key in self.due(now):
+            auction = self._auctions[key]
+            far_off = (
+                auction.expires_at is not None
+                and auction.expires_at - now > self._batch_horizon
+                and auction.market_hash_name is not None
+                and auction.batch_misses == 0
+            )
+            if far_off:
+                far.setdefault(auction.market_hash_name, []).append(auction)
+            else:
+                near.append(auction)
+
+        # Группа из одного аукциона дешевле опросить напрямую
+        for name in [name for name, group in far.items() if len(group) == 1]:
+            near.extend(far.pop(name))
+
+        names = list(far)
+        batches, singles = await asyncio.gather(
+            asyncio.gather(*(self._poll_batch(name, far[name]) for name in names)),
+            asyncio.gather(*(self._poll_one(auction) for auction in near)),
+        )
+
+        finished = now if simulated else time.time()
+        for auction, listing in zip(near, singles):
+            if listing is None:
+                self._schedule(auction, finished)
+            else:
+                auction.batch_misses = 0
+                await self._apply(auction, listing, finished)
+
+        requests = len(near)
+        for name, (found, pages) in zip(names, batches):
+            requests += pages
+            for auction in far[name]:
+                listing = found.get(str(auction.listing_id))
+                if listing is None:
+                    # Не нашёлся в страницах (снят, продан или ошибка) - следующий раз опросим отдельно
+                    auction.batch_misses += 1
+                    self._schedule(auction, finished)
+                else:
+                    await self._apply(auction, listing, finished)
+
+        return requests
+
+    async def run(self, stop: Optional[asyncio.Event] = None) -> None:
+        stop = stop if stop is not None else asyncio.Event()
+        while not stop.is_set():
+            await self.run_once()
+            next_at = self.next_poll_at()
+            delay = self._max_interval if next_at is None else max(next_at - time.time(), 0.0)
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,204 @@
+"""
+Бенчмарк разбора ответов всех эндпоинтов: json.loads + сборка моделей.
+
+Ответы синтетические, но по форме совпадают с ответами API. Для каждого
+эндпоинта печатается время на запись с проверкой схемы и без неё
+(доверенный режим, `trusted=True` в клиенте и `parse_item_by_name`).
+Для истории продаж отдельно показано, сколько стоит ленивый разбор дат,
+если к `sold_at` всё-таки обращаются.
+
+    python -m src.csfloat_api.benchmarks.parse_benchmark --records 1000 --repeat 5
+"""
+import argparse
+import json
+import time
+from functools import partial
+from typing import Callable, List, Tuple
+from src.csfloat_api.models.buy_orders import BuyOrders
+from src.csfloat_api.models.listing import Listing
+from src.csfloat_api.models.my_trades_response import TradesResponse
+from src.csfloat_api.parse_pool import build_item_sales, build_my_buy_orders, build_similar_buy_orders
+
+
+def _sticker(i: int) -> dict:
+    return {
+        "stickerId": 4000 + i,
+        "slot": i % 5,
+        "wear": 0.01 * (i % 7),
+        "icon_url": "https://example.invalid/sticker.png",
+        "name": f"Sticker | Team {i % 30} | Katowice 2014",
+        "reference": {"price": 1000 + i, "quantity": 3, "updated_at": "2024-12-06T23:35:14.672965Z"},
+    }
+
+
+def _item(i: int) -> dict:
+    return {
+        "asset_id": str(30000000000 + i),
+        "def_index": 7,
+        "paint_index": 282,
+        "paint_seed": i % 1000,
+        "float_value": (i % 1000) / 1000,
+        "icon_url": "https://example.invalid/item.png",
+        "d_param": str(9000000000 + i),
+        "is_stattrak": False,
+        "is_souvenir": False,
+        "rarity": 5,
+        "quality": 4,
+        "market_hash_name": "AK-47 | Redline (Field-Tested)",
+        "low_rank": i % 500 + 1,
+        "stickers": [_sticker(i + slot) for slot in range(i % 5)],
+        "tradable": 0,
+        "inspect_link": f"steam://rungame/730/76561202255233023/+csgo_econ_action_preview%20A{i}D1",
+        "has_screenshot": True,
+        "is_commodity": False,
+        "type": "skin",
+        "rarity_name": "Classified",
+        "type_name": "Skin",
+        "item_name": "AK-47 | Redline",
+        "wear_name": "Field-Tested",
+        "collection": "The Phoenix Collection",
+    }
+
+
+def _reference(i: int) -> dict:
+    return {
+        "base_price": 3000,
+        "float_factor": 1.02,
+        "predicted_price": 3000 + i % 100,
+        "quantity": 120,
+        "last_updated": "2024-12-06T23:35:14.672965Z",
+    }
+
+
+def _listing(i: int) -> dict:
+    return {
+        "id": str(780000000000000000 + i),
+        "created_at": "2024-12-06T23:35:14.672965Z",
+        "type": "buy_now",
+        "price": 3000 + i % 500,
+        "state": "listed",
+        "seller": {
+            "away": False,
+            "online": True,
+            "obfuscated_id": str(1000 + i % 50),
+            "steam_id": str(76561198000000000 + i % 50),
+            "username": "seller",
+            "statistics": {"total_trades": 100, "total_verified_trades": 98, "total_failed_trades": 1},
+        },
+        "reference": _reference(i),
+        "item": _item(i),
+        "is_seller": False,
+        "min_offer_price": 2500,
+        "max_offer_discount": 1500,
+        "is_watchlisted": False,
+        "watchers": i % 10,
+    }
+
+
+def _sale(i: int) -> dict:
+    sale = _listing(i)
+    sale["state"] = "sold"
+    sale["sold_at"] = "2024-12-07T01:02:03.456789Z"
+    del sale["seller"]
+    return sale
+
+
+def _trade(i: int) -> dict:
+    return {
+        "id": str(781000000000000000 + i),
+        "accepted_at": "2024-12-06T23:35:14.672965Z",
+        "state": "verified",
+        "contract": {"id": str(780000000000000000 + i), "price": 3000 + i, "state": "sold", "item": _item(i)},
+    }
+
+
+def _order(i: int) -> dict:
+    return {
+        "id": str(790000000000000000 + i),
+        "created_at": "2024-12-06T23:35:14.672965Z",
+        "market_hash_name": "AK-47 | Redline (Field-Tested)",
+        "expression": "",
+        "qty": 1 + i % 3,
+        "price": 2000 + i,
+    }
+
+
+def cases(records: int) -> List[Tuple[str, bytes, Callable, Callable]]:
+    """
+    :return: (эндпоинт, тело ответа, сборка с проверкой, сборка без проверки)
+    """
+    listings = json.dumps([_listing(i) for i in range(records)]).encode()
+    orders = json.dumps([_order(i) for i in range(records)]).encode()
+    similar = json.dumps({"data": [_order(i) for i in range(records)]}).encode()
+    my_orders = json.dumps({"orders": [_order(i) for i in range(records)], "count": records}).encode()
+    trades = json.dumps({"trades": [_trade(i) for i in range(records)], "count": records}).encode()
+    sales = json.dumps([_sale(i) for i in range(records)]).encode()
+
+    return [
+        (
+            "/listings", listings,
+            lambda payload: [Listing(data=item, validate=True) for item in payload],
+            lambda payload: [Listing(data=item, validate=False) for item in payload],
+        ),
+        (
+            "/listings/{id}/buy-orders", orders,
+            lambda payload: [BuyOrders(data=item, validate=True) for item in payload],
+            lambda payload: [BuyOrders(data=item, validate=False) for item in payload],
+        ),
+        (
+            "/buy-orders/similar-orders", similar,
+            build_similar_buy_orders,
+            partial(build_similar_buy_orders, validate=False),
+        ),
+        (
+            "/me/buy-orders", my_orders,
+            build_my_buy_orders,
+            partial(build_my_buy_orders, validate=False),
+        ),
+        (
+            "/me/trades", trades,
+            lambda payload: TradesResponse(data=payload, validate=True),
+            lambda payload: TradesResponse(data=payload, validate=False),
+        ),
+        (
+            "/history/{name}/sales", sales,
+            build_item_sales,
+            partial(build_item_sales, validate=False),
+        ),
+        (
+            "  + sold_at_ts read", sales,
+            lambda payload: [sale.sold_at_ts for sale in build_item_sales(payload)],
+            lambda payload: [sale.sold_at_ts for sale in build_item_sales(payload, validate=False)],
+        ),
+    ]
+
+
+def _best_of(repeat: int, body: bytes, builder: Callable) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        builder(json.loads(body))
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=1000, help="Записей в ответе")
+    parser.add_argument("--repeat", type=int, default=5, help="Повторов, берётся лучший")
+    args = parser.parse_args()
+
+    print(f"{'endpoint':<28}{'KiB':>8}{'decode us/rec':>16}{'validated us/rec':>19}{'trusted us/rec':>17}")
+    for endpoint, body, validated, trusted in cases(args.records):
+        decode = _best_of(args.repeat, body, lambda payload: payload)
+        with_check = _best_of(args.repeat, body, validated)
+        without_check = _best_of(args.repeat, body, trusted)
+        per_record = 1_000_000 / args.records
+        print(
+            f"{endpoint:<28}{len(body) / 1024:>8.0f}{decode * per_record:>16.2f}"
+            f"{with_check * per_record:>19.2f}{without_check * per_record:>17.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
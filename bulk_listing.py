@@ -0,0 +1,327 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+__all__ = (
+    "ListingRequest",
+    "RepriceRequest",
+    "BulkOutcome",
+    "ListingJournal",
+    "create_listings",
+    "reprice_listings",
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ListingRequest:
+    __slots__ = (
+        "_asset_id",
+        "_price",
+        "_type",
+        "_max_offer_discount",
+        "_reserve_price",
+        "_duration_days",
+        "_description",
+        "_private",
+    )
+
+    def __init__(
+            self,
+            asset_id: str,
+            *,
+            price: float,
+            type_: str = "buy_now",
+            max_offer_discount: Optional[int] = None,
+            reserve_price: Optional[float] = None,
+            duration_days: Optional[int] = None,
+            description: str = "",
+            private: bool = False
+    ):
+        """
+        Параметры совпадают с `Client.create_listing`.
+        """
+        self._asset_id = asset_id
+        self._price = price
+        self._type = type_
+        self._max_offer_discount = max_offer_discount
+        self._reserve_price = reserve_price
+        self._duration_days = duration_days
+        self._description = description
+        self._private = private
+
+    @property
+    def asset_id(self) -> str:
+        return self._asset_id
+
+    @property
+    def type(self) -> str:
+        return self._type
+
+    def to_kwargs(self) -> Dict[str, Any]:
+        return {
+            "asset_id": self._asset_id,
+            "price": self._price,
+            "type_": self._type,
+            "max_offer_discount": self._max_offer_discount,
+            "reserve_price": self._reserve_price,
+            "duration_days": self._duration_days,
+            "description": self._description,
+            "private": self._private,
+        }
+
+
+class RepriceRequest:
+    __slots__ = (
+        "_listing_id",
+        "_price",
+        "_max_offer_discount",
+    )
+
+    def __init__(self, listing_id: int, *, price: Optional[int] = None, max_offer_discount: Optional[int] = None):
+        self._listing_id = listing_id
+        self._price = price
+        self._max_offer_discount = max_offer_discount
+
+    @property
+    def listing_id(self) -> int:
+        return self._listing_id
+
+    def to_kwargs(self) -> Dict[str, Any]:
+        return {
+            "listing_id": self._listing_id,
+            "price": self._price,
+            "max_offer_discount": self._max_offer_discount,
+        }
+
+
+class BulkOutcome:
+    __slots__ = (
+        "_key",
+        "_response",
+        "_error",
+        "_from_journal",
+    )
+
+    def __init__(
+            self,
+            key: str,
+            *,
+            response: Optional[dict] = None,
+            error: Optional[str] = None,
+            from_journal: bool = False
+    ):
+        self._key = key
+        self._response = response
+        self._error = error
+        self._from_journal = from_journal
+
+    @property
+    def key(self) -> str:
+        """asset_id для создания, listing_id для изменения цены."""
+        return self._key
+
+    @property
+    def ok(self) -> bool:
+        return self._error is None
+
+    @property
+    def response(self) -> Optional[dict]:
+        return self._response
+
+    @property
+    def error(self) -> Optional[str]:
+        return self._error
+
+    @property
+    def from_journal(self) -> bool:
+        """True, если операция была выполнена в прошлом запуске и взята из журнала."""
+        return self._from_journal
+
+
+class ListingJournal:
+    """
+    Журнал операций в формате JSON Lines. Каждая запись дописывается и
+    сбрасывается на диск до и после запроса, поэтому после падения видно,
+    какие операции завершились, а какие были прерваны на середине.
+    """
+
+    __slots__ = (
+        "_path",
+        "_state",
+        "_file",
+    )
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._state: Dict[str, dict] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                for line in file:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Недописанная строка при падении
+                        continue
+                    self._state[f'{record["op"]}:{record["key"]}'] = record
+        self._file = open(path, "a", encoding="utf-8")
+
+    def last(self, op: str, key: str) -> Optional[dict]:
+        return self._state.get(f"{op}:{key}")
+
+    def record(self, op: str, key: str, status: str, **extra) -> None:
+        record = {"op": op, "key": key, "status": status, **extra}
+        self._state[f"{op}:{key}"] = record
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _reject_duplicates(items: List[tuple], name: str) -> List[tuple]:
+    # Журнал хранит одну запись на ключ: два запроса с одним ключом в пачке затёрли бы друг друга
+    counts: Dict[str, int] = {}
+    for key, _ in items:
+        counts[key] = counts.get(key, 0) + 1
+    return [
+        (key, ValueError(f"duplicate {name} in batch")) if counts[key] > 1 else (key, kwargs)
+        for key, kwargs in items
+    ]
+
+
+async def _run_bulk(
+        client,
+        op: str,
+        items: List[tuple],
+        call,
+        *,
+        journal_path: Optional[str],
+        concurrency: int,
+        retry_interrupted: bool,
+        match_args: bool
+) -> List[BulkOutcome]:
+    """
+    :param items: Пары (key, kwargs) после валидации или (key, ошибка валидации); ключи уникальны
+    :param match_args: Считать операцию из журнала выполненной, только если её аргументы совпадают
+    """
+    journal = ListingJournal(journal_path) if journal_path is not None else None
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(key: str, kwargs) -> BulkOutcome:
+        if isinstance(kwargs, Exception):
+            return BulkOutcome(key, error=f"invalid: {kwargs}")
+
+        previous = journal.last(op, key) if journal is not None else None
+        if previous is not None and match_args and previous.get("args") != kwargs:
+            previous = None
+        if previous is not None:
+            if previous["status"] == "done":
+                return BulkOutcome(key, response=previous.get("response"), from_journal=True)
+            if previous["status"] == "started" and not retry_interrupted:
+                return BulkOutcome(
+                    key, error="interrupted in a previous run, check its state before retrying", from_journal=True
+                )
+
+        async with semaphore:
+            if journal is not None:
+                journal.record(op, key, "started", args=kwargs)
+            try:
+                response = await call(**kwargs)
+            except Exception as error:
+                logger.warning(f"{op} {key} failed: {error}")
+                if journal is not None:
+                    journal.record(op, key, "failed", args=kwargs, error=str(error))
+                return BulkOutcome(key, error=str(error))
+
+            if journal is not None:
+                journal.record(op, key, "done", args=kwargs, response=response)
+            return BulkOutcome(key, response=response)
+
+    owns_session = not client.is_open
+    if owns_session:
+        await client.open()
+    try:
+        return list(await asyncio.gather(*(run_one(key, kwargs) for key, kwargs in items)))
+    finally:
+        if owns_session:
+            await client.close()
+        if journal is not None:
+            journal.close()
+
+
+async def create_listings(
+        client,
+        batch: Iterable[ListingRequest],
+        *,
+        journal_path: Optional[str] = None,
+        concurrency: int = 8,
+        retry_interrupted: bool = False
+) -> List[BulkOutcome]:
+    """
+    Выставляет пачку предметов параллельно в рамках бюджета клиента.
+
+    Все запросы проверяются до отправки первого; невалидные получают ошибку в
+    результате и не отправляются. Это же касается всех запросов с asset_id,
+    который встречается в пачке больше одного раза. С `journal_path` повторный
+    запуск после падения пропускает уже выставленные предметы.
+
+    :param client: Экземпляр `Client`
+    :param batch: Что выставить
+    :param journal_path: Путь к журналу для возобновления
+    :param concurrency: Сколько запросов держать в полёте
+    :param retry_interrupted: Повторять операции, прерванные посередине в прошлом запуске
+        (по умолчанию нет: листинг мог успеть создаться)
+    :return: Результат по каждому asset_id в порядке batch
+    """
+    items = []
+    for request in batch:
+        kwargs = request.to_kwargs()
+        try:
+            client._validate_listing(
+                type_=kwargs["type_"], reserve_price=kwargs["reserve_price"], duration_days=kwargs["duration_days"]
+            )
+        except ValueError as error:
+            items.append((str(request.asset_id), error))
+            continue
+        items.append((str(request.asset_id), kwargs))
+
+    return await _run_bulk(
+        client, "create", _reject_duplicates(items, "asset_id"), client.aio.create_listing,
+        journal_path=journal_path, concurrency=concurrency, retry_interrupted=retry_interrupted, match_args=False,
+    )
+
+
+async def reprice_listings(
+        client,
+        batch: Iterable[RepriceRequest],
+        *,
+        journal_path: Optional[str] = None,
+        concurrency: int = 8
+) -> List[BulkOutcome]:
+    """
+    Меняет цены пачки листингов параллельно. Изменение цены идемпотентно,
+    поэтому прерванные операции повторяются при возобновлении, а выполненные
+    пропускаются, только если в журнале записана та же новая цена. Запросы с
+    listing_id, повторяющимся в пачке, не отправляются.
+
+    :return: Результат по каждому listing_id в порядке batch
+    """
+    items = []
+    for request in batch:
+        kwargs = request.to_kwargs()
+        if kwargs["price"] is None and kwargs["max_offer_discount"] is None:
+            items.append((str(request.listing_id), ValueError("nothing to update")))
+            continue
+        items.append((str(request.listing_id), kwargs))
+
+    return await _run_bulk(
+        client, "reprice", _reject_duplicates(items, "listing_id"), client.aio.update_listing,
+        journal_path=journal_path, concurrency=concurrency, retry_interrupted=True, match_args=True,
+    )
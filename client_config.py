@@ -0,0 +1,130 @@
+import os
+import typing
+from dataclasses import dataclass, fields
+from typing import Dict, Optional, Tuple
+import aiohttp
+from src.csfloat_api.compression import ACCEPT_ENCODING
+
+__all__ = ("API_URL", "ClientConfig")
+
+API_URL = "https://csfloat.com/api/v1"
+
+_TRUE = ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class ClientConfig:
+    """
+    Настройки клиента: куда ходить, сколько держать соединений, таймауты,
+    сжатие, политика бюджета и повторов, размеры кэшей.
+
+    Объект неизменяемый и хешируемый, его можно разделять между клиентами
+    и менять через `dataclasses.replace`:
+
+        config = ClientConfig(pool_size=200, read_timeout=10, retries=2)
+        client = Client(key, config=config)
+        sales = parse_item_by_name(name, config=config)
+    """
+
+    # Куда
+    base_url: str = API_URL
+    verify_ssl: bool = True
+
+    # Пул соединений
+    pool_size: int = 100
+    pool_size_per_host: int = 0
+    keepalive_timeout: float = 15.0
+    dns_cache_ttl: Optional[int] = 10
+
+    # Таймауты в секундах, None - без ограничения
+    connect_timeout: Optional[float] = 10.0
+    read_timeout: Optional[float] = 30.0
+    total_timeout: Optional[float] = 60.0
+
+    # Сжатие ответов: Accept-Encoding gzip (и br, если установлен brotli) и
+    # с какого размера сжатого тела разжимать его в потоке
+    compression: bool = True
+    decompress_in_thread_above: Optional[int] = 256 * 1024
+
+    # Бюджет запросов
+    sync_pause: float = 0.0
+    rate_limit_reserve: int = 0
+
+    # Повторы и дублирование запросов
+    retries: int = 0
+    retry_backoff: float = 0.5
+    hedging: bool = False
+    hedge_quantile: float = 0.95
+
+    # Кэши
+    latency_window: int = 200
+    latency_min_samples: int = 20
+    response_cache_size: int = 10000
+
+    def __post_init__(self) -> None:
+        if self.pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        for name in ("pool_size_per_host", "keepalive_timeout", "sync_pause", "rate_limit_reserve", "retries",
+                     "retry_backoff", "latency_window", "latency_min_samples", "response_cache_size"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must not be negative")
+        for name in ("connect_timeout", "read_timeout", "total_timeout"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive or None")
+        if not 0 < self.hedge_quantile < 1:
+            raise ValueError("hedge_quantile must be between 0 and 1")
+
+    @classmethod
+    def from_env(cls, prefix: str = "CSFLOAT_", environ: Optional[typing.Mapping[str, str]] = None) -> "ClientConfig":
+        """
+        Читает поля из переменных окружения `<prefix><ПОЛЕ>` (например, CSFLOAT_POOL_SIZE=200,
+        CSFLOAT_READ_TIMEOUT=none). Не заданные переменные оставляют значения по умолчанию.
+        """
+        environ = os.environ if environ is None else environ
+        hints = typing.get_type_hints(cls)
+        values = {}
+        for field in fields(cls):
+            raw = environ.get(f"{prefix}{field.name.upper()}")
+            if raw is None:
+                continue
+            kind = hints[field.name]
+            if typing.get_origin(kind) is typing.Union:
+                if raw.strip().lower() in ("", "none"):
+                    values[field.name] = None
+                    continue
+                kind = next(arg for arg in typing.get_args(kind) if arg is not type(None))
+            if kind is bool:
+                values[field.name] = raw.strip().lower() in _TRUE
+            else:
+                values[field.name] = kind(raw)
+        return cls(**values)
+
+    def headers(self, api_key: Optional[str]) -> Dict[str, str]:
+        headers = {}
+        if api_key is not None:
+            headers["Authorization"] = api_key
+        headers["Accept-Encoding"] = ACCEPT_ENCODING if self.compression else "identity"
+        return headers
+
+    def timeout(self) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(
+            total=self.total_timeout, sock_connect=self.connect_timeout, sock_read=self.read_timeout
+        )
+
+    def requests_timeout(self) -> Tuple[Optional[float], Optional[float]]:
+        """Таймаут в форме `requests`: (connect, read)."""
+        return self.connect_timeout, self.read_timeout
+
+    def connector(self, *, limit: Optional[int] = None, keepalive: Optional[float] = None) -> aiohttp.TCPConnector:
+        """
+        :param limit: Лимит соединений вместо `pool_size`
+        :param keepalive: Время жизни простаивающего соединения вместо `keepalive_timeout`
+        """
+        return aiohttp.TCPConnector(
+            limit=self.pool_size if limit is None else limit,
+            limit_per_host=self.pool_size_per_host,
+            keepalive_timeout=self.keepalive_timeout if keepalive is None else keepalive,
+            ttl_dns_cache=self.dns_cache_ttl,
+            ssl=self.verify_ssl,
+        )
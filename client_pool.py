@@ -0,0 +1,151 @@
+import asyncio
+from typing import Iterable, List, Optional
+from src.csfloat_api.client_config import ClientConfig
+from src.csfloat_api.csfloat_client import Client
+from src.csfloat_api.parse_pool import ParsePool
+from src.csfloat_api.scheduler import RequestScheduler
+
+__all__ = ("ACCOUNT_METHODS", "Identity", "ClientPool")
+
+# Вызовы, которые относятся к конкретному аккаунту и должны идти с его ключа
+ACCOUNT_METHODS = frozenset({
+    "get_me",
+    "make_offer",
+    "create_listing",
+    "create_listings",
+    "update_listing",
+    "reprice_listings",
+    "create_buy_order",
+    "delete_buy_order",
+    "get_my_buy_orders",
+    "get_my_trades_by_state",
+    "get_pending_trades",
+})
+
+
+class Identity:
+    __slots__ = (
+        "_api_key",
+        "_proxy",
+    )
+
+    def __init__(self, api_key: str, proxy: Optional[str] = None):
+        self._api_key = api_key
+        self._proxy = proxy
+
+    @property
+    def api_key(self) -> str:
+        return self._api_key
+
+    @property
+    def proxy(self) -> Optional[str]:
+        return self._proxy
+
+
+class ClientPool:
+    """
+    Набор клиентов с разными парами (api_key, proxy).
+
+    Каждый клиент держит свою сессию и свой бюджет из заголовков X-Ratelimit-*.
+    Общие запросы уходят клиенту с наибольшим остатком бюджета, запросы из
+    ACCOUNT_METHODS - только клиентам с ключом владельца.
+
+        async with ClientPool([Identity(key_a), Identity(key_b, proxy)]) as pool:
+            listings = await pool.call("get_all_listings", market_hash_name=name)
+            await pool.call("make_offer", listing_id=1, price=100, api_key=key_a)
+    """
+
+    __slots__ = (
+        "_clients",
+        "_in_flight",
+        "_connection_limit",
+    )
+
+    def __init__(
+            self,
+            identities: Iterable[Identity],
+            *,
+            config: Optional[ClientConfig] = None,
+            base_url: Optional[str] = None,
+            parse_pool: Optional[ParsePool] = None,
+            connection_limit: Optional[int] = None,
+            scheduled: bool = False
+    ) -> None:
+        """
+        :param identities: Пары (api_key, proxy)
+        :param config: Общие настройки клиентов
+        :param base_url: Корень API, например локальный тестовый сервер (вместо `config.base_url`)
+        :param parse_pool: Общий пул процессов для разбора ответов
+        :param connection_limit: Лимит соединений на сессию каждого клиента (вместо `config.pool_size`)
+        :param scheduled: Раздавать слоты бюджета каждого клиента по приоритетам (RequestScheduler)
+        """
+        self._clients: List[Client] = [
+            Client(
+                identity.api_key,
+                config=config,
+                proxy=identity.proxy,
+                base_url=base_url,
+                parse_pool=parse_pool,
+                scheduler=RequestScheduler() if scheduled else None,
+            )
+            for identity in identities
+        ]
+        if not self._clients:
+            raise ValueError("ClientPool needs at least one identity")
+        self._in_flight = {id(client): 0 for client in self._clients}
+        self._connection_limit = connection_limit
+
+    @property
+    def clients(self) -> List[Client]:
+        return list(self._clients)
+
+    async def open(self) -> None:
+        await asyncio.gather(*(client.open(limit=self._connection_limit) for client in self._clients))
+
+    async def close(self) -> None:
+        await asyncio.gather(*(client.close() for client in self._clients))
+
+    async def __aenter__(self) -> "ClientPool":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def pick(self, method: str, *, api_key: Optional[str] = None) -> Client:
+        """
+        Выбирает клиента для вызова.
+
+        :param method: Имя метода `Client`
+        :param api_key: Ключ владельца; обязателен для ACCOUNT_METHODS, если в пуле несколько ключей
+        :return: Клиент с наибольшим остатком бюджета среди подходящих
+        """
+        candidates = self._clients
+        if api_key is not None:
+            candidates = [client for client in self._clients if client.API_KEY == api_key]
+            if not candidates:
+                raise ValueError(f'No identity with the given api_key for "{method}"')
+        elif method in ACCOUNT_METHODS and len({client.API_KEY for client in self._clients}) > 1:
+            raise ValueError(f'"{method}" is account-specific, pass api_key of the owning account')
+
+        # При равном бюджете (например, пока заголовков ещё нет) - наименее загруженный
+        return max(
+            candidates,
+            key=lambda client: (client.rate_budget.available(), -self._in_flight[id(client)])
+        )
+
+    def for_key(self, api_key: str) -> Client:
+        return self.pick("", api_key=api_key)
+
+    async def call(self, method: str, *args, api_key: Optional[str] = None, **kwargs):
+        """
+        :param method: Имя метода `Client`, например "get_all_listings"
+        :param api_key: Ключ владельца для вызовов из ACCOUNT_METHODS
+        :return: Результат метода
+        """
+        client = self.pick(method, api_key=api_key)
+        self._in_flight[id(client)] += 1
+        try:
+            return await getattr(client.aio, method)(*args, **kwargs)
+        finally:
+            self._in_flight[id(client)] -= 1
@@ -0,0 +1,228 @@
+from typing import Any, Dict, Iterable, List, Optional
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+from src.csfloat_api.models.listing import Listing
+from src.csfloat_api.models.history_sale_info import ItemSale
+from src.csfloat_api.models.my_trades_response import Trade
+
+__all__ = (
+    "STICKER_TYPE",
+    "LISTING_SCHEMA",
+    "SALE_SCHEMA",
+    "TRADE_SCHEMA",
+    "listings_to_batch",
+    "sales_to_batch",
+    "trades_to_batch",
+    "ColumnarWriter",
+    "read_arrow",
+    "read_parquet",
+)
+
+STICKER_TYPE = pa.struct([
+    ("name", pa.string()),
+    ("slot", pa.int8()),
+    ("wear", pa.float32()),
+    ("price", pa.int64()),
+])
+
+LISTING_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("created_at", pa.string()),
+    ("type", pa.string()),
+    ("price", pa.int64()),
+    ("state", pa.string()),
+    ("min_offer_price", pa.int64()),
+    ("max_offer_discount", pa.int64()),
+    ("watchers", pa.int32()),
+    ("seller_steam_id", pa.string()),
+    ("predicted_price", pa.int64()),
+    ("asset_id", pa.string()),
+    ("market_hash_name", pa.string()),
+    ("def_index", pa.int32()),
+    ("paint_index", pa.int32()),
+    ("paint_seed", pa.int32()),
+    ("float_value", pa.float64()),
+    ("low_rank", pa.int32()),
+    ("stickers", pa.list_(STICKER_TYPE)),
+])
+
+SALE_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("sold_at", pa.timestamp("s", tz="UTC")),
+    ("type", pa.string()),
+    ("price", pa.int64()),
+    ("predicted_price", pa.int64()),
+    ("asset_id", pa.string()),
+    ("market_hash_name", pa.string()),
+    ("def_index", pa.int32()),
+    ("paint_index", pa.int32()),
+    ("paint_seed", pa.int32()),
+    ("float_value", pa.float64()),
+    ("stickers", pa.list_(STICKER_TYPE)),
+])
+
+TRADE_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("accepted_at", pa.string()),
+    ("state", pa.string()),
+    ("contract_id", pa.string()),
+    ("contract_state", pa.string()),
+    ("price", pa.int64()),
+    ("market_hash_name", pa.string()),
+    ("float_value", pa.float64()),
+    ("stickers", pa.list_(STICKER_TYPE)),
+])
+
+
+def _sticker_row(raw: Dict[str, Any]) -> Dict[str, Any]:
+    price = (raw.get("reference") or {}).get("price")
+    return {
+        "name": raw.get("name"),
+        "slot": raw.get("slot"),
+        "wear": raw.get("wear"),
+        "price": price if isinstance(price, (int, float)) else None,
+    }
+
+
+def _columns(schema: pa.Schema) -> Dict[str, list]:
+    return {name: [] for name in schema.names}
+
+
+def listings_to_batch(listings: Iterable[Listing]) -> pa.RecordBatch:
+    """
+    Собирает листинги в RecordBatch напрямую из сырых данных
+    (Listing.item и Listing.seller создают новые объекты на каждый вызов).
+    """
+    columns = _columns(LISTING_SCHEMA)
+    for listing in listings:
+        item = listing.item_raw or {}
+        seller = listing.seller_raw or {}
+        reference = listing.reference_raw or {}
+        columns["id"].append(listing.id)
+        columns["created_at"].append(listing.created_at)
+        columns["type"].append(listing.type)
+        columns["price"].append(listing.price)
+        columns["state"].append(listing.state)
+        columns["min_offer_price"].append(listing.min_offer_price)
+        columns["max_offer_discount"].append(listing.max_offer_discount)
+        columns["watchers"].append(listing.watchers)
+        columns["seller_steam_id"].append(seller.get("steam_id"))
+        columns["predicted_price"].append(reference.get("predicted_price"))
+        columns["asset_id"].append(item.get("asset_id"))
+        columns["market_hash_name"].append(item.get("market_hash_name"))
+        columns["def_index"].append(item.get("def_index"))
+        columns["paint_index"].append(item.get("paint_index"))
+        columns["paint_seed"].append(item.get("paint_seed"))
+        columns["float_value"].append(item.get("float_value"))
+        columns["low_rank"].append(item.get("low_rank"))
+        columns["stickers"].append([_sticker_row(sticker) for sticker in item.get("stickers") or ()])
+    return pa.RecordBatch.from_pydict(columns, schema=LISTING_SCHEMA)
+
+
+def sales_to_batch(sales: Iterable[ItemSale]) -> pa.RecordBatch:
+    columns = _columns(SALE_SCHEMA)
+    for sale in sales:
+        item = sale.item
+        columns["id"].append(sale.id)
+        columns["sold_at"].append(sale.sold_at_ts)
+        columns["type"].append(sale.type)
+        columns["price"].append(sale.price)
+        columns["predicted_price"].append(sale.reference.predicted_price)
+        columns["asset_id"].append(item.asset_id)
+        columns["market_hash_name"].append(item.market_hash_name)
+        columns["def_index"].append(item.def_index)
+        columns["paint_index"].append(item.paint_index)
+        columns["paint_seed"].append(item.paint_seed)
+        columns["float_value"].append(item.float_value)
+        columns["stickers"].append([_sticker_row(sticker) for sticker in item.stickers_raw or ()])
+    return pa.RecordBatch.from_pydict(columns, schema=SALE_SCHEMA)
+
+
+def trades_to_batch(trades: Iterable[Trade]) -> pa.RecordBatch:
+    columns = _columns(TRADE_SCHEMA)
+    for trade in trades:
+        contract = trade.contract
+        item = contract.item
+        columns["id"].append(trade.id)
+        columns["accepted_at"].append(trade.accepted_at)
+        columns["state"].append(trade.state)
+        columns["contract_id"].append(contract.id)
+        columns["contract_state"].append(contract.state)
+        columns["price"].append(contract.price)
+        columns["market_hash_name"].append(item.market_hash_name)
+        columns["float_value"].append(item.float_value)
+        columns["stickers"].append([
+            {"name": sticker.name, "slot": None, "wear": sticker.wear, "price": sticker.price}
+            for sticker in item.stickers or ()
+        ])
+    return pa.RecordBatch.from_pydict(columns, schema=TRADE_SCHEMA)
+
+
+class ColumnarWriter:
+    """
+    Потоковая запись батчей во время краула.
+
+    Файл `.parquet` пишется через ParquetWriter, любой другой - в формате
+    Arrow IPC, который потом читается через memory map без копирования (`read_arrow`).
+
+        with ColumnarWriter("listings.arrow", LISTING_SCHEMA) as writer:
+            for page in pages:
+                writer.write(listings_to_batch(page))
+    """
+
+    __slots__ = (
+        "_path",
+        "_schema",
+        "_sink",
+        "_writer",
+        "_rows",
+    )
+
+    def __init__(self, path: str, schema: pa.Schema, *, compression: Optional[str] = "zstd") -> None:
+        """
+        :param path: Путь к файлу (.parquet или Arrow IPC)
+        :param schema: Одна из схем модуля
+        :param compression: Сжатие Parquet; для IPC не используется, чтобы чтение оставалось zero-copy
+        """
+        self._path = path
+        self._schema = schema
+        self._rows = 0
+        if path.endswith(".parquet"):
+            self._sink = None
+            self._writer = pq.ParquetWriter(path, schema, compression=compression)
+        else:
+            self._sink = pa.OSFile(path, "wb")
+            self._writer = ipc.new_file(self._sink, schema)
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    def write(self, batch: pa.RecordBatch) -> None:
+        if len(batch):
+            self._writer.write_batch(batch)
+            self._rows += len(batch)
+
+    def close(self) -> None:
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_arrow(path: str) -> pa.Table:
+    """
+    Читает Arrow IPC файл через memory map: колонки ссылаются на страницы файла без копирования.
+    """
+    source = pa.memory_map(path, "r")
+    return ipc.open_file(source).read_all()
+
+
+def read_parquet(path: str, columns: Optional[List[str]] = None) -> pa.Table:
+    return pq.read_table(path, columns=columns, memory_map=True)
@@ -0,0 +1,108 @@
+import zlib
+from typing import Dict, List, Optional
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+__all__ = ("ACCEPT_ENCODING", "CompressionStats", "decompress")
+
+# br только если есть чем его разжать
+ACCEPT_ENCODING = "gzip, br" if brotli is not None else "gzip"
+
+
+def decompress(body: bytes, content_encoding: Optional[str]) -> bytes:
+    """
+    Разжимает тело по заголовку Content-Encoding ("gzip", "br", "deflate",
+    несколько через запятую - в обратном порядке применения).
+
+    :raises ValueError: Неизвестная кодировка или повреждённые данные
+    """
+    if not content_encoding:
+        return body
+    for encoding in reversed(content_encoding.split(",")):
+        encoding = encoding.strip().lower()
+        if encoding in ("", "identity"):
+            continue
+        try:
+            if encoding in ("gzip", "x-gzip"):
+                body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+            elif encoding == "deflate":
+                try:
+                    body = zlib.decompress(body)
+                except zlib.error:
+                    # Часть серверов шлёт deflate без zlib-заголовка
+                    body = zlib.decompress(body, -zlib.MAX_WBITS)
+            elif encoding == "br" and brotli is not None:
+                body = brotli.decompress(body)
+            else:
+                raise ValueError(f'Unsupported Content-Encoding "{encoding}"')
+        except zlib.error as error:
+            raise ValueError(f"Corrupt {encoding} body: {error}") from error
+    return body
+
+
+class _EndpointBytes:
+    __slots__ = ("responses", "wire", "decoded")
+
+    def __init__(self):
+        self.responses = 0
+        self.wire = 0
+        self.decoded = 0
+
+
+class CompressionStats:
+    """
+    Сколько байт ответов пришло по сети и сколько получилось после
+    распаковки, по эндпоинтам.
+    """
+
+    __slots__ = ("_endpoints",)
+
+    def __init__(self) -> None:
+        self._endpoints: Dict[str, _EndpointBytes] = {}
+
+    def record(self, endpoint: str, wire: Optional[int], decoded: int) -> None:
+        """
+        :param wire: Размер тела на проводе (None, если транспорт его не знает - тогда считается равным `decoded`)
+        :param decoded: Размер разжатого тела
+        """
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = _EndpointBytes()
+        stats.responses += 1
+        stats.wire += decoded if wire is None else wire
+        stats.decoded += decoded
+
+    def ratio(self, endpoint: str) -> Optional[float]:
+        """
+        :return: Доля байт на проводе от разжатых (0.1 - сжато в 10 раз) или None, если ответов не было
+        """
+        stats = self._endpoints.get(endpoint)
+        if stats is None or stats.decoded == 0:
+            return None
+        return stats.wire / stats.decoded
+
+    def report(self) -> List[dict]:
+        """
+        :return: Строки (endpoint, responses, wire, decoded, ratio), больше всего трафика сначала
+        """
+        rows = [
+            {
+                "endpoint": endpoint,
+                "responses": stats.responses,
+                "wire": stats.wire,
+                "decoded": stats.decoded,
+                "ratio": stats.wire / stats.decoded if stats.decoded else None,
+            }
+            for endpoint, stats in self._endpoints.items()
+        ]
+        rows.sort(key=lambda row: row["wire"], reverse=True)
+        return rows
+
+    def reset(self) -> None:
+        self._endpoints.clear()
@@ -0,0 +1,97 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+__all__ = (
+    "DeadlineExceeded",
+    "Deadline",
+    "deadline",
+    "current_deadline",
+    "within_deadline",
+    "sleep_within_deadline",
+)
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """Вызов не уложился в заданный дедлайн."""
+
+
+class Deadline:
+    __slots__ = ("_expires_at",)
+
+    def __init__(self, seconds: float):
+        self._expires_at = time.monotonic() + seconds
+
+    @property
+    def expires_at(self) -> float:
+        return self._expires_at
+
+    def remaining(self) -> float:
+        return self._expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("csfloat_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[Deadline]:
+    """
+    Ограничивает по времени все запросы клиента внутри блока, включая ожидание
+    бюджета, повторы и получение соединения. Вложенный дедлайн не может быть
+    позже внешнего.
+
+        with deadline(0.8):
+            await client.aio.make_offer(listing_id=listing_id, price=price)
+    """
+    new = Deadline(seconds)
+    outer = _current_deadline.get()
+    if outer is not None and outer.expires_at < new.expires_at:
+        new = outer
+
+    token = _current_deadline.set(new)
+    try:
+        yield new
+    finally:
+        _current_deadline.reset(token)
+
+
+async def within_deadline(aw: Awaitable[T]) -> T:
+    """
+    Ждёт `aw` не дольше текущего дедлайна, иначе отменяет его и бросает DeadlineExceeded.
+    """
+    current = _current_deadline.get()
+    if current is None:
+        return await aw
+
+    remaining = current.remaining()
+    if remaining <= 0:
+        if asyncio.iscoroutine(aw):
+            aw.close()
+        raise DeadlineExceeded("Deadline exceeded")
+
+    try:
+        return await asyncio.wait_for(aw, timeout=remaining)
+    except asyncio.TimeoutError as error:
+        raise DeadlineExceeded("Deadline exceeded") from error
+
+
+async def sleep_within_deadline(delay: float) -> None:
+    """
+    Спит `delay` секунд; если сон закончится позже дедлайна, сразу бросает DeadlineExceeded.
+    """
+    current = _current_deadline.get()
+    if current is not None and current.remaining() < delay:
+        raise DeadlineExceeded("Deadline exceeded")
+    await asyncio.sleep(delay)
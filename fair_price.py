@@ -0,0 +1,149 @@
+from typing import Dict, Iterable, List, Optional, Sequence
+import numpy as np
+from src.csfloat_api.models.history_sale_info import ItemSale
+from src.csfloat_api.models.listing import Listing
+from src.csfloat_api.analytics import SaleAnalytics, SaleArrays, sticker_value
+
+__all__ = ("FairPriceModel",)
+
+# Колонки коэффициентов: цена = base + float_slope * (float - float_mean) + sticker_factor * стикеры
+_BASE, _FLOAT_SLOPE, _STICKER_FACTOR, _FLOAT_MEAN = range(4)
+
+
+class FairPriceModel:
+    """
+    Оценка справедливой цены по float и стикерам для каждого market_hash_name,
+    обученная на локально сохранённой истории продаж.
+
+    Коэффициенты хранятся одной матрицей float32, поэтому модель на тысячи
+    предметов занимает десятки килобайт и считается пачкой без запросов к API.
+    """
+
+    __slots__ = (
+        "_index",
+        "_coefficients",
+        "_samples",
+    )
+
+    def __init__(self, *, names: Sequence[str], coefficients: np.ndarray, samples: np.ndarray) -> None:
+        self._index: Dict[str, int] = {name: row for row, name in enumerate(names)}
+        self._coefficients = np.asarray(coefficients, dtype=np.float32).reshape(len(names), 4)
+        self._samples = np.asarray(samples, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, market_hash_name: str) -> bool:
+        return market_hash_name in self._index
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._index)
+
+    def samples(self, market_hash_name: str) -> int:
+        row = self._index.get(market_hash_name)
+        return 0 if row is None else int(self._samples[row])
+
+    @staticmethod
+    def _fit_one(arrays: SaleArrays, min_samples: int) -> Optional[np.ndarray]:
+        prices = arrays.price.astype(np.float64)
+        if len(prices) < min_samples:
+            return None
+
+        floats = arrays.float_value
+        has_float = ~np.isnan(floats)
+        float_mean = float(floats[has_float].mean()) if has_float.any() else 0.0
+        deviation = np.where(has_float, floats - float_mean, 0.0)
+        stickers = arrays.sticker_value.astype(np.float64)
+
+        design = np.column_stack((np.ones_like(prices), deviation))
+        sticker_factor = 0.0
+        if np.ptp(stickers) > 0:
+            (_, _, sticker_factor), *_ = np.linalg.lstsq(np.column_stack((design, stickers)), prices, rcond=None)
+            # Стикеры не могут стоить дороже своей цены и не уменьшают цену предмета
+            sticker_factor = min(max(sticker_factor, 0.0), 1.0)
+        (base, float_slope), *_ = np.linalg.lstsq(design, prices - sticker_factor * stickers, rcond=None)
+
+        return np.array((base, float_slope, sticker_factor, float_mean), dtype=np.float32)
+
+    @classmethod
+    def fit(
+            cls,
+            histories: Dict[str, Sequence[ItemSale]],
+            *,
+            min_samples: int = 10,
+            analytics: Optional[SaleAnalytics] = None
+    ) -> "FairPriceModel":
+        """
+        :param histories: market_hash_name -> закешированная история продаж
+        :param min_samples: Минимум продаж для модели предмета
+        :param analytics: SaleAnalytics, чтобы переиспользовать уже построенные массивы
+        :return: Обученная модель (предметы с малым числом продаж пропускаются)
+        """
+        names, rows, samples = [], [], []
+        for name, sales in histories.items():
+            arrays = analytics.arrays(name, sales) if analytics is not None else SaleArrays.from_sales(sales)
+            coefficients = cls._fit_one(arrays, min_samples)
+            if coefficients is None:
+                continue
+            names.append(name)
+            rows.append(coefficients)
+            samples.append(len(arrays))
+
+        coefficients = np.vstack(rows) if rows else np.empty((0, 4), dtype=np.float32)
+        return cls(names=names, coefficients=coefficients, samples=np.asarray(samples, dtype=np.int32))
+
+    def save(self, path: str) -> None:
+        np.savez_compressed(
+            path,
+            names=np.asarray(list(self._index), dtype=str),
+            coefficients=self._coefficients,
+            samples=self._samples,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "FairPriceModel":
+        with np.load(path) as data:
+            return cls(
+                names=data["names"].tolist(),
+                coefficients=data["coefficients"],
+                samples=data["samples"],
+            )
+
+    def estimate_arrays(
+            self, market_hash_names: Sequence[str], float_values: np.ndarray, sticker_values: np.ndarray
+    ) -> np.ndarray:
+        """
+        :return: Справедливые цены в центах; nan для предметов без модели
+        """
+        rows = np.fromiter(
+            (self._index.get(name, -1) for name in market_hash_names),
+            dtype=np.int64,
+            count=len(market_hash_names),
+        )
+        known = rows >= 0
+        if not len(self._coefficients):
+            return np.full(len(rows), np.nan)
+        coefficients = self._coefficients[np.where(known, rows, 0)].astype(np.float64)
+
+        floats = np.asarray(float_values, dtype=np.float64)
+        deviation = np.where(np.isnan(floats), 0.0, floats - coefficients[:, _FLOAT_MEAN])
+        estimate = (
+            coefficients[:, _BASE]
+            + coefficients[:, _FLOAT_SLOPE] * deviation
+            + coefficients[:, _STICKER_FACTOR] * np.asarray(sticker_values, dtype=np.float64)
+        )
+        return np.where(known, estimate, np.nan)
+
+    def estimate(self, listings: Iterable[Listing]) -> np.ndarray:
+        """
+        :param listings: Листинги, например страница `get_all_listings`
+        :return: Справедливые цены в центах в порядке листингов; nan для предметов без модели
+        """
+        names, floats, stickers = [], [], []
+        for listing in listings:
+            item = listing.item
+            names.append(item.market_hash_name)
+            floats.append(np.nan if item.float_value is None else item.float_value)
+            stickers.append(sticker_value(item))
+        return self.estimate_arrays(names, np.asarray(floats), np.asarray(stickers))
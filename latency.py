@@ -0,0 +1,52 @@
+import re
+from collections import deque
+from typing import Deque, Dict, Optional
+
+__all__ = ("endpoint_key", "LatencyTracker")
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_key(parameters: str) -> str:
+    """
+    Приводит путь запроса к ключу эндпоинта: "/listings/123?x=1" -> "/listings/{id}".
+    """
+    path = parameters.split("?", 1)[0]
+    return _ID_SEGMENT.sub("/{id}", path)
+
+
+class LatencyTracker:
+    """
+    Скользящее окно задержек по эндпоинтам для расчёта квантилей (p95 и т.п.).
+    """
+
+    __slots__ = (
+        "_window",
+        "_min_samples",
+        "_samples",
+    )
+
+    def __init__(self, *, window: int = 200, min_samples: int = 20) -> None:
+        """
+        :param window: Сколько последних замеров хранить на эндпоинт
+        :param min_samples: Минимум замеров, после которого квантиль считается надёжным
+        """
+        self._window = window
+        self._min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        samples = self._samples.get(endpoint)
+        if samples is None:
+            samples = self._samples[endpoint] = deque(maxlen=self._window)
+        samples.append(seconds)
+
+    def quantile(self, endpoint: str, q: float) -> Optional[float]:
+        """
+        :return: Квантиль задержки эндпоинта или None, если замеров пока мало
+        """
+        samples = self._samples.get(endpoint)
+        if samples is None or len(samples) < self._min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
@@ -0,0 +1,229 @@
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple, Union
+from urllib.parse import quote, urlencode
+
+__all__ = (
+    "CATEGORIES",
+    "LISTING_TYPES",
+    "MAX_PAGE_LIMIT",
+    "SORT_BY",
+    "ListingQuery",
+    "listing_query",
+    "validate_category",
+    "validate_sort_by",
+    "validate_type",
+)
+
+SORT_BY = frozenset({
+    'lowest_price', 'highest_price', 'most_recent', 'expires_soon',
+    'lowest_float', 'highest_float', 'best_deal', 'highest_discount',
+    'float_rank', 'num_bids',
+})
+# 0 = любые, 1 = обычные, 2 = StatTrak, 3 = сувенирные
+CATEGORIES = frozenset({0, 1, 2, 3})
+LISTING_TYPES = frozenset({'buy_now', 'auction'})
+MAX_PAGE_LIMIT = 50
+
+# Необязательные фильтры в порядке, в котором они идут в URL
+_FILTERS = (
+    "min_price",
+    "max_price",
+    "def_index",
+    "min_float",
+    "max_float",
+    "rarity",
+    "paint_seed",
+    "paint_index",
+    "user_id",
+    "collection",
+    "market_hash_name",
+)
+
+
+def validate_sort_by(sort_by: str) -> None:
+    if sort_by not in SORT_BY:
+        raise ValueError(f'Unknown sort_by parameter "{sort_by}"')
+
+
+def validate_category(category: int) -> None:
+    if category not in CATEGORIES:
+        raise ValueError(f'Unknown category parameter "{category}"')
+
+
+def validate_type(type_: str) -> None:
+    if type_ not in LISTING_TYPES:
+        raise ValueError(f'Unknown type parameter "{type_}"')
+
+
+class ListingQuery:
+    """
+    Неизменяемый набор фильтров `/listings`.
+
+    Параметры проверяются и кодируются в URL один раз при создании, объект
+    хешируется (годится как ключ кэша или склейки запросов, если значения
+    фильтров хешируемые), а страницы того же запроса получаются без повторной
+    проверки и кодирования:
+
+        query = ListingQuery(market_hash_name="AK-47 | Redline (Field-Tested)", sort_by="lowest_price")
+        first = client.get_all_listings(query=query)
+        second = client.get_all_listings(query=query.with_page(1))
+    """
+
+    __slots__ = (
+        "_key",
+        "_page",
+        "_limit",
+        "_encoded",
+        "_path",
+        "_hash",
+    )
+
+    def __init__(
+            self,
+            *,
+            min_price: Optional[int] = None,
+            max_price: Optional[int] = None,
+            page: int = 0,
+            limit: int = MAX_PAGE_LIMIT,
+            sort_by: str = 'best_deal',
+            category: int = 0,
+            def_index: Optional[Union[int, Iterable[int]]] = None,
+            min_float: Optional[float] = None,
+            max_float: Optional[float] = None,
+            rarity: Optional[str] = None,
+            paint_seed: Optional[int] = None,
+            paint_index: Optional[int] = None,
+            user_id: Optional[str] = None,
+            collection: Optional[str] = None,
+            market_hash_name: Optional[str] = None,
+            type_: str = 'buy_now'
+    ) -> None:
+        """
+        Параметры те же, что у `Client.get_all_listings`.
+
+        :raises ValueError: Неизвестные sort_by/category/type_ или limit вне 1..50
+        """
+        validate_category(category)
+        validate_sort_by(sort_by)
+        validate_type(type_)
+        if not 1 <= limit <= MAX_PAGE_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_LIMIT}")
+        if page < 0:
+            raise ValueError("page must not be negative")
+        if def_index is not None and not isinstance(def_index, int):
+            def_index = tuple(def_index)
+
+        values = {
+            "min_price": min_price,
+            "max_price": max_price,
+            "def_index": def_index,
+            "min_float": min_float,
+            "max_float": max_float,
+            "rarity": rarity,
+            "paint_seed": paint_seed,
+            "paint_index": paint_index,
+            "user_id": user_id,
+            "collection": collection,
+            "market_hash_name": market_hash_name,
+        }
+        filters = tuple((name, values[name]) for name in _FILTERS if values[name] is not None)
+
+        pairs = [("sort_by", sort_by), ("category", category), ("type", type_)]
+        for name, value in filters:
+            if name == "def_index" and isinstance(value, tuple):
+                value = ",".join(map(str, value))
+            pairs.append((name, value))
+
+        # Всё, кроме номера страницы: общая часть для всех страниц запроса
+        self._key = (sort_by, category, type_) + filters
+        self._limit = limit
+        self._encoded = urlencode(pairs, quote_via=quote, safe=",")
+        self._set_page(page)
+
+    def _set_page(self, page: int) -> None:
+        self._page = page
+        self._path = f"/listings?page={page}&limit={self._limit}&{self._encoded}"
+        # Хеш считается при первом обращении: с нехешируемым значением фильтра запрос
+        # всё равно можно собрать и отправить, он только не годится как ключ
+        self._hash: Optional[int] = None
+
+    @property
+    def page(self) -> int:
+        return self._page
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def sort_by(self) -> str:
+        return self._key[0]
+
+    @property
+    def category(self) -> int:
+        return self._key[1]
+
+    @property
+    def type(self) -> str:
+        return self._key[2]
+
+    @property
+    def filters(self) -> Tuple[Tuple[str, object], ...]:
+        """Заданные необязательные фильтры, (имя, значение)."""
+        return self._key[3:]
+
+    @property
+    def path(self) -> str:
+        """Путь с закодированной строкой запроса, например "/listings?page=0&limit=50&sort_by=..."."""
+        return self._path
+
+    def with_page(self, page: int) -> "ListingQuery":
+        """
+        Тот же запрос с другой страницей, без повторной проверки и кодирования.
+        """
+        if page == self._page:
+            return self
+        if page < 0:
+            raise ValueError("page must not be negative")
+        query = object.__new__(ListingQuery)
+        query._key = self._key
+        query._limit = self._limit
+        query._encoded = self._encoded
+        query._set_page(page)
+        return query
+
+    def next_page(self) -> "ListingQuery":
+        return self.with_page(self._page + 1)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ListingQuery):
+            return NotImplemented
+        return self._page == other._page and self._limit == other._limit and self._key == other._key
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((self._key, self._limit, self._page))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"ListingQuery({self._path!r})"
+
+
+@lru_cache(maxsize=1024)
+def _cached_query(**kwargs) -> ListingQuery:
+    return ListingQuery(**kwargs)
+
+
+def listing_query(**kwargs) -> ListingQuery:
+    """
+    `ListingQuery(**kwargs)` из кэша последних запросов: повторные вызовы с теми
+    же фильтрами не проверяют и не кодируют их заново.
+    """
+    def_index = kwargs.get("def_index")
+    if def_index is not None and not isinstance(def_index, (int, tuple)):
+        kwargs["def_index"] = tuple(def_index)
+    try:
+        return _cached_query(**kwargs)
+    except TypeError:
+        # Нехешируемое значение фильтра - собрать без кэша
+        return ListingQuery(**kwargs)
@@ -1,7 +1,8 @@
 from typing import Dict, Any, Optional
+from .base import Model
 
 
-class TopBid:
+class TopBid(Model):
     __slots__ = (
         "_id",
         "_created_at",
@@ -12,7 +13,19 @@ class TopBid:
         "_obfuscated_buyer_id"
     )
 
-    def __init__(self, *, data: Dict[str, Any]):
+    _SCHEMA = {
+        "id": ((str,), False),
+        "created_at": ((str,), False),
+        "price": ((int,), False),
+        "contract_id": ((str,), False),
+        "state": ((str,), False),
+        "active": ((bool,), False),
+        "obfuscated_buyer_id": ((str,), False),
+    }
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
         self._id = data.get("id")
         self._created_at = data.get("created_at")
         self._price = data.get("price")
@@ -46,7 +59,7 @@ class TopBid:
         return self._obfuscated_buyer_id
 
 
-class AuctionDetails:
+class AuctionDetails(Model):
     __slots__ = (
         "_reserve_price",
         "_top_bid",
@@ -54,7 +67,17 @@ class AuctionDetails:
         "_min_next_bid",
     )
 
-    def __init__(self, *, data: Dict[str, Any]):
+    _SCHEMA = {
+        "reserve_price": ((int, float,), False),
+        "top_bid": ((dict,), False),
+        "expires_at": ((str,), False),
+        "min_next_bid": ((int, float,), False),
+    }
+    _NESTED = {"top_bid": TopBid}
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
         self._reserve_price = data.get("reserve_price")
         self._top_bid = data.get("top_bid")
         self._expires_at = data.get("expires_at")
@@ -66,7 +89,8 @@ class AuctionDetails:
 
     @property
     def top_bid(self) -> Optional[TopBid]:
-        return TopBid(data=self._top_bid)
+        if self._top_bid is not None:
+            return TopBid(data=self._top_bid)
 
     @property
     def expires_at(self) -> Optional[str]:
@@ -0,0 +1,74 @@
+import re
+from datetime import datetime
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+__all__ = ("ValidationError", "Model", "parse_datetime")
+
+_FRACTION = re.compile(r"\.(\d+)")
+
+
+class ValidationError(ValueError):
+    """Данные не соответствуют схеме модели."""
+
+
+def parse_datetime(value) -> Optional[datetime]:
+    """
+    Разбирает ISO-8601 из ответа API ("2024-12-06T23:35:14.672965Z").
+    """
+    if value is None or isinstance(value, datetime):
+        return value
+    value = value.replace("Z", "+00:00")
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # До Python 3.11 fromisoformat понимает только 3 или 6 знаков после запятой
+        return datetime.fromisoformat(_FRACTION.sub(lambda match: "." + match.group(1)[:6].ljust(6, "0"), value))
+
+
+class Model:
+    """
+    Общая основа моделей: поля хранятся в `__slots__`, конструктор принимает
+    сырой словарь ответа API (`Model(data=...)`), проверка по схеме необязательна.
+
+    `_SCHEMA` - поле -> (допустимые типы, обязательно ли), `_NESTED` - поле ->
+    модель вложенного объекта или списка объектов. `_VALIDATE` - проверять ли
+    данные, если `validate` не передан явно.
+    """
+
+    __slots__ = ()
+
+    _SCHEMA: Dict[str, Tuple[tuple, bool]] = {}
+    _NESTED: Dict[str, type] = {}
+    _VALIDATE = False
+
+    @classmethod
+    def validate(cls, data: Mapping[str, Any]) -> None:
+        """
+        :raises ValidationError: Нет обязательного поля или у поля неверный тип
+        """
+        if not isinstance(data, Mapping):
+            raise ValidationError(f"{cls.__name__}: expected an object, got {type(data).__name__}")
+        for name, (types, required) in cls._SCHEMA.items():
+            value = data.get(name)
+            if value is None:
+                if required:
+                    raise ValidationError(f"{cls.__name__}.{name}: field required")
+                continue
+            if not isinstance(value, types):
+                raise ValidationError(
+                    f"{cls.__name__}.{name}: expected {'/'.join(t.__name__ for t in types)}, "
+                    f"got {type(value).__name__}"
+                )
+        for name, model in cls._NESTED.items():
+            value = data.get(name)
+            if value is None:
+                continue
+            if isinstance(value, list):
+                for element in value:
+                    model.validate(element)
+            else:
+                model.validate(value)
+
+    @classmethod
+    def _should_validate(cls, validate: Optional[bool]) -> bool:
+        return cls._VALIDATE if validate is None else validate
@@ -1,6 +1,7 @@
 from typing import Optional, Dict, Any
+from .base import Model
 
-class BuyOrders:
+class BuyOrders(Model):
     __slots__ = (
         "_id",
         "_created_at",
@@ -9,7 +10,17 @@ class BuyOrders:
         "_price"
     )
 
-    def __init__(self, *, data: Dict[str, Any]):
+    _SCHEMA = {
+        "id": ((str,), False),
+        "created_at": ((str,), False),
+        "expression": ((str,), False),
+        "qty": ((int,), False),
+        "price": ((int,), False),
+    }
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
         self._id = data.get("id")
         self._created_at = data.get("created_at")
         self._expression = data.get("expression")
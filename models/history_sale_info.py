@@ -1,73 +1,120 @@
-from pydantic import BaseModel
-from typing import Optional, List, Union
+from typing import Dict, Any, Optional
 from datetime import datetime
+from .base import Model, ValidationError, parse_datetime
+from .item import Item
+from .reference import Reference
 
 
-class Reference(BaseModel):
-    base_price: int
-    float_factor: float
-    predicted_price: int
-    quantity: int
-    last_updated: datetime
-
-class Sticker(BaseModel):
-    stickerId: int
-    slot: int
-    icon_url: str
-    name: str
-    reference: Optional[dict] = None
-
-class Item(BaseModel):
-    asset_id: str
-    def_index: int
-    paint_index: Optional[int] = None
-    paint_seed: Optional[int] = None
-    float_value: Optional[float] = None
-    icon_url: str
-    d_param: Optional[str] = None
-    is_stattrak: Optional[bool] = None
-    is_souvenir: Optional[bool] = None
-    rarity: int
-    quality: Optional[int] = None
-    market_hash_name: str
-    stickers: Optional[List[Sticker]] = None
-    tradable: int
-    inspect_link: Optional[str] = None
-    has_screenshot: bool
-    cs2_screenshot_id: Optional[str] = None
-    cs2_screenshot_at: Optional[datetime] = None
-    is_commodity: bool
-    type: str
-    rarity_name: str
-    type_name: str
-    item_name: str
-    wear_name: Optional[str] = None
-    description: Optional[str] = None
-    collection: Optional[str] = None 
-    serialized_inspect: Optional[str] = None
-    gs_sig: Optional[str] = None
-
-class ItemSale(BaseModel):
-    id: str
-    created_at: datetime
-    type: str
-    price: int
-    state: str
-    reference: Union[Reference, dict]
-    item: Item
-    is_seller: bool
-    is_watchlisted: bool
-    watchers: int
-    sold_at: datetime
+class ItemSale(Model):
+    __slots__ = (
+        "_id",
+        "_created_at",
+        "_type",
+        "_price",
+        "_state",
+        "_reference",
+        "_item",
+        "_is_seller",
+        "_is_watchlisted",
+        "_watchers",
+        "_sold_at"
+    )
+
+    _SCHEMA = {
+        "id": ((str,), True),
+        "created_at": ((str,), True),
+        "type": ((str,), True),
+        "price": ((int,), True),
+        "state": ((str,), True),
+        "reference": ((dict,), True),
+        "item": ((dict,), True),
+        "is_seller": ((bool,), True),
+        "is_watchlisted": ((bool,), True),
+        "watchers": ((int,), True),
+        "sold_at": ((str,), True),
+    }
+    _NESTED = {"reference": Reference, "item": Item}
+    _VALIDATE = True
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        """
+        :param data: Продажа из `/history/{market_hash_name}/sales`
+        :param validate: Проверять данные по схеме (по умолчанию да). Без проверки
+            created_at/sold_at разбираются только при первом обращении
+        """
+        if self._should_validate(validate):
+            self.validate(data)
+            try:
+                self._created_at = parse_datetime(data["created_at"])
+                self._sold_at = parse_datetime(data["sold_at"])
+            except ValueError as error:
+                raise ValidationError(f"ItemSale: {error}") from error
+        else:
+            # Строка, пока к полю не обратились
+            self._created_at = data.get("created_at")
+            self._sold_at = data.get("sold_at")
+        self._id = data.get("id")
+        self._type = data.get("type")
+        self._price = data.get("price")
+        self._state = data.get("state")
+        self._reference = Reference(data=data.get("reference") or {}, validate=False)
+        self._item = Item(data=data.get("item") or {}, validate=False)
+        self._is_seller = data.get("is_seller")
+        self._is_watchlisted = data.get("is_watchlisted")
+        self._watchers = data.get("watchers")
 
     @property
-    def sold_at_ts(self) -> int:
-        return int(self.sold_at.timestamp())
-    
+    def id(self) -> Optional[str]:
+        return self._id
+
     @property
-    def price_normal(self) -> float:
-        return round(self.price / 100, 2)
+    def created_at(self) -> Optional[datetime]:
+        if isinstance(self._created_at, str):
+            self._created_at = parse_datetime(self._created_at)
+        return self._created_at
+
+    @property
+    def type(self) -> Optional[str]:
+        return self._type
+
+    @property
+    def price(self) -> Optional[int]:
+        return self._price
+
+    @property
+    def state(self) -> Optional[str]:
+        return self._state
+
+    @property
+    def reference(self) -> Reference:
+        return self._reference
 
+    @property
+    def item(self) -> Item:
+        return self._item
+
+    @property
+    def is_seller(self) -> Optional[bool]:
+        return self._is_seller
+
+    @property
+    def is_watchlisted(self) -> Optional[bool]:
+        return self._is_watchlisted
+
+    @property
+    def watchers(self) -> Optional[int]:
+        return self._watchers
 
+    @property
+    def sold_at(self) -> Optional[datetime]:
+        if isinstance(self._sold_at, str):
+            self._sold_at = parse_datetime(self._sold_at)
+        return self._sold_at
 
-    
\ No newline at end of file
+    @property
+    def sold_at_ts(self) -> int:
+        return int(self.sold_at.timestamp())
+
+    @property
+    def price_normal(self) -> float:
+        return round(self._price / 100, 2)
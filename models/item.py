@@ -1,8 +1,9 @@
 from typing import Dict, Any, List, Optional
+from .base import Model
 from .stickers import Sticker
 
 
-class Item:
+class Item(Model):
     __slots__ = (
         "_asset_id",
         "_def_index",
@@ -36,7 +37,44 @@ class Item:
         "_gs_sig"
     )
 
-    def __init__(self, *, data: Dict[str, Any]):
+    # Обязательно только то, что есть в предмете у всех эндпоинтов (включая трейды)
+    _SCHEMA = {
+        "asset_id": ((str,), False),
+        "def_index": ((int,), False),
+        "paint_index": ((int,), False),
+        "paint_seed": ((int,), False),
+        "float_value": ((int, float), False),
+        "icon_url": ((str,), False),
+        "d_param": ((str,), False),
+        "is_stattrak": ((bool,), False),
+        "is_souvenir": ((bool,), False),
+        "rarity": ((int,), False),
+        "quality": ((int,), False),
+        "market_hash_name": ((str,), True),
+        "low_rank": ((int,), False),
+        "stickers": ((list,), False),
+        "tradable": ((int,), False),
+        "inspect_link": ((str,), False),
+        "has_screenshot": ((bool,), False),
+        "cs2_screenshot_id": ((str,), False),
+        "cs2_screenshot_at": ((str,), False),
+        "is_commodity": ((bool,), False),
+        "type": ((str,), False),
+        "rarity_name": ((str,), False),
+        "type_name": ((str,), False),
+        "item_name": ((str,), False),
+        "wear_name": ((str,), False),
+        "description": ((str,), False),
+        "collection": ((str,), False),
+        "badges": ((list,), False),
+        "serialized_inspect": ((str,), False),
+        "gs_sig": ((str,), False),
+    }
+    _NESTED = {"stickers": Sticker}
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
         self._asset_id = data.get("asset_id")
         self._def_index = data.get("def_index")
         self._paint_index = data.get("paint_index")
@@ -59,7 +97,7 @@ class Item:
         self._is_commodity = data.get("is_commodity")
         self._type = data.get("type")
         self._rarity_name = data.get("rarity_name")
-        self._type_name = data.get("rarity_name")
+        self._type_name = data.get("type_name")
         self._item_name = data.get("item_name")
         self._wear_name = data.get("wear_name")
         self._description = data.get("description")
@@ -123,7 +161,19 @@ class Item:
     @property
     def stickers(self) -> Optional[List[Sticker]]:
         if self._stickers is not None:
-            return [Sticker(data=sticker) for sticker in self._stickers]
+            return [Sticker(data=sticker, validate=False) for sticker in self._stickers]
+
+    @property
+    def stickers_raw(self) -> Optional[List[Dict[str, Any]]]:
+        """Наклейки из ответа API как есть, без создания `Sticker`."""
+        return self._stickers
+
+    @property
+    def total_sticker_price(self) -> float:
+        """Сумма цен наклеек в долларах (0, если наклеек нет)."""
+        if not self._stickers:
+            return 0.0
+        return sum(sticker.normal_price for sticker in self.stickers)
 
     @property
     def tradable(self) -> Optional[bool]:
@@ -1,11 +1,12 @@
 from typing import Dict, Any, Optional
+from .base import Model
 from .seller import Seller
 from .reference import Reference
 from .item import Item
 from .auction import AuctionDetails
 
 
-class Listing:
+class Listing(Model):
 
     __slots__ = (
         "_id",
@@ -23,10 +24,33 @@ class Listing:
         "_is_watchlisted",
         "_watchers",
         "_auction_details",
-        "_sold_at"
+        "_sold_at",
+        "_seller_model"
     )
 
-    def __init__(self, *, data: Dict[str, Any]) -> None:
+    _SCHEMA = {
+        "id": ((str,), True),
+        "created_at": ((str,), False),
+        "type": ((str,), False),
+        "price": ((int,), False),
+        "description": ((str,), False),
+        "state": ((str,), False),
+        "seller": ((dict,), False),
+        "reference": ((dict,), False),
+        "item": ((dict,), False),
+        "is_seller": ((bool,), False),
+        "min_offer_price": ((int,), False),
+        "max_offer_discount": ((int,), False),
+        "is_watchlisted": ((bool,), False),
+        "watchers": ((int,), False),
+        "auction_details": ((dict,), False),
+        "sold_at": ((str,), False),
+    }
+    _NESTED = {"seller": Seller, "reference": Reference, "item": Item, "auction_details": AuctionDetails}
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None) -> None:
+        if self._should_validate(validate):
+            self.validate(data)
         self._id = data.get("id")
         self._created_at = data.get("created_at")
         self._type = data.get("type")
@@ -43,6 +67,8 @@ class Listing:
         self._watchers = data.get("watchers")
         self._auction_details = data.get("auction_details")
         self._sold_at = data.get("sold_at")
+        # Общий объект продавца из SellerCache.attach
+        self._seller_model: Optional[Seller] = None
 
     @property
     def id(self) -> Optional[int]:
@@ -70,16 +96,32 @@ class Listing:
 
     @property
     def seller(self) -> Optional[Seller]:
+        if self._seller_model is not None:
+            return self._seller_model
         return Seller(data=self._seller)
 
+    @property
+    def seller_raw(self) -> Optional[Dict[str, Any]]:
+        """Объект продавца из ответа API как есть, без создания `Seller`."""
+        return self._seller
+
     @property
     def reference(self) -> Optional[Reference]:
         return Reference(data=self._reference)
 
+    @property
+    def reference_raw(self) -> Optional[Dict[str, Any]]:
+        return self._reference
+
     @property
     def item(self) -> Optional[Item]:
         return Item(data=self._item)
 
+    @property
+    def item_raw(self) -> Optional[Dict[str, Any]]:
+        """Объект предмета из ответа API как есть, без создания `Item`."""
+        return self._item
+
     @property
     def is_seller(self) -> Optional[bool]:
         return self._is_seller
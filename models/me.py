@@ -1,53 +1,5 @@
 from typing import Optional, Dict, Any
-
-
-class Statistics:
-    __slots__ = (
-        "_total_sales",
-        "_total_purchases",
-        "_median_trade_time",
-        "_total_avoided_trades",
-        "_total_failed_trades",
-        "_total_verified_trades",
-        "_total_trades"
-    )
-
-    def __init__(self, *, data: Dict[str, Any]):
-        self._total_sales = data.get("total_sales")
-        self._total_purchases = data.get("total_purchases")
-        self._median_trade_time = data.get("median_trade_time")
-        self._total_avoided_trades = data.get("total_avoided_trades")
-        self._total_failed_trades = data.get("total_failed_trades")
-        self._total_verified_trades = data.get("total_verified_trades")
-        self._total_trades = data.get("total_trades")
-
-    @property
-    def total_sales(self) -> Optional[int]:
-        return self._total_sales
-
-    @property
-    def total_purchases(self) -> Optional[int]:
-        return self._total_purchases
-
-    @property
-    def median_trade_time(self) -> Optional[int]:
-        return self._median_trade_time
-
-    @property
-    def total_avoided_trades(self) -> Optional[int]:
-        return self._total_avoided_trades
-
-    @property
-    def total_failed_trades(self) -> Optional[int]:
-        return self._total_failed_trades
-
-    @property
-    def total_verified_trades(self) -> Optional[int]:
-        return self._total_verified_trades
-
-    @property
-    def total_trades(self) -> Optional[int]:
-        return self._total_trades
+from .statistics import Statistics
 
 
 class Preferences:
@@ -1,17 +1,82 @@
-from pydantic import BaseModel
-from typing import List
+from typing import Dict, Any, List, Optional
+from .base import Model
 
-class BuyOrder(BaseModel):
-    id: str
-    created_at: str  # можно использовать datetime, если требуется преобразование
-    market_hash_name: str
-    qty: int
-    price: int
+
+class BuyOrder(Model):
+    __slots__ = (
+        "_id",
+        "_created_at",
+        "_market_hash_name",
+        "_qty",
+        "_price"
+    )
+
+    _SCHEMA = {
+        "id": ((str,), True),
+        "created_at": ((str,), True),
+        "market_hash_name": ((str,), True),
+        "qty": ((int,), True),
+        "price": ((int,), True),
+    }
+    _VALIDATE = True
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
+        self._id = data.get("id")
+        self._created_at = data.get("created_at")
+        self._market_hash_name = data.get("market_hash_name")
+        self._qty = data.get("qty")
+        self._price = data.get("price")
+
+    @property
+    def id(self) -> Optional[str]:
+        return self._id
+
+    @property
+    def created_at(self) -> Optional[str]:
+        return self._created_at
+
+    @property
+    def market_hash_name(self) -> Optional[str]:
+        return self._market_hash_name
+
+    @property
+    def qty(self) -> Optional[int]:
+        return self._qty
+
+    @property
+    def price(self) -> Optional[int]:
+        return self._price
 
     @property
     def human_price(self) -> float:
-        return float(self.price / 100)
+        return float(self._price / 100)
+
+
+class MyBuyOrdersResponse(Model):
+    __slots__ = (
+        "_orders",
+        "_count"
+    )
 
-class MyBuyOrdersResponse(BaseModel):
-    orders: List[BuyOrder]
-    count: int
\ No newline at end of file
+    _SCHEMA = {
+        "orders": ((list,), True),
+        "count": ((int,), True),
+    }
+    _NESTED = {"orders": BuyOrder}
+    _VALIDATE = True
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
+        self._orders = [BuyOrder(data=order, validate=False) for order in data.get("orders") or ()]
+        self._count = data.get("count")
+
+    @property
+    def orders(self) -> List[BuyOrder]:
+        return self._orders
+
+    @property
+    def count(self) -> Optional[int]:
+        return self._count
@@ -1,98 +1,134 @@
-from typing import List, Optional
-from pydantic import BaseModel
-
-class Sticker(BaseModel):
-    name: str
-    price: Optional[float]  # Цена в `reference.price`
-    wear: float = 0.0       # По умолчанию 0, если не указано
+from typing import Dict, Any, List, Optional
+from .base import Model
+from .item import Item
+
+
+class Contract(Model):
+    __slots__ = (
+        "_id",
+        "_price",
+        "_state",
+        "_item"
+    )
+
+    _SCHEMA = {
+        "id": ((str,), True),
+        "price": ((int,), True),
+        "state": ((str,), True),
+        "item": ((dict,), True),
+    }
+    _NESTED = {"item": Item}
+    _VALIDATE = True
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
+        self._id = data.get("id")
+        self._price = data.get("price")
+        self._state = data.get("state")
+        self._item = Item(data=data.get("item") or {}, validate=False)
 
     @classmethod
-    def from_raw(cls, raw: dict):
-        return cls(
-            name=raw.get("name"),
-            price=raw.get("reference", {}).get("price"),
-            wear=raw.get("wear", 0.0)
-        )
-    
+    def from_raw(cls, raw: dict, *, validate: Optional[bool] = None) -> "Contract":
+        return cls(data=raw, validate=validate)
+
+    @property
+    def id(self) -> Optional[str]:
+        return self._id
+
+    @property
+    def price(self) -> Optional[int]:
+        return self._price
+
+    @property
+    def state(self) -> Optional[str]:
+        return self._state
+
+    @property
+    def item(self) -> Item:
+        return self._item
+
     @property
     def normal_price(self) -> float:
-        # Если цена существует, нормализуем её; если нет, возвращаем 0.0
-        return round(self.price / 100, 2) if self.price is not None else 0.0
-    
-
-    def dict(self, *args, **kwargs):
-        data = super().dict(*args, **kwargs)
-        # Заменяем 'price' на 'normal_price' в итоговом словаре
-        data['normal_price'] = self.normal_price
-        # Убираем поле 'price', если оно не требуется
-        del data['price']
-        return data
-
-class Item(BaseModel):
-    float_value: Optional[float]
-    market_hash_name: str
-    stickers: Optional[List[Sticker]]
+        return round(self._price / 100, 2)
+
+
+class Trade(Model):
+    __slots__ = (
+        "_id",
+        "_contract",
+        "_accepted_at",
+        "_state"
+    )
+
+    _SCHEMA = {
+        "id": ((str,), True),
+        "contract": ((dict,), True),
+        "accepted_at": ((str,), True),  # 2024-12-06T23:35:14.672965Z
+        "state": ((str,), True),  # verified / failed / canceled
+    }
+    _NESTED = {"contract": Contract}
+    _VALIDATE = True
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
+        self._id = data.get("id")
+        self._contract = Contract(data=data.get("contract") or {}, validate=False)
+        self._accepted_at = data.get("accepted_at")
+        self._state = data.get("state")
 
     @classmethod
-    def from_raw(cls, raw: dict):
-        stickers = raw.get("stickers")
-        return cls(
-            float_value=raw.get("float_value"),
-            market_hash_name=raw.get("market_hash_name"),
-            stickers=[Sticker.from_raw(sticker) for sticker in stickers] if stickers else None
-        )
-    
+    def from_raw(cls, raw: dict, *, validate: Optional[bool] = None) -> "Trade":
+        return cls(data=raw, validate=validate)
+
     @property
-    def total_sticker_price(self) -> float:
-        # Возвращаем сумму всех нормализованных цен наклеек или 0, если их нет
-        if self.stickers:
-            return sum(sticker.normal_price for sticker in self.stickers)
-        return 0.0
-
-class Contract(BaseModel):
-    id: str
-    price: int
-    state: str
-    item: Item
+    def id(self) -> Optional[str]:
+        return self._id
 
-    @classmethod
-    def from_raw(cls, raw: dict):
-        return cls(
-            id=raw["id"],
-            price=raw["price"],
-            state=raw["state"],
-            item=Item.from_raw(raw["item"])
-        )
-    
     @property
-    def normal_price(self) -> float:
-        return round(self.price / 100, 2)
+    def contract(self) -> Contract:
+        return self._contract
 
-class Trade(BaseModel):
-    id: str
-    contract: Contract
-    accepted_at: str  # 2024-12-06T23:35:14.672965Z
-    state: str  # verified / failed / canceled
+    @property
+    def accepted_at(self) -> Optional[str]:
+        return self._accepted_at
 
-    @classmethod
-    def from_raw(cls, raw: dict):
-        return cls(
-            id=raw["id"],
-            contract=Contract.from_raw(raw["contract"]),
-            accepted_at=raw["accepted_at"],
-            state=raw["state"]
-        )
-
-class TradesResponse(BaseModel):
-    trades: List[Trade]
-    count: int
+    @property
+    def state(self) -> Optional[str]:
+        return self._state
+
+
+class TradesResponse(Model):
+    __slots__ = (
+        "_trades",
+        "_count"
+    )
+
+    _SCHEMA = {
+        "trades": ((list,), False),
+        "count": ((int,), True),
+    }
+    _NESTED = {"trades": Trade}
+    _VALIDATE = True
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
+        self._trades = [Trade(data=trade, validate=False) for trade in data.get("trades") or ()]
+        self._count = data.get("count")
 
     @classmethod
-    def from_raw(cls, raw: dict):
-        return cls(
-            trades=[Trade.from_raw(trade) for trade in raw.get("trades", [])],
-            count=raw["count"]
-        )
+    def from_raw(cls, raw: dict, *, validate: Optional[bool] = None) -> "TradesResponse":
+        return cls(data=raw, validate=validate)
+
+    @property
+    def trades(self) -> List[Trade]:
+        return self._trades
+
+    @property
+    def count(self) -> Optional[int]:
+        return self._count
 
 
 if __name__ == "__main__":
@@ -103,6 +139,8 @@ if __name__ == "__main__":
     "trades": [
         {
         "id": "781627664392913197",
+        "accepted_at": "2024-12-06T23:35:14.672965Z",
+        "state": "verified",
         "contract": {
             "id": "781546687553470972",
             "price": 1334,
@@ -133,4 +171,6 @@ if __name__ == "__main__":
     parsed = TradesResponse.from_raw(data)
 
     # Вывод результата
-    print(parsed.model_dump_json(indent=4))
+    for trade in parsed.trades:
+        item = trade.contract.item
+        print(trade.id, item.market_hash_name, trade.contract.normal_price, item.total_sticker_price)
@@ -1,7 +1,8 @@
 from typing import Dict, Any, Optional
+from .base import Model
 
 
-class Reference:
+class Reference(Model):
     __slots__ = (
         "_base_price",
         "_float_factor",
@@ -10,7 +11,17 @@ class Reference:
         "_last_updated"
     )
 
-    def __init__(self, *, data: Dict[str, Any]):
+    _SCHEMA = {
+        "base_price": ((int, float), False),
+        "float_factor": ((int, float), False),
+        "predicted_price": ((int, float), False),
+        "quantity": ((int,), False),
+        "last_updated": ((str,), False),
+    }
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
         self._base_price = data.get("base_price")
         self._float_factor = data.get("float_factor")
         self._predicted_price = data.get("predicted_price")
@@ -1,8 +1,9 @@
 from typing import Dict, Any, Optional
+from .base import Model
 from .statistics import Statistics
 
 
-class Seller:
+class Seller(Model):
     __slots__ = (
         "_avatar",
         "_away",
@@ -14,10 +15,28 @@ class Seller:
         "_statistics",
         "_steam_id",
         "_username",
-        "_verification_mode"
+        "_verification_mode",
+        "_statistics_model"
     )
 
-    def __init__(self, *, data: Dict[str, Any]):
+    _SCHEMA = {
+        "avatar": ((str,), False),
+        "away": ((bool,), False),
+        "flags": ((int,), False),
+        "has_valid_steam_api_key": ((bool,), False),
+        "obfuscated_id": ((str,), False),
+        "online": ((bool,), False),
+        "stall_public": ((bool,), False),
+        "statistics": ((dict,), False),
+        "steam_id": ((str,), False),
+        "username": ((str,), False),
+        "verification_mode": ((str,), False),
+    }
+    _NESTED = {"statistics": Statistics}
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
         self._avatar = data.get("avatar")
         self._away = data.get("away")
         self._flags = data.get("flags")
@@ -29,6 +48,7 @@ class Seller:
         self._steam_id = data.get("steam_id")
         self._username = data.get("username")
         self._verification_mode = data.get("verification_mode")
+        self._statistics_model: Optional[Statistics] = None
 
     @property
     def avatar(self) -> Optional[str]:
@@ -59,8 +79,15 @@ class Seller:
         return self._stall_public
 
     @property
-    def statistics(self) -> Optional[Statistics]:
-        return Statistics(data=self._statistics)
+    def statistics(self) -> Statistics:
+        """
+        Статистика продавца; если в ответе её нет - `Statistics` со всеми полями None
+        (раньше в этом случае поднималось AttributeError).
+        """
+        # Один объект продавца может быть общим для многих листингов (SellerCache)
+        if self._statistics_model is None:
+            self._statistics_model = Statistics(data=self._statistics or {})
+        return self._statistics_model
 
     @property
     def steam_id(self) -> Optional[int]:
@@ -1,15 +1,57 @@
-from pydantic import BaseModel
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional
+from .base import Model
 
-class SimilarBuyOrder(BaseModel):
-    market_hash_name: str
-    qty: int
-    price: int
+
+class SimilarBuyOrder(Model):
+    __slots__ = (
+        "_market_hash_name",
+        "_qty",
+        "_price"
+    )
+
+    _SCHEMA = {
+        "market_hash_name": ((str,), True),
+        "qty": ((int,), True),
+        "price": ((int,), True),
+    }
+    _VALIDATE = True
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
+        self._market_hash_name = data.get("market_hash_name")
+        self._qty = data.get("qty")
+        self._price = data.get("price")
+
+    @property
+    def market_hash_name(self) -> Optional[str]:
+        return self._market_hash_name
+
+    @property
+    def qty(self) -> Optional[int]:
+        return self._qty
+
+    @property
+    def price(self) -> Optional[int]:
+        return self._price
 
     @property
     def human_price(self) -> float:
-        return float(self.price / 100)
+        return float(self._price / 100)
+
+
+class SimilarBuyOrders(Model):
+    __slots__ = ("_data",)
 
-class SimilarBuyOrders(BaseModel):
-    data: List[SimilarBuyOrder]
\ No newline at end of file
+    _SCHEMA = {"data": ((list,), True)}
+    _NESTED = {"data": SimilarBuyOrder}
+    _VALIDATE = True
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
+        self._data = [SimilarBuyOrder(data=order, validate=False) for order in data.get("data") or ()]
+
+    @property
+    def data(self) -> List[SimilarBuyOrder]:
+        return self._data
@@ -1,8 +1,11 @@
 from typing import Dict, Any, Optional
+from .base import Model
 
 
-class Statistics:
+class Statistics(Model):
     __slots__ = (
+        "_total_sales",
+        "_total_purchases",
         "_median_trade_time",
         "_total_avoided_trades",
         "_total_failed_trades",
@@ -10,13 +13,37 @@ class Statistics:
         "_total_verified_trades"
     )
 
-    def __init__(self, *, data: Dict[str, Any]):
+    _SCHEMA = {
+        "total_sales": ((int,), False),
+        "total_purchases": ((int,), False),
+        "median_trade_time": ((int, float), False),
+        "total_avoided_trades": ((int,), False),
+        "total_failed_trades": ((int,), False),
+        "total_trades": ((int,), False),
+        "total_verified_trades": ((int,), False),
+    }
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
+        self._total_sales = data.get("total_sales")
+        self._total_purchases = data.get("total_purchases")
         self._median_trade_time = data.get("median_trade_time")
         self._total_avoided_trades = data.get("total_avoided_trades")
         self._total_failed_trades = data.get("total_failed_trades")
         self._total_trades = data.get("total_trades")
         self._total_verified_trades = data.get("total_verified_trades")
 
+    @property
+    def total_sales(self) -> Optional[int]:
+        """Только для своего профиля (`get_me`)."""
+        return self._total_sales
+
+    @property
+    def total_purchases(self) -> Optional[int]:
+        """Только для своего профиля (`get_me`)."""
+        return self._total_purchases
+
     @property
     def median_trade_time(self) -> Optional[float]:
         return self._median_trade_time
@@ -1,15 +1,24 @@
 from typing import Dict, Any, Optional
+from .base import Model
 
 
-class StickerReference:
+class StickerReference(Model):
     __slots__ = (
         "_price",
         "_quantity",
         "_updated_at"
     )
 
-    def __init__(self, *, data: Dict[str, Any]):
-        self._price = data.get("price", "")
+    _SCHEMA = {
+        "price": ((int, float), False),
+        "quantity": ((int,), False),
+        "updated_at": ((str,), False),
+    }
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
+        self._price = data.get("price")
         self._quantity = data.get("quantity")
         self._updated_at = data.get("updated_at")
 
@@ -26,7 +35,7 @@ class StickerReference:
         return self._updated_at
 
 
-class Sticker:
+class Sticker(Model):
     __slots__ = (
         "_stickerId",
         "_slot",
@@ -38,7 +47,21 @@ class Sticker:
         "_reference"
     )
 
-    def __init__(self, *, data: Dict[str, Any]):
+    _SCHEMA = {
+        "stickerId": ((int,), False),
+        "slot": ((int,), False),
+        "wear": ((int, float), False),
+        "offset_x": ((int, float), False),
+        "offset_y": ((int, float), False),
+        "icon_url": ((str,), False),
+        "name": ((str,), True),
+        "reference": ((dict,), False),
+    }
+    _NESTED = {"reference": StickerReference}
+
+    def __init__(self, *, data: Dict[str, Any], validate: Optional[bool] = None):
+        if self._should_validate(validate):
+            self.validate(data)
         self._stickerId = data.get("stickerId")
         self._slot = data.get("slot")
         self._wear = data.get("wear")
@@ -60,6 +83,14 @@ class Sticker:
     def wear(self) -> Optional[float]:
         return self._wear
 
+    @property
+    def offset_x(self) -> Optional[float]:
+        return self._offset_x
+
+    @property
+    def offset_y(self) -> Optional[float]:
+        return self._offset_y
+
     @property
     def icon_url(self) -> Optional[str]:
         return self._icon_url
@@ -71,4 +102,15 @@ class Sticker:
     @property
     def reference(self) -> Optional[StickerReference]:
         if self._reference is not None:
-            return StickerReference(data=self._reference)
+            return StickerReference(data=self._reference, validate=False)
+
+    @property
+    def price(self) -> Optional[float]:
+        """Цена из `reference.price` в центах."""
+        price = self._reference.get("price") if self._reference is not None else None
+        return price if isinstance(price, (int, float)) else None
+
+    @property
+    def normal_price(self) -> float:
+        price = self.price
+        return round(price / 100, 2) if price is not None else 0.0
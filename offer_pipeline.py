@@ -0,0 +1,291 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+import aiohttp
+from src.csfloat_api.models.listing import Listing
+
+__all__ = ("OfferRejected", "OfferResult", "OfferPipeline")
+
+logger = logging.getLogger(__name__)
+
+# max_offer_discount приходит в базисных пунктах (1000 = 10%)
+_DISCOUNT_SCALE = 10000
+
+
+class OfferRejected(ValueError):
+    """Оффер не прошёл локальную проверку и не отправлялся."""
+
+
+class _CachedListing:
+    __slots__ = (
+        "price",
+        "type",
+        "state",
+        "min_offer_price",
+        "max_offer_discount",
+        "seller_away",
+        "seller_online",
+        "cached_at",
+    )
+
+    def __init__(self, listing: Listing, cached_at: float):
+        seller = listing.seller_raw or {}
+        self.price = listing.price
+        self.type = listing.type
+        self.state = listing.state
+        self.min_offer_price = listing.min_offer_price
+        self.max_offer_discount = listing.max_offer_discount
+        self.seller_away = seller.get("away")
+        self.seller_online = seller.get("online")
+        self.cached_at = cached_at
+
+
+class OfferResult:
+    __slots__ = (
+        "_listing_id",
+        "_price",
+        "_response",
+        "_error",
+        "_sent",
+    )
+
+    def __init__(
+            self,
+            listing_id: int,
+            price: int,
+            *,
+            response: Optional[dict] = None,
+            error: Optional[Exception] = None,
+            sent: bool = False
+    ):
+        self._listing_id = listing_id
+        self._price = price
+        self._response = response
+        self._error = error
+        self._sent = sent
+
+    @property
+    def listing_id(self) -> int:
+        return self._listing_id
+
+    @property
+    def price(self) -> int:
+        return self._price
+
+    @property
+    def ok(self) -> bool:
+        return self._error is None
+
+    @property
+    def response(self) -> Optional[dict]:
+        return self._response
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """OfferRejected для локального отказа, иначе ошибка запроса."""
+        return self._error
+
+    @property
+    def sent(self) -> bool:
+        """False, если оффер отклонён локально и запрос не делался."""
+        return self._sent
+
+
+class OfferPipeline:
+    """
+    Отправка офферов за один запрос к API.
+
+    Ограничения листинга (`min_offer_price`, `max_offer_discount`, состояние,
+    away/online продавца) проверяются по локальному кэшу листингов, который
+    заполняется тем, что и так приходит из `get_all_listings`, поэтому перед
+    оффером не нужен отдельный `get_specific_listing`. Офферы идут через свою
+    сессию с постоянным прогретым соединением, не деля пул с краулом.
+    Прогрев - один GET `/meta/exchange-rates` и тратит один запрос бюджета клиента.
+
+    `submit` без `open` работает через временную сессию без прогрева и
+    закрывает её сам; для серии офферов откройте пайплайн заранее.
+
+        pipeline = OfferPipeline(client)
+        pipeline.remember(await client.aio.get_all_listings(market_hash_name=name))
+        async with pipeline:
+            results = await pipeline.submit([(listing_id, 1200), (other_id, 950)])
+    """
+
+    __slots__ = (
+        "_client",
+        "_listings",
+        "_max_age",
+        "_fetch_missing",
+        "_require_online",
+        "_connections",
+        "_keepalive",
+        "_session",
+    )
+
+    def __init__(
+            self,
+            client,
+            *,
+            max_age: float = 60.0,
+            fetch_missing: bool = True,
+            require_online: bool = False,
+            connections: int = 1,
+            keepalive: float = 300.0
+    ) -> None:
+        """
+        :param client: Экземпляр `Client`; его бюджет и ключ используются для офферов
+        :param max_age: Сколько секунд доверять закэшированному листингу
+        :param fetch_missing: Запрашивать листинг, которого нет в кэше (иначе оффер отклоняется)
+        :param require_online: Отклонять офферы продавцам не в сети
+        :param connections: Сколько соединений держать для офферов
+        :param keepalive: Сколько секунд держать простаивающее соединение открытым
+        """
+        self._client = client
+        self._listings: Dict[str, _CachedListing] = {}
+        self._max_age = max_age
+        self._fetch_missing = fetch_missing
+        self._require_online = require_online
+        self._connections = connections
+        self._keepalive = keepalive
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None and not self._session.closed
+
+    async def open(self, *, warm: bool = True) -> None:
+        """
+        :param warm: Сразу установить соединение (TCP + TLS) лёгким GET-запросом,
+            чтобы первый оффер не платил за рукопожатие; запрос расходует слот бюджета
+        """
+        if self.is_open:
+            return
+        self._session = self._client.make_session(limit=self._connections, keepalive=self._keepalive)
+        if warm:
+            try:
+                await self._client.aio.get_exchange_rates(session=self._session)
+            except Exception as error:
+                logger.warning(f"offer connection warm-up failed: {error}")
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "OfferPipeline":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def remember(self, listings: Iterable[Listing], *, now: Optional[float] = None) -> None:
+        """
+        Кладёт листинги в кэш (например, страницу `get_all_listings`).
+        """
+        now = time.time() if now is None else now
+        for listing in listings:
+            self._listings[str(listing.id)] = _CachedListing(listing, now)
+
+    def forget(self, listing_id) -> None:
+        self._listings.pop(str(listing_id), None)
+
+    def _cached(self, listing_id, now: float) -> Optional[_CachedListing]:
+        cached = self._listings.get(str(listing_id))
+        if cached is not None and now - cached.cached_at > self._max_age:
+            del self._listings[str(listing_id)]
+            return None
+        return cached
+
+    def validate(self, listing_id, price: int, *, now: Optional[float] = None) -> None:
+        """
+        Проверяет оффер по закэшированному листингу.
+
+        :raises OfferRejected: Оффер заведомо будет отклонён API
+        :raises KeyError: Листинга нет в кэше или он устарел
+        """
+        now = time.time() if now is None else now
+        cached = self._cached(listing_id, now)
+        if cached is None:
+            raise KeyError(listing_id)
+        self._check(cached, price)
+
+    def _check(self, cached: _CachedListing, price: int) -> None:
+        if cached.state is not None and cached.state != "listed":
+            raise OfferRejected(f"listing is {cached.state}")
+        if cached.type is not None and cached.type != "buy_now":
+            raise OfferRejected(f"offers are not accepted on {cached.type} listings")
+        if cached.price is not None and price >= cached.price:
+            raise OfferRejected(f"offer {price} is not below the listing price {cached.price}")
+        if cached.min_offer_price is not None and price < cached.min_offer_price:
+            raise OfferRejected(f"offer {price} is below min_offer_price {cached.min_offer_price}")
+        if cached.max_offer_discount is not None and cached.price is not None:
+            lowest = cached.price * (_DISCOUNT_SCALE - cached.max_offer_discount) / _DISCOUNT_SCALE
+            if price < lowest:
+                raise OfferRejected(f"offer {price} exceeds max_offer_discount ({lowest:.0f} at least)")
+        if cached.seller_away:
+            raise OfferRejected("seller is away")
+        if self._require_online and cached.seller_online is False:
+            raise OfferRejected("seller is offline")
+
+    async def _fetch(self, listing_id, now: float) -> _CachedListing:
+        listing = await self._client.aio.get_specific_listing(listing_id)
+        self.remember([listing], now=now)
+        return self._listings[str(listing_id)]
+
+    async def _lookup(self, listing_id, now: float, fetches: Dict[str, asyncio.Future]) -> _CachedListing:
+        cached = self._cached(listing_id, now)
+        if cached is not None:
+            return cached
+        if not self._fetch_missing:
+            raise OfferRejected("listing is not cached")
+        # Несколько офферов на один листинг в пачке - один запрос
+        key = str(listing_id)
+        if key not in fetches:
+            fetches[key] = asyncio.ensure_future(self._fetch(listing_id, now))
+        return await asyncio.shield(fetches[key])
+
+    async def _submit_one(
+            self, listing_id, price: int, now: float, fetches: Dict[str, asyncio.Future]
+    ) -> OfferResult:
+        try:
+            self._check(await self._lookup(listing_id, now, fetches), price)
+        except OfferRejected as error:
+            return OfferResult(listing_id, price, error=error)
+        except Exception as error:
+            logger.warning(f"offer {listing_id} lookup failed: {error}")
+            return OfferResult(listing_id, price, error=error)
+
+        try:
+            response = await self._client.aio.make_offer(listing_id=listing_id, price=price, session=self._session)
+        except Exception as error:
+            logger.warning(f"offer {listing_id} at {price} failed: {error}")
+            # Листинг мог измениться - в следующий раз перечитаем
+            self.forget(listing_id)
+            return OfferResult(listing_id, price, error=error, sent=True)
+        return OfferResult(listing_id, price, response=response, sent=True)
+
+    async def submit_one(self, listing_id, price: int) -> OfferResult:
+        return (await self.submit([(listing_id, price)]))[0]
+
+    async def submit(self, offers: Iterable[Tuple[int, int]]) -> List[OfferResult]:
+        """
+        Проверяет и отправляет пачку офферов параллельно.
+
+        :param offers: Пары (listing_id, price в центах)
+        :return: Результат по каждому офферу в порядке offers
+        """
+        # Сессию, открытую здесь, здесь же и закрываем; прогревать её ради одной пачки нет смысла
+        opened = not self.is_open
+        if opened:
+            await self.open(warm=False)
+        try:
+            now = time.time()
+            fetches: Dict[str, asyncio.Future] = {}
+            return list(await asyncio.gather(*(
+                self._submit_one(listing_id, price, now, fetches) for listing_id, price in offers
+            )))
+        finally:
+            if opened:
+                await self.close()
@@ -0,0 +1,267 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+__all__ = ("OrderBook", "OrderBookMaintainer")
+
+logger = logging.getLogger(__name__)
+
+# Уровень стакана: (price, qty)
+Level = Tuple[int, int]
+
+
+class OrderBook:
+    """
+    Отсортированный стакан buy-ордеров одного предмета (по цене, затем по количеству, по убыванию).
+
+    Новый снимок применяется как разница с предыдущим, лучшая цена и глубина
+    доступны за O(1).
+    """
+
+    __slots__ = (
+        "_sorted",
+        "_counts",
+        "_total_qty",
+        "_updated_at",
+    )
+
+    def __init__(self) -> None:
+        # Отрицательные значения, чтобы bisect держал порядок по убыванию
+        self._sorted: List[Tuple[int, int]] = []
+        self._counts: Counter = Counter()
+        self._total_qty = 0
+        self._updated_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    @property
+    def best_bid(self) -> Optional[int]:
+        return -self._sorted[0][0] if self._sorted else None
+
+    @property
+    def best_qty(self) -> Optional[int]:
+        return -self._sorted[0][1] if self._sorted else None
+
+    @property
+    def depth(self) -> int:
+        return len(self._sorted)
+
+    @property
+    def total_qty(self) -> int:
+        return self._total_qty
+
+    @property
+    def updated_at(self) -> Optional[float]:
+        return self._updated_at
+
+    def top(self, count: int) -> List[Level]:
+        return [(-price, -qty) for price, qty in self._sorted[:count]]
+
+    def apply_snapshot(self, levels: Iterable[Level], *, now: Optional[float] = None) -> int:
+        """
+        Применяет новый снимок стакана через разницу с текущим состоянием.
+
+        :param levels: Пары (price, qty) из ответа API
+        :param now: Время снимка (по умолчанию time.time())
+        :return: Количество добавленных и удалённых ордеров
+        """
+        new_counts = Counter(levels)
+        changed = 0
+
+        for level, count in (self._counts - new_counts).items():
+            key = (-level[0], -level[1])
+            for _ in range(count):
+                del self._sorted[bisect_left(self._sorted, key)]
+            self._total_qty -= level[1] * count
+            changed += count
+
+        for level, count in (new_counts - self._counts).items():
+            key = (-level[0], -level[1])
+            for _ in range(count):
+                insort(self._sorted, key)
+            self._total_qty += level[1] * count
+            changed += count
+
+        self._counts = new_counts
+        self._updated_at = time.time() if now is None else now
+        return changed
+
+
+class _Tracked:
+    __slots__ = ("source", "argument", "book", "change_rate", "interval", "entry")
+
+    def __init__(self, source: str, argument, interval: float):
+        self.source = source
+        self.argument = argument
+        self.book = OrderBook()
+        self.change_rate = 1.0
+        self.interval = interval
+        # Номер актуальной записи в куче; остальные записи ключа устарели
+        self.entry: Optional[int] = None
+
+
+class OrderBookMaintainer:
+    """
+    Держит стаканы сотен предметов в актуальном состоянии через
+    `get_buy_orders(listing_id=...)` и `get_similar_buy_orders(market_hash_name=...)`.
+
+    Ответы берутся в raw-виде и сразу применяются как разница к стакану.
+    Интервал опроса каждого предмета зависит от того, как часто его стакан
+    менялся: волатильные опрашиваются ближе к `min_interval`, спокойные - к `max_interval`.
+
+        maintainer = OrderBookMaintainer(client)
+        maintainer.track_item("AK-47 | Redline (Field-Tested)")
+        async with client:
+            await maintainer.run()
+    """
+
+    __slots__ = (
+        "_client",
+        "_tracked",
+        "_heap",
+        "_entries",
+        "_min_interval",
+        "_max_interval",
+        "_smoothing",
+        "_limit",
+    )
+
+    def __init__(
+            self,
+            client,
+            *,
+            min_interval: float = 5.0,
+            max_interval: float = 300.0,
+            smoothing: float = 0.3,
+            limit: int = 10
+    ) -> None:
+        """
+        :param client: Экземпляр `Client` (используются его async-версии методов)
+        :param min_interval: Минимальный интервал опроса в секундах
+        :param max_interval: Максимальный интервал опроса в секундах
+        :param smoothing: Вес последнего опроса в скользящей доле изменений
+        :param limit: Сколько ордеров запрашивать у API
+        """
+        self._client = client
+        self._tracked: Dict[Hashable, _Tracked] = {}
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._entries = itertools.count()
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._smoothing = smoothing
+        self._limit = limit
+
+    def _track(self, key: Hashable, source: str, argument) -> Hashable:
+        if key not in self._tracked:
+            self._tracked[key] = _Tracked(source, argument, self._min_interval)
+            self._schedule(key, 0.0)
+        return key
+
+    def _schedule(self, key: Hashable, at: float) -> None:
+        # После untrack() и повторного track() старая запись не даёт второго опроса
+        tracked = self._tracked[key]
+        tracked.entry = next(self._entries)
+        heapq.heappush(self._heap, (at, tracked.entry, key))
+
+    def _is_current(self, entry: int, key: Hashable) -> bool:
+        tracked = self._tracked.get(key)
+        return tracked is not None and tracked.entry == entry
+
+    def track_listing(self, listing_id: int) -> Hashable:
+        return self._track(("listing", listing_id), "listing", listing_id)
+
+    def track_item(self, market_hash_name: str) -> Hashable:
+        return self._track(("item", market_hash_name), "item", market_hash_name)
+
+    def untrack(self, key: Hashable) -> None:
+        # Запись в куче удалится лениво при следующем извлечении
+        self._tracked.pop(key, None)
+
+    def book(self, key: Hashable) -> Optional[OrderBook]:
+        tracked = self._tracked.get(key)
+        return None if tracked is None else tracked.book
+
+    async def _fetch(self, tracked: _Tracked) -> List[Level]:
+        if tracked.source == "listing":
+            response = await self._client.aio.get_buy_orders(
+                listing_id=tracked.argument, limit=self._limit, raw_response=True
+            )
+        else:
+            response = (await self._client.aio.get_similar_buy_orders(
+                tracked.argument, limit=self._limit, raw_response=True
+            ))["data"]
+        return [(order["price"], order["qty"]) for order in response]
+
+    async def refresh(self, key: Hashable, *, now: Optional[float] = None) -> int:
+        """
+        Опрашивает стакан и пересчитывает интервал следующего опроса.
+
+        :return: Количество изменившихся ордеров
+        """
+        tracked = self._tracked[key]
+        levels = await self._fetch(tracked)
+        now = time.time() if now is None else now
+        changed = tracked.book.apply_snapshot(levels, now=now)
+
+        tracked.change_rate += self._smoothing * ((1.0 if changed else 0.0) - tracked.change_rate)
+        tracked.interval = self._max_interval - (self._max_interval - self._min_interval) * tracked.change_rate
+        return changed
+
+    def due(self, now: Optional[float] = None) -> List[Hashable]:
+        """
+        Извлекает из расписания все ключи, которые пора опросить.
+        """
+        now = time.time() if now is None else now
+        keys = {}
+        while self._heap and self._heap[0][0] <= now:
+            _, entry, key = heapq.heappop(self._heap)
+            if self._is_current(entry, key):
+                self._tracked[key].entry = None
+                keys[key] = None
+        return list(keys)
+
+    def next_refresh_at(self) -> Optional[float]:
+        while self._heap and not self._is_current(*self._heap[0][1:]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    async def run_once(self, *, now: Optional[float] = None) -> Dict[Hashable, int]:
+        """
+        Опрашивает все просроченные стаканы параллельно (в рамках бюджета клиента).
+
+        :return: Ключ -> количество изменившихся ордеров (ключи с ошибкой опроса пропускаются)
+        """
+        simulated = now is not None
+        keys = self.due(now)
+        results = await asyncio.gather(*(self.refresh(key, now=now) for key in keys), return_exceptions=True)
+
+        finished = now if simulated else time.time()
+        changes = {}
+        for key, result in zip(keys, results):
+            tracked = self._tracked.get(key)
+            if tracked is None or tracked.entry is not None:
+                # Ключ убран или заново добавлен во время опроса
+                continue
+            self._schedule(key, finished + tracked.interval)
+            if isinstance(result, BaseException):
+                logger.warning(f"order book {key!r} refresh failed: {result}")
+            else:
+                changes[key] = result
+        return changes
+
+    async def run(self, stop: Optional[asyncio.Event] = None) -> None:
+        stop = stop if stop is not None else asyncio.Event()
+        while not stop.is_set():
+            await self.run_once()
+            next_at = self.next_refresh_at()
+            delay = self._max_interval if next_at is None else max(next_at - time.time(), 0.0)
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,152 @@
+import asyncio
+import json
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from src.csfloat_api.models.listing import Listing
+from src.csfloat_api.models.buy_orders import BuyOrders
+from src.csfloat_api.models.similar_buy_orders import SimilarBuyOrder
+from src.csfloat_api.models.my_active_buy_orders import MyBuyOrdersResponse
+from src.csfloat_api.models.my_trades_response import TradesResponse
+from src.csfloat_api.models.history_sale_info import ItemSale
+
+__all__ = (
+    "ParsePool",
+    "build_listing",
+    "build_listings",
+    "build_listing_columns",
+    "build_buy_orders",
+    "build_similar_buy_orders",
+    "build_my_buy_orders",
+    "build_trades",
+    "build_item_sales",
+)
+
+Builder = Callable[[Any], Any]
+
+# Сборщики моделей - функции верхнего уровня, чтобы их можно было передать в дочерний процесс.
+# Доверенный режим без проверки схемы - functools.partial(build_x, validate=False)
+
+
+def build_listing(payload: dict) -> Listing:
+    return Listing(data=payload)
+
+
+def build_listings(payload: list) -> List[Listing]:
+    return [Listing(data=item) for item in payload]
+
+
+def build_listing_columns(payload: list) -> Dict[str, list]:
+    """
+    Собирает листинги в компактные колонки вместо дерева объектов.
+    """
+    columns: Dict[str, list] = {
+        "id": [],
+        "price": [],
+        "market_hash_name": [],
+        "def_index": [],
+        "paint_index": [],
+        "paint_seed": [],
+        "float_value": [],
+        "low_rank": [],
+    }
+    for listing in payload:
+        item = listing.get("item") or {}
+        columns["id"].append(listing.get("id"))
+        columns["price"].append(listing.get("price"))
+        columns["market_hash_name"].append(item.get("market_hash_name"))
+        columns["def_index"].append(item.get("def_index"))
+        columns["paint_index"].append(item.get("paint_index"))
+        columns["paint_seed"].append(item.get("paint_seed"))
+        columns["float_value"].append(item.get("float_value"))
+        columns["low_rank"].append(item.get("low_rank"))
+    return columns
+
+
+def build_buy_orders(payload: list) -> List[BuyOrders]:
+    return [BuyOrders(data=item) for item in payload]
+
+
+def build_similar_buy_orders(payload: dict, validate: bool = True) -> List[SimilarBuyOrder]:
+    return [SimilarBuyOrder(data=item, validate=validate) for item in payload["data"]]
+
+
+def build_my_buy_orders(payload: dict, validate: bool = True) -> MyBuyOrdersResponse:
+    return MyBuyOrdersResponse(data=payload, validate=validate)
+
+
+def build_trades(payload: dict) -> TradesResponse:
+    return TradesResponse.from_raw(payload)
+
+
+def build_item_sales(payload: list, validate: bool = True) -> List[ItemSale]:
+    return [ItemSale(data=sale, validate=validate) for sale in payload]
+
+
+def _decode_and_build(body: bytes, builder: Optional[Builder]) -> Any:
+    payload = json.loads(body)
+    if builder is None:
+        return payload
+    return builder(payload)
+
+
+class ParsePool:
+    """
+    Выносит декодирование JSON и сборку моделей из потока event loop в пул процессов.
+
+    Ответы меньше `threshold` байт разбираются на месте: для них передача
+    в другой процесс дороже самого разбора.
+    """
+
+    __slots__ = (
+        "_executor",
+        "_threshold",
+        "_owns_executor",
+    )
+
+    def __init__(
+            self,
+            *,
+            max_workers: Optional[int] = None,
+            threshold: int = 128 * 1024,
+            executor: Optional[Executor] = None
+    ) -> None:
+        """
+        :param max_workers: Количество процессов (по умолчанию - по числу ядер)
+        :param threshold: Минимальный размер ответа в байтах, который уходит в пул
+        :param executor: Готовый executor вместо собственного ProcessPoolExecutor
+        """
+        self._owns_executor = executor is None
+        self._executor = executor if executor is not None else ProcessPoolExecutor(max_workers=max_workers)
+        self._threshold = threshold
+
+    @property
+    def threshold(self) -> int:
+        return self._threshold
+
+    async def parse(self, body: bytes, builder: Optional[Builder] = None) -> Any:
+        """
+        :param body: Сырые байты ответа
+        :param builder: Функция верхнего уровня, собирающая модели из JSON (None - вернуть JSON)
+        :return: Результат builder или декодированный JSON
+        """
+        if len(body) < self._threshold:
+            return _decode_and_build(body, builder)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _decode_and_build, body, builder)
+
+    def parse_sync(self, body: bytes, builder: Optional[Builder] = None) -> Any:
+        if len(body) < self._threshold:
+            return _decode_and_build(body, builder)
+
+        return self._executor.submit(_decode_and_build, body, builder).result()
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ParsePool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
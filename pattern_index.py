@@ -0,0 +1,291 @@
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.csfloat_api.models.listing import Listing
+from src.csfloat_api.models.history_sale_info import ItemSale
+from src.csfloat_api.listing_query import MAX_PAGE_LIMIT, ListingQuery
+
+__all__ = ("PatternKey", "PatternListing", "PatternSale", "PatternEntry", "PatternIndex")
+
+# (def_index, paint_index, paint_seed)
+PatternKey = Tuple[int, int, int]
+
+# API не отдаёт больше 50 листингов за страницу
+_MAX_PAGE_LIMIT = MAX_PAGE_LIMIT
+
+
+class PatternListing:
+    __slots__ = (
+        "_id",
+        "_price",
+        "_float_value",
+        "_low_rank",
+    )
+
+    def __init__(self, *, id: str, price: int, float_value: Optional[float], low_rank: Optional[int]):
+        self._id = id
+        self._price = price
+        self._float_value = float_value
+        self._low_rank = low_rank
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def price(self) -> int:
+        return self._price
+
+    @property
+    def float_value(self) -> Optional[float]:
+        return self._float_value
+
+    @property
+    def low_rank(self) -> Optional[int]:
+        return self._low_rank
+
+
+class PatternSale:
+    __slots__ = (
+        "_id",
+        "_price",
+        "_float_value",
+        "_sold_at_ts",
+    )
+
+    def __init__(self, *, id: str, price: int, float_value: Optional[float], sold_at_ts: int):
+        self._id = id
+        self._price = price
+        self._float_value = float_value
+        self._sold_at_ts = sold_at_ts
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def price(self) -> int:
+        return self._price
+
+    @property
+    def float_value(self) -> Optional[float]:
+        return self._float_value
+
+    @property
+    def sold_at_ts(self) -> int:
+        return self._sold_at_ts
+
+
+class PatternEntry:
+    __slots__ = (
+        "_key",
+        "_listings",
+        "_sales",
+        "_refreshed_at",
+    )
+
+    def __init__(self, key: PatternKey):
+        self._key = key
+        self._listings: Dict[str, PatternListing] = {}
+        self._sales: Dict[str, PatternSale] = {}
+        self._refreshed_at: Optional[float] = None
+
+    @property
+    def key(self) -> PatternKey:
+        return self._key
+
+    @property
+    def listings(self) -> List[PatternListing]:
+        return sorted(self._listings.values(), key=lambda listing: listing.price)
+
+    @property
+    def sales(self) -> List[PatternSale]:
+        return sorted(self._sales.values(), key=lambda sale: sale.sold_at_ts, reverse=True)
+
+    @property
+    def refreshed_at(self) -> Optional[float]:
+        return self._refreshed_at
+
+    @property
+    def lowest_price(self) -> Optional[int]:
+        if not self._listings:
+            return None
+        return min(listing.price for listing in self._listings.values())
+
+    @property
+    def last_sale(self) -> Optional[PatternSale]:
+        if not self._sales:
+            return None
+        return max(self._sales.values(), key=lambda sale: sale.sold_at_ts)
+
+    def is_stale(self, max_age: float, now: float) -> bool:
+        return self._refreshed_at is None or now - self._refreshed_at >= max_age
+
+
+class PatternIndex:
+    """
+    Индекс редких паттернов по ключу (def_index, paint_index, paint_seed).
+
+    Наполняется из листингов и истории продаж, а устаревшие ключи обновляются
+    минимальным числом запросов к `get_all_listings`: ключи с одинаковыми
+    (paint_index, paint_seed) запрашиваются одним вызовом со списком def_index.
+    """
+
+    __slots__ = (
+        "_entries",
+        "_max_age",
+    )
+
+    def __init__(self, *, max_age: float = 3600.0) -> None:
+        """
+        :param max_age: Через сколько секунд запись индекса считается устаревшей
+        """
+        self._entries: Dict[PatternKey, PatternEntry] = {}
+        self._max_age = max_age
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: PatternKey) -> bool:
+        return key in self._entries
+
+    def _entry(self, key: PatternKey) -> PatternEntry:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = PatternEntry(key)
+        return entry
+
+    def add_listings(self, listings: Iterable[Listing]) -> int:
+        """
+        Добавляет листинги в индекс. Листинги без paint_seed пропускаются.
+
+        :param listings: Листинги, например из `get_all_listings`
+        :return: Количество проиндексированных листингов
+        """
+        added = 0
+        for listing in listings:
+            item = listing.item
+            if item.def_index is None or item.paint_index is None or item.paint_seed is None:
+                continue
+            key = (item.def_index, item.paint_index, item.paint_seed)
+            self._entry(key)._listings[listing.id] = PatternListing(
+                id=listing.id,
+                price=listing.price,
+                float_value=item.float_value,
+                low_rank=item.low_rank,
+            )
+            added += 1
+        return added
+
+    def add_sales(self, sales: Iterable[ItemSale]) -> int:
+        """
+        Добавляет продажи из истории (`parse_item_by_name`) в индекс.
+
+        :param sales: Продажи предмета
+        :return: Количество проиндексированных продаж
+        """
+        added = 0
+        for sale in sales:
+            item = sale.item
+            if item.paint_index is None or item.paint_seed is None:
+                continue
+            key = (item.def_index, item.paint_index, item.paint_seed)
+            self._entry(key)._sales[sale.id] = PatternSale(
+                id=sale.id,
+                price=sale.price,
+                float_value=item.float_value,
+                sold_at_ts=sale.sold_at_ts,
+            )
+            added += 1
+        return added
+
+    def get(self, key: PatternKey) -> Optional[PatternEntry]:
+        return self._entries.get(key)
+
+    def query(self, keys: Iterable[PatternKey]) -> Dict[PatternKey, Optional[PatternEntry]]:
+        return {key: self._entries.get(key) for key in keys}
+
+    def query_tiers(
+            self, *, def_index: int, paint_index: int, tiers: Dict[str, Iterable[int]]
+    ) -> Dict[str, List[PatternEntry]]:
+        """
+        Возвращает записи индекса для пользовательских тир-листов сидов.
+
+        :param def_index: def_index оружия
+        :param paint_index: paint_index скина
+        :param tiers: Название тира -> список paint_seed, например {"tier1": [661, 670]}
+        :return: Название тира -> найденные записи (сиды без данных пропускаются)
+        """
+        result = {}
+        for tier, seeds in tiers.items():
+            entries = (self._entries.get((def_index, paint_index, seed)) for seed in seeds)
+            result[tier] = [entry for entry in entries if entry is not None]
+        return result
+
+    def stale_keys(self, keys: Iterable[PatternKey], *, now: Optional[float] = None) -> List[PatternKey]:
+        now = time.time() if now is None else now
+        stale = []
+        for key in dict.fromkeys(keys):
+            entry = self._entries.get(key)
+            if entry is None or entry.is_stale(self._max_age, now):
+                stale.append(key)
+        return stale
+
+    def plan_refresh(
+            self, keys: Iterable[PatternKey], *, now: Optional[float] = None
+    ) -> List[Tuple[int, int, Tuple[int, ...]]]:
+        """
+        Группирует устаревшие ключи в минимальный набор запросов.
+
+        :param keys: Интересующие ключи
+        :param now: Текущее время (по умолчанию time.time())
+        :return: Список (paint_index, paint_seed, def_indexes) - по одному запросу на элемент
+        """
+        groups: Dict[Tuple[int, int], List[int]] = {}
+        for def_index, paint_index, paint_seed in self.stale_keys(keys, now=now):
+            groups.setdefault((paint_index, paint_seed), []).append(def_index)
+
+        return [
+            (paint_index, paint_seed, tuple(sorted(def_indexes)))
+            for (paint_index, paint_seed), def_indexes in groups.items()
+        ]
+
+    def refresh(self, client, keys: Iterable[PatternKey], *, now: Optional[float] = None) -> int:
+        """
+        Обновляет устаревшие ключи через `client.get_all_listings`.
+
+        Листинги, которых больше нет в ответе, удаляются из записи.
+
+        :param client: Экземпляр `Client`
+        :param keys: Интересующие ключи
+        :param now: Текущее время (по умолчанию time.time())
+        :return: Количество сделанных запросов к API
+        """
+        now = time.time() if now is None else now
+        calls = 0
+
+        for paint_index, paint_seed, def_indexes in self.plan_refresh(keys, now=now):
+            listings = []
+            query = ListingQuery(
+                def_index=def_indexes,
+                paint_index=paint_index,
+                paint_seed=paint_seed,
+                sort_by="lowest_price",
+                category=0,
+                limit=_MAX_PAGE_LIMIT,
+            )
+            while True:
+                response = client.get_all_listings(query=query)
+                calls += 1
+                listings.extend(response)
+                if len(response) < _MAX_PAGE_LIMIT:
+                    break
+                query = query.next_page()
+
+            for def_index in def_indexes:
+                entry = self._entry((def_index, paint_index, paint_seed))
+                entry._listings.clear()
+                entry._refreshed_at = now
+
+            self.add_listings(listings)
+
+        return calls
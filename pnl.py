@@ -0,0 +1,351 @@
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional
+import numpy as np
+from src.csfloat_api.analytics import sticker_value
+from src.csfloat_api.models.base import parse_datetime
+from src.csfloat_api.models.my_trades_response import Trade
+
+__all__ = ("BUY", "SELL", "PositionStats", "PnLLedger")
+
+BUY = 0
+SELL = 1
+
+_SIDES = {"buy": BUY, "buyer": BUY, "sell": SELL, "seller": SELL}
+
+
+class _Columns:
+    """Растущие массивы NumPy одной длины (удвоение ёмкости при нехватке места)."""
+
+    __slots__ = ("size", "arrays")
+
+    def __init__(self, dtypes: Dict[str, type], capacity: int = 1024):
+        self.size = 0
+        self.arrays = {name: np.empty(capacity, dtype=dtype) for name, dtype in dtypes.items()}
+
+    def append(self, **values) -> int:
+        row = self.size
+        capacity = len(next(iter(self.arrays.values())))
+        if row == capacity:
+            for name, array in self.arrays.items():
+                grown = np.empty(capacity * 2, dtype=array.dtype)
+                grown[:row] = array
+                self.arrays[name] = grown
+        for name, value in values.items():
+            self.arrays[name][row] = value
+        self.size = row + 1
+        return row
+
+    def view(self, name: str) -> np.ndarray:
+        return self.arrays[name][:self.size]
+
+
+class PositionStats:
+    """
+    Накопленные показатели по одному market_hash_name (или по всему портфелю).
+    Цены в центах, время в секундах.
+    """
+
+    __slots__ = (
+        "bought",
+        "sold",
+        "matched",
+        "cost",
+        "proceeds",
+        "realized",
+        "holding_seconds",
+        "open_count",
+        "open_cost",
+        "unmatched_sells",
+    )
+
+    def __init__(self):
+        self.bought = 0
+        self.sold = 0
+        self.matched = 0
+        # Стоимость покупок и выручка продаж в закрытых парах
+        self.cost = 0
+        self.proceeds = 0.0
+        self.realized = 0.0
+        self.holding_seconds = 0
+        self.open_count = 0
+        self.open_cost = 0
+        self.unmatched_sells = 0
+
+    @property
+    def roi(self) -> Optional[float]:
+        """Реализованная доходность закрытых пар (0.1 = +10%)."""
+        return self.realized / self.cost if self.cost else None
+
+    @property
+    def average_holding(self) -> Optional[float]:
+        """Среднее время владения в закрытых парах, в секундах."""
+        return self.holding_seconds / self.matched if self.matched else None
+
+    def as_dict(self) -> dict:
+        return {
+            "bought": self.bought,
+            "sold": self.sold,
+            "matched": self.matched,
+            "cost": self.cost,
+            "proceeds": self.proceeds,
+            "realized": self.realized,
+            "roi": self.roi,
+            "average_holding": self.average_holding,
+            "open_count": self.open_count,
+            "open_cost": self.open_cost,
+            "unmatched_sells": self.unmatched_sells,
+        }
+
+
+class PnLLedger:
+    """
+    Реализованная прибыль портфеля по истории трейдов.
+
+    Каждый завершённый (verified) трейд - строка колоночного журнала: сторона,
+    цена, время, предмет, asset_id, стоимость наклеек и номер парной строки.
+    Продажа сопоставляется с покупкой того же asset_id, а если такой нет - с
+    самой старой открытой покупкой того же market_hash_name (FIFO). Продажа
+    без покупки ждёт её: покупка, пришедшая позже, но совершённая раньше
+    продажи, закроет пару.
+
+    Показатели по предмету и по портфелю обновляются при каждом сопоставлении,
+    а не пересчётом всей истории. Продажа после своей покупки (обычный порядок)
+    и поиск по asset_id стоят O(1) в среднем: сопоставленные строки из очередей
+    не вырезаются, а пропускаются при следующем обращении. Только покупка,
+    пришедшая после уже записанной продажи без пары, просматривает ждущие
+    продажи своего предмета. Повторно пришедшие трейды (по id) пропускаются.
+
+        ledger = PnLLedger(sell_fee=0.02)
+        ledger.add_trades(client.get_my_trades_by_state(role="buyer", states="verified", raw_response=False).trades, side="buy")
+        ledger.add_trades(client.get_my_trades_by_state(role="seller", states="verified", raw_response=False).trades, side="sell")
+        print(ledger.total.realized, ledger.total.roi)
+    """
+
+    __slots__ = (
+        "_sell_fee",
+        "_rows",
+        "_names",
+        "_name_ids",
+        "_trade_ids",
+        "_asset_ids",
+        "_open_buys",
+        "_open_by_asset",
+        "_waiting_sells",
+        "_waiting_by_asset",
+        "_stats",
+        "_total",
+        "_matches",
+    )
+
+    def __init__(self, *, sell_fee: float = 0.0) -> None:
+        """
+        :param sell_fee: Комиссия площадки с продажи, доля цены (0.02 = 2%)
+        """
+        self._sell_fee = sell_fee
+        self._rows = _Columns({
+            "side": np.int8,
+            "price": np.int64,
+            "ts": np.int64,
+            "name": np.int32,
+            "sticker_value": np.int64,
+            "pair": np.int64,
+        })
+        self._names: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+        self._trade_ids: Dict[str, int] = {}
+        self._asset_ids: List[Optional[str]] = []
+        # Открытые покупки и ждущие продажи по предмету в порядке добавления. Строки,
+        # уже получившие пару (pair != -1), остаются в очередях и пропускаются
+        self._open_buys: Dict[int, Deque[int]] = {}
+        self._open_by_asset: Dict[str, int] = {}
+        self._waiting_sells: Dict[int, Deque[int]] = {}
+        self._waiting_by_asset: Dict[str, Deque[int]] = {}
+        self._stats: Dict[int, PositionStats] = {}
+        self._total = PositionStats()
+        self._matches = _Columns({"buy": np.int64, "sell": np.int64, "pnl": np.float64, "holding": np.int64})
+
+    def __len__(self) -> int:
+        return self._rows.size
+
+    def __contains__(self, trade_id) -> bool:
+        return str(trade_id) in self._trade_ids
+
+    @property
+    def total(self) -> PositionStats:
+        return self._total
+
+    def stats(self, market_hash_name: str) -> Optional[PositionStats]:
+        name_id = self._name_ids.get(market_hash_name)
+        return None if name_id is None else self._stats[name_id]
+
+    def by_name(self) -> Dict[str, PositionStats]:
+        return {self._names[name_id]: stats for name_id, stats in self._stats.items()}
+
+    def _name_id(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self._names)
+            self._names.append(name)
+            self._stats[name_id] = PositionStats()
+            self._open_buys[name_id] = deque()
+            self._waiting_sells[name_id] = deque()
+        return name_id
+
+    def add_trades(self, trades: Iterable[Trade], *, side: str) -> int:
+        """
+        :param trades: Трейды из `get_my_trades_by_state` (берутся только verified)
+        :param side: "buy"/"buyer" - мы покупали, "sell"/"seller" - мы продавали
+        :return: Сколько новых трейдов добавлено
+        """
+        code = _SIDES.get(side)
+        if code is None:
+            raise ValueError(f'Unknown side "{side}"')
+
+        fresh = []
+        for trade in trades:
+            if trade.state != "verified" or str(trade.id) in self._trade_ids:
+                continue
+            accepted_at = parse_datetime(trade.accepted_at)
+            if accepted_at is None:
+                continue
+            fresh.append((int(accepted_at.timestamp()), trade))
+        # Внутри пачки - по времени, чтобы FIFO совпадал с порядком сделок
+        fresh.sort(key=lambda pair: pair[0])
+
+        for ts, trade in fresh:
+            self._add(code, ts, trade)
+        return len(fresh)
+
+    def _add(self, side: int, ts: int, trade: Trade) -> None:
+        contract = trade.contract
+        item = contract.item
+        name_id = self._name_id(item.market_hash_name or "")
+        row = self._rows.append(
+            side=side,
+            price=contract.price or 0,
+            ts=ts,
+            name=name_id,
+            sticker_value=sticker_value(item),
+            pair=-1,
+        )
+        asset_id = None if item.asset_id is None else str(item.asset_id)
+        self._asset_ids.append(asset_id)
+        self._trade_ids[str(trade.id)] = row
+
+        stats = self._stats[name_id]
+        price = contract.price or 0
+        if side == BUY:
+            stats.bought += 1
+            self._total.bought += 1
+            waiting = self._take_waiting_sell(name_id, asset_id, ts)
+            if waiting is not None:
+                stats.unmatched_sells -= 1
+                self._total.unmatched_sells -= 1
+                self._match(row, waiting)
+                return
+            self._open_buys[name_id].append(row)
+            if asset_id is not None:
+                self._open_by_asset[asset_id] = row
+            stats.open_count += 1
+            stats.open_cost += price
+            self._total.open_count += 1
+            self._total.open_cost += price
+            return
+
+        stats.sold += 1
+        self._total.sold += 1
+        buy = self._take_open_buy(name_id, asset_id, ts)
+        if buy is None:
+            self._waiting_sells[name_id].append(row)
+            if asset_id is not None:
+                self._waiting_by_asset.setdefault(asset_id, deque()).append(row)
+            stats.unmatched_sells += 1
+            self._total.unmatched_sells += 1
+            return
+        buy_price = int(self._rows.arrays["price"][buy])
+        stats.open_count -= 1
+        stats.open_cost -= buy_price
+        self._total.open_count -= 1
+        self._total.open_cost -= buy_price
+        self._match(buy, row)
+
+    def _paired(self, row: int) -> bool:
+        return self._rows.arrays["pair"][row] != -1
+
+    def _take_open_buy(self, name_id: int, asset_id: Optional[str], ts: int) -> Optional[int]:
+        ts_column = self._rows.arrays["ts"]
+        if asset_id is not None:
+            row = self._open_by_asset.get(asset_id)
+            if row is not None and ts_column[row] <= ts:
+                # Из очереди предмета строка уйдёт сама, когда дойдёт до головы
+                del self._open_by_asset[asset_id]
+                return row
+        queue = self._open_buys[name_id]
+        while queue and self._paired(queue[0]):
+            queue.popleft()
+        if not queue or ts_column[queue[0]] > ts:
+            return None
+        row = queue.popleft()
+        asset = self._asset_ids[row]
+        if asset is not None and self._open_by_asset.get(asset) == row:
+            del self._open_by_asset[asset]
+        return row
+
+    def _take_waiting_sell(self, name_id: int, asset_id: Optional[str], ts: int) -> Optional[int]:
+        ts_column = self._rows.arrays["ts"]
+        if asset_id is not None:
+            by_asset = self._waiting_by_asset.get(asset_id)
+            if by_asset is not None:
+                for row in by_asset:
+                    if not self._paired(row) and ts_column[row] >= ts:
+                        by_asset.remove(row)
+                        if not by_asset:
+                            del self._waiting_by_asset[asset_id]
+                        return row
+        queue = self._waiting_sells[name_id]
+        while queue and self._paired(queue[0]):
+            queue.popleft()
+        for row in queue:
+            if not self._paired(row) and ts_column[row] >= ts:
+                asset = self._asset_ids[row]
+                by_asset = self._waiting_by_asset.get(asset)
+                if by_asset is not None:
+                    by_asset.remove(row)
+                    if not by_asset:
+                        del self._waiting_by_asset[asset]
+                return row
+        return None
+
+    def _match(self, buy: int, sell: int) -> None:
+        arrays = self._rows.arrays
+        arrays["pair"][buy] = sell
+        arrays["pair"][sell] = buy
+        cost = int(arrays["price"][buy])
+        proceeds = float(arrays["price"][sell]) * (1 - self._sell_fee)
+        pnl = proceeds - cost
+        holding = int(arrays["ts"][sell] - arrays["ts"][buy])
+        self._matches.append(buy=buy, sell=sell, pnl=pnl, holding=holding)
+
+        for stats in (self._stats[int(arrays["name"][buy])], self._total):
+            stats.matched += 1
+            stats.cost += cost
+            stats.proceeds += proceeds
+            stats.realized += pnl
+            stats.holding_seconds += holding
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Колонка журнала без копирования: side, price, ts, name (номер в `names`),
+        sticker_value, pair (строка парной сделки или -1).
+        """
+        return self._rows.view(name)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def matches(self) -> Dict[str, np.ndarray]:
+        """
+        Закрытые пары в порядке закрытия: buy, sell (строки журнала), pnl, holding.
+        """
+        return {name: self._matches.view(name) for name in ("buy", "sell", "pnl", "holding")}
@@ -0,0 +1,165 @@
+import atexit
+import cProfile
+import os
+import time
+from contextvars import ContextVar, Token
+from typing import Dict, List, Optional, Tuple
+
+__all__ = (
+    "PHASES",
+    "Mark",
+    "Profiler",
+    "current_profiler",
+    "mark",
+)
+
+# Фазы в порядке прохождения запроса
+PHASES = ("sync-sleep", "rate-wait", "connect", "transfer", "decode", "model-build", "parse-pool")
+
+# (wall, cpu) в секундах
+Mark = Tuple[float, float]
+
+
+def mark() -> Mark:
+    return time.perf_counter(), time.process_time()
+
+
+class _PhaseStats:
+    __slots__ = ("count", "wall", "cpu")
+
+    def __init__(self):
+        self.count = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+
+
+class Profiler:
+    """
+    Разбивка времени работы клиента по эндпоинтам и фазам запроса:
+
+        sync-sleep  - пауза `sync_to_async` перед синхронным вызовом; путь запроса
+                      в этот момент ещё неизвестен, а метод может сделать несколько
+                      запросов, поэтому строка идёт по методу клиента ("get_me()"),
+                      а не по эндпоинту;
+        rate-wait   - ожидание бюджета / планировщика;
+        connect     - соединение, отправка и ожидание заголовков ответа;
+        transfer    - чтение тела ответа;
+        decode      - json.loads;
+        model-build - сборка Listing/Item/ItemSale и т.п.;
+        parse-pool  - decode + model-build в пуле процессов (ParsePool).
+
+    Включается контекстным менеджером или переменной окружения
+    CSFLOAT_PROFILE=<путь>, тогда профиль всего процесса пишется в
+    `<путь>.folded` при выходе. Когда профайлер не включён, клиент делает
+    только одно чтение ContextVar на запрос.
+
+    CPU-время - это время процесса за фазу: для decode/model-build оно точное,
+    а в фазах с ожиданием при параллельных запросах включает работу других задач.
+
+        with Profiler() as profiler:
+            client.get_all_listings(market_hash_name=name)
+        print(profiler.report())
+        profiler.write_folded("scan.folded")  # flamegraph.pl / speedscope
+    """
+
+    __slots__ = (
+        "_stats",
+        "_cprofile",
+        "_tokens",
+    )
+
+    def __init__(self, *, cprofile: bool = False) -> None:
+        """
+        :param cprofile: Дополнительно собирать cProfile по функциям (заметно замедляет работу)
+        """
+        self._stats: Dict[Tuple[str, str], _PhaseStats] = {}
+        self._cprofile = cProfile.Profile() if cprofile else None
+        self._tokens: List[Token] = []
+
+    def add(self, endpoint: str, phase: str, started: Mark) -> Mark:
+        """
+        Засчитывает время от `started` до текущего момента.
+
+        :return: Текущая отметка, чтобы сразу начать следующую фазу
+        """
+        now = mark()
+        self.add_span(endpoint, phase, started, now)
+        return now
+
+    def add_span(self, endpoint: str, phase: str, started: Mark, finished: Mark) -> None:
+        stats = self._stats.get((endpoint, phase))
+        if stats is None:
+            stats = self._stats[(endpoint, phase)] = _PhaseStats()
+        stats.count += 1
+        stats.wall += finished[0] - started[0]
+        stats.cpu += finished[1] - started[1]
+
+    def report(self) -> List[dict]:
+        """
+        :return: Строки (endpoint, phase, count, wall, cpu), самые долгие сначала
+        """
+        rows = [
+            {"endpoint": endpoint, "phase": phase, "count": stats.count, "wall": stats.wall, "cpu": stats.cpu}
+            for (endpoint, phase), stats in self._stats.items()
+        ]
+        rows.sort(key=lambda row: row["wall"], reverse=True)
+        return rows
+
+    def folded(self, *, metric: str = "wall") -> List[str]:
+        """
+        Строки формата folded stacks ("csfloat;<endpoint>;<phase> <микросекунды>")
+        для flamegraph.pl, speedscope и inferno.
+
+        :param metric: "wall" или "cpu"
+        """
+        if metric not in ("wall", "cpu"):
+            raise ValueError(f'Unknown metric "{metric}"')
+        lines = []
+        for (endpoint, phase), stats in sorted(self._stats.items()):
+            value = int(getattr(stats, metric) * 1_000_000)
+            if value > 0:
+                lines.append(f"csfloat;{endpoint};{phase} {value}")
+        return lines
+
+    def write_folded(self, path: str, *, metric: str = "wall") -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            for line in self.folded(metric=metric):
+                file.write(line + "\n")
+
+    def dump_cprofile(self, path: str) -> None:
+        """
+        Сохраняет статистику cProfile (для snakeviz, gprof2dot, flameprof).
+        """
+        if self._cprofile is None:
+            raise RuntimeError("Profiler was created without cprofile=True")
+        self._cprofile.dump_stats(path)
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+    def __enter__(self) -> "Profiler":
+        self._tokens.append(_current_profiler.set(self))
+        if self._cprofile is not None:
+            self._cprofile.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        _current_profiler.reset(self._tokens.pop())
+
+
+def _profiler_from_env() -> Optional[Profiler]:
+    path = os.environ.get("CSFLOAT_PROFILE")
+    if not path:
+        return None
+    profiler = Profiler()
+    atexit.register(profiler.write_folded, f"{path}.folded")
+    return profiler
+
+
+_current_profiler: ContextVar[Optional[Profiler]] = ContextVar("csfloat_profiler", default=_profiler_from_env())
+
+
+def current_profiler() -> Optional[Profiler]:
+    return _current_profiler.get()
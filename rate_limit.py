@@ -0,0 +1,105 @@
+import asyncio
+import time
+from typing import Mapping, Optional
+
+__all__ = ("RateBudget",)
+
+
+class RateBudget:
+    """
+    Бюджет запросов одной идентичности (ключ API или IP), который ведётся по
+    заголовкам X-Ratelimit-Limit / X-Ratelimit-Remaining / X-Ratelimit-Reset.
+
+    Пока сервер не прислал заголовки, бюджет считается неограниченным.
+    """
+
+    __slots__ = (
+        "_limit",
+        "_remaining",
+        "_reset_at",
+        "_reserve",
+    )
+
+    def __init__(self, *, reserve: int = 0) -> None:
+        """
+        :param reserve: Сколько запросов оставлять в запасе до сброса лимита
+        """
+        self._limit: Optional[int] = None
+        self._remaining: Optional[int] = None
+        self._reset_at: Optional[float] = None
+        self._reserve = reserve
+
+    @property
+    def limit(self) -> Optional[int]:
+        return self._limit
+
+    @property
+    def remaining(self) -> Optional[int]:
+        return self._remaining
+
+    @property
+    def reset_at(self) -> Optional[float]:
+        return self._reset_at
+
+    def available(self, now: Optional[float] = None) -> float:
+        """
+        :return: Сколько запросов можно сделать прямо сейчас (inf, если лимит неизвестен)
+        """
+        if self._remaining is None:
+            return float("inf")
+
+        now = time.time() if now is None else now
+        if self._reset_at is not None and now >= self._reset_at:
+            return float("inf") if self._limit is None else self._limit - self._reserve
+
+        return self._remaining - self._reserve
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        limit = headers.get("X-Ratelimit-Limit")
+        remaining = headers.get("X-Ratelimit-Remaining")
+        reset = headers.get("X-Ratelimit-Reset")
+
+        if limit is not None:
+            self._limit = int(limit)
+        if remaining is not None:
+            self._remaining = int(remaining)
+        if reset is not None:
+            self._reset_at = float(reset)
+
+    def _consume(self, now: float) -> None:
+        if self._remaining is None:
+            return
+        if self._reset_at is not None and now >= self._reset_at and self._limit is not None:
+            # Окно сброшено, а свежих заголовков ещё нет
+            self._remaining = self._limit
+            self._reset_at = None
+        self._remaining -= 1
+
+    def try_acquire(self, *, reserve: int = 0, now: Optional[float] = None) -> bool:
+        """
+        Занимает один запрос, если свободных запросов в бюджете больше `reserve`.
+        """
+        now = time.time() if now is None else now
+        if self.available(now) > reserve:
+            self._consume(now)
+            return True
+        return False
+
+    def retry_after(self, now: Optional[float] = None) -> float:
+        """
+        :return: Сколько секунд ждать, прежде чем бюджет может пополниться
+        """
+        now = time.time() if now is None else now
+        if self._reset_at is None:
+            if self._remaining is not None and self._remaining <= 0:
+                # Бюджет исчерпан, а время сброса неизвестно - считаем, что окно сбросится через секунду
+                self._reset_at = now + 1.0
+            return 1.0
+        return max(self._reset_at - now, 0.0)
+
+    async def acquire(self) -> None:
+        """
+        Занимает один запрос из бюджета, при исчерпании ждёт до X-Ratelimit-Reset.
+        """
+        while not self.try_acquire():
+            await asyncio.sleep(self.retry_after())
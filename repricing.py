@@ -0,0 +1,246 @@
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.csfloat_api.models.my_active_buy_orders import BuyOrder
+
+__all__ = ("RepriceTarget", "RepriceAction", "BuyOrderRepricer")
+
+logger = logging.getLogger(__name__)
+
+
+class RepriceTarget:
+    __slots__ = (
+        "_market_hash_name",
+        "_max_price",
+        "_min_price",
+        "_quantity",
+    )
+
+    def __init__(self, market_hash_name: str, *, max_price: int, min_price: int = 1, quantity: int = 1):
+        """
+        :param market_hash_name: Предмет
+        :param max_price: Потолок цены ордера в центах
+        :param min_price: Цена ордера, если других ордеров нет
+        :param quantity: Желаемое количество
+        """
+        self._market_hash_name = market_hash_name
+        self._max_price = max_price
+        self._min_price = min_price
+        self._quantity = quantity
+
+    @property
+    def market_hash_name(self) -> str:
+        return self._market_hash_name
+
+    @property
+    def max_price(self) -> int:
+        return self._max_price
+
+    @property
+    def min_price(self) -> int:
+        return self._min_price
+
+    @property
+    def quantity(self) -> int:
+        return self._quantity
+
+
+class RepriceAction:
+    __slots__ = (
+        "_market_hash_name",
+        "_old_order",
+        "_price",
+        "_quantity",
+        "_error",
+    )
+
+    def __init__(self, *, market_hash_name: str, old_order: Optional[BuyOrder], price: int, quantity: int):
+        self._market_hash_name = market_hash_name
+        self._old_order = old_order
+        self._price = price
+        self._quantity = quantity
+        self._error: Optional[BaseException] = None
+
+    @property
+    def market_hash_name(self) -> str:
+        return self._market_hash_name
+
+    @property
+    def old_order(self) -> Optional[BuyOrder]:
+        return self._old_order
+
+    @property
+    def price(self) -> int:
+        return self._price
+
+    @property
+    def quantity(self) -> int:
+        return self._quantity
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        return self._error
+
+    @property
+    def ok(self) -> bool:
+        return self._error is None
+
+
+class BuyOrderRepricer:
+    """
+    Держит наши buy-ордера на уровне лучшего чужого ордера + `step`.
+
+    За цикл стаканы всех целей читаются параллельно, вычисляется минимальный
+    набор изменений (ордера, которые уже стоят по нужной цене, не трогаются),
+    и изменения применяются параллельно в рамках бюджета клиента. Наши ордера
+    хранятся в локальном зеркале `get_my_buy_orders`, которое полностью
+    перечитывается только раз в `full_sync_every` циклов или после неясного ответа API.
+
+        repricer = BuyOrderRepricer(client)
+        async with client:
+            actions = await repricer.run_cycle([RepriceTarget(name, max_price=1500)])
+    """
+
+    __slots__ = (
+        "_client",
+        "_orders",
+        "_step",
+        "_concurrency",
+        "_full_sync_every",
+        "_cycles_since_sync",
+        "_dirty",
+    )
+
+    def __init__(self, client, *, step: int = 1, concurrency: int = 8, full_sync_every: int = 20) -> None:
+        """
+        :param client: Экземпляр `Client` (используются его async-версии методов)
+        :param step: На сколько центов перебивать лучший чужой ордер
+        :param concurrency: Сколько изменений применять одновременно
+        :param full_sync_every: Раз во сколько циклов перечитывать все наши ордера
+        """
+        self._client = client
+        self._orders: Dict[str, BuyOrder] = {}
+        self._step = step
+        self._concurrency = concurrency
+        self._full_sync_every = full_sync_every
+        self._cycles_since_sync = 0
+        self._dirty = True
+
+    @property
+    def orders(self) -> Dict[str, BuyOrder]:
+        return dict(self._orders)
+
+    async def sync_orders(self, *, limit: int = 100) -> None:
+        orders: Dict[str, BuyOrder] = {}
+        page = 0
+        while True:
+            response = await self._client.aio.get_my_buy_orders(page=page, limit=limit)
+            for order in response.orders:
+                orders[order.market_hash_name] = order
+            if len(response.orders) < limit:
+                break
+            page += 1
+
+        self._orders = orders
+        self._cycles_since_sync = 0
+        self._dirty = False
+
+    async def _read_books(self, names: Iterable[str]) -> Dict[str, List[Tuple[int, int]]]:
+        names = list(names)
+        responses = await asyncio.gather(*(
+            self._client.aio.get_similar_buy_orders(name, raw_response=True) for name in names
+        ))
+        return {
+            name: [(order["price"], order["qty"]) for order in response["data"]]
+            for name, response in zip(names, responses)
+        }
+
+    def _best_competitor(self, levels: List[Tuple[int, int]], own: Optional[BuyOrder]) -> Optional[int]:
+        # API сливает ордера с одной ценой в один уровень, поэтому наш ордер
+        # вычитается из количества на своей цене, а не ищется отдельной парой
+        own_qty = (own.qty or 0) if own is not None else 0
+        competing = (
+            price for price, qty in levels
+            if own is None or price != own.price or qty > own_qty
+        )
+        return max(competing, default=None)
+
+    def plan(
+            self, targets: Iterable[RepriceTarget], books: Dict[str, List[Tuple[int, int]]]
+    ) -> List[RepriceAction]:
+        """
+        :param targets: Цели по предметам
+        :param books: market_hash_name -> пары (price, qty) из `get_similar_buy_orders`
+        :return: Только реально нужные изменения
+        """
+        actions = []
+        for target in targets:
+            own = self._orders.get(target.market_hash_name)
+            best = self._best_competitor(books.get(target.market_hash_name, []), own)
+
+            price = target.min_price if best is None else best + self._step
+            price = max(target.min_price, min(target.max_price, price))
+
+            if own is not None and own.price == price and own.qty == target.quantity:
+                continue
+            actions.append(RepriceAction(
+                market_hash_name=target.market_hash_name,
+                old_order=own,
+                price=price,
+                quantity=target.quantity,
+            ))
+        return actions
+
+    async def _create(self, market_hash_name: str, price: int, quantity: int) -> None:
+        response = await self._client.aio.create_buy_order(
+            market_hash_name=market_hash_name,
+            max_price=price,
+            quantity=quantity,
+            raw_response=True,
+        )
+        try:
+            self._orders[market_hash_name] = BuyOrder(data=response)
+        except (TypeError, ValueError):
+            # В ответе не хватает полей ордера - зеркало уточним полной синхронизацией
+            self._dirty = True
+
+    async def _apply(self, action: RepriceAction, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            old = action.old_order
+            deleted = False
+            try:
+                if old is not None:
+                    await self._client.aio.delete_buy_order(old.id)
+                    self._orders.pop(action.market_hash_name, None)
+                    deleted = True
+                await self._create(action.market_hash_name, action.price, action.quantity)
+                return
+            except Exception as error:
+                logger.warning(f"reprice {action.market_hash_name} failed: {error}")
+                action._error = error
+                self._dirty = True
+            if not deleted:
+                return
+
+            # Старый ордер уже удалён, а новый не создан - вернуть старый, чтобы предмет не остался без ордера
+            try:
+                await self._create(action.market_hash_name, old.price, old.qty)
+            except Exception as error:
+                logger.warning(f"restoring buy order {action.market_hash_name} failed: {error}")
+
+    async def run_cycle(self, targets: Iterable[RepriceTarget]) -> List[RepriceAction]:
+        """
+        :param targets: Цели по предметам
+        :return: Применённые изменения (с ошибкой в `error`, если изменение не удалось)
+        """
+        targets = list(targets)
+        if self._dirty or self._cycles_since_sync >= self._full_sync_every:
+            await self.sync_orders()
+        self._cycles_since_sync += 1
+
+        books = await self._read_books(target.market_hash_name for target in targets)
+        actions = self.plan(targets, books)
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+        await asyncio.gather(*(self._apply(action, semaphore) for action in actions))
+        return actions
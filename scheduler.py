@@ -0,0 +1,215 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Deque, Dict, Iterator, Optional
+from src.csfloat_api.rate_limit import RateBudget
+
+__all__ = (
+    "Priority",
+    "BackgroundPreempted",
+    "request_priority",
+    "current_priority",
+    "RequestScheduler",
+)
+
+
+class Priority(IntEnum):
+    CRITICAL = 0  # снайпинг: make_offer, get_specific_listing по свежей сделке
+    INTERACTIVE = 1
+    BACKGROUND = 2  # краулеры, обновление истории продаж
+
+
+class BackgroundPreempted(Exception):
+    """Фоновый запрос вытеснен из очереди более важными."""
+
+
+_current_priority: ContextVar[Priority] = ContextVar("csfloat_request_priority", default=Priority.INTERACTIVE)
+
+
+def current_priority() -> Priority:
+    return _current_priority.get()
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """
+    Задаёт приоритет всех запросов клиента внутри блока:
+
+        with request_priority(Priority.CRITICAL):
+            await client.aio.make_offer(listing_id=listing_id, price=price)
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class _Waiter:
+    __slots__ = ("priority", "finish_tag", "future")
+
+    def __init__(self, priority: Priority, finish_tag: float, future: asyncio.Future):
+        self.priority = priority
+        self.finish_tag = finish_tag
+        self.future = future
+
+
+class RequestScheduler:
+    """
+    Раздаёт слоты бюджета запросов по классам приоритета.
+
+    CRITICAL всегда получает следующий свободный слот. INTERACTIVE и BACKGROUND
+    делят оставшиеся слоты по взвешенной справедливой очереди (WFQ), причём
+    фоновые запросы берут слот, только если в бюджете остаётся больше
+    `background_reserve` запросов, то есть доедают свободную ёмкость.
+
+    Если задан `max_queued_background`, фоновые запросы сверх лимита вытесняются
+    (BackgroundPreempted), но только пока в очереди есть CRITICAL/INTERACTIVE и
+    бюджета не хватает на всех ожидающих.
+    """
+
+    __slots__ = (
+        "_budget",
+        "_weights",
+        "_background_reserve",
+        "_max_queued_background",
+        "_queues",
+        "_last_finish",
+        "_virtual_time",
+        "_arrival",
+        "_dispatcher",
+    )
+
+    def __init__(
+            self,
+            budget: Optional[RateBudget] = None,
+            *,
+            interactive_weight: float = 4.0,
+            background_weight: float = 1.0,
+            background_reserve: int = 5,
+            max_queued_background: Optional[int] = None
+    ) -> None:
+        """
+        :param budget: Бюджет запросов (по умолчанию новый RateBudget)
+        :param interactive_weight: Вес INTERACTIVE в WFQ
+        :param background_weight: Вес BACKGROUND в WFQ
+        :param background_reserve: Сколько запросов бюджета недоступно фоновым задачам
+        :param max_queued_background: Лимит очереди BACKGROUND при нехватке бюджета для более
+            важных запросов; самые старые сверх лимита завершаются BackgroundPreempted
+        """
+        self._budget = budget if budget is not None else RateBudget()
+        self._weights = {
+            Priority.INTERACTIVE: interactive_weight,
+            Priority.BACKGROUND: background_weight,
+        }
+        self._background_reserve = background_reserve
+        self._max_queued_background = max_queued_background
+        self._queues: Dict[Priority, Deque[_Waiter]] = {priority: deque() for priority in Priority}
+        self._last_finish = {priority: 0.0 for priority in Priority}
+        self._virtual_time = 0.0
+        self._arrival: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    @property
+    def budget(self) -> RateBudget:
+        return self._budget
+
+    def queued(self, priority: Priority) -> int:
+        return len(self._queues[priority])
+
+    async def acquire(self, priority: Optional[Priority] = None) -> None:
+        """
+        Ждёт слот бюджета для одного запроса.
+
+        :param priority: Класс приоритета (по умолчанию - из request_priority)
+        """
+        priority = current_priority() if priority is None else priority
+        loop = asyncio.get_running_loop()
+
+        if priority is Priority.CRITICAL:
+            finish_tag = 0.0
+        else:
+            start = max(self._virtual_time, self._last_finish[priority])
+            finish_tag = start + 1.0 / self._weights[priority]
+            self._last_finish[priority] = finish_tag
+
+        waiter = _Waiter(priority, finish_tag, loop.create_future())
+        self._queues[priority].append(waiter)
+        self._shed_background()
+        self._wake(loop)
+
+        await waiter.future
+
+    def _shed_background(self, now: Optional[float] = None) -> None:
+        queue = self._queues[Priority.BACKGROUND]
+        if self._max_queued_background is None or len(queue) <= self._max_queued_background:
+            return
+        urgent = len(self._queues[Priority.CRITICAL]) + len(self._queues[Priority.INTERACTIVE])
+        if not urgent:
+            return
+        # Вытеснять есть смысл, только если бюджета не хватит на всю очередь
+        if self._budget.available(now) >= urgent + len(queue):
+            return
+        while len(queue) > self._max_queued_background:
+            waiter = queue.popleft()
+            if not waiter.future.done():
+                waiter.future.set_exception(BackgroundPreempted("Background request preempted"))
+
+    def _wake(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Каждый asyncio.run в sync_to_async - новый цикл, поэтому диспетчер привязан к текущему
+        if self._dispatcher is None or self._dispatcher.done() or self._dispatcher.get_loop() is not loop:
+            self._arrival = asyncio.Event()
+            self._dispatcher = loop.create_task(self._dispatch())
+        else:
+            self._arrival.set()
+
+    def _candidates(self):
+        critical = self._queues[Priority.CRITICAL]
+        if critical:
+            yield critical[0]
+
+        heads = [
+            self._queues[priority][0]
+            for priority in (Priority.INTERACTIVE, Priority.BACKGROUND)
+            if self._queues[priority]
+        ]
+        yield from sorted(heads, key=lambda waiter: (waiter.finish_tag, waiter.priority))
+
+    def _drop_cancelled(self) -> None:
+        for queue in self._queues.values():
+            while queue and queue[0].future.done():
+                queue.popleft()
+
+    async def _dispatch(self) -> None:
+        while True:
+            self._drop_cancelled()
+            if not any(self._queues.values()):
+                return
+
+            now = time.time()
+            granted = None
+            for waiter in self._candidates():
+                reserve = self._background_reserve if waiter.priority is Priority.BACKGROUND else 0
+                if self._budget.try_acquire(reserve=reserve, now=now):
+                    granted = waiter
+                    break
+                if waiter.priority is Priority.CRITICAL:
+                    # Критичный запрос ждёт слот первым, остальные не обгоняют его
+                    break
+
+            if granted is not None:
+                self._queues[granted.priority].popleft()
+                if granted.priority is not Priority.CRITICAL:
+                    self._virtual_time = max(self._virtual_time, granted.finish_tag)
+                granted.future.set_result(None)
+                continue
+
+            self._shed_background(now)
+            self._arrival.clear()
+            try:
+                await asyncio.wait_for(self._arrival.wait(), timeout=self._budget.retry_after(now))
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,232 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from src.csfloat_api.models.listing import Listing
+from src.csfloat_api.models.seller import Seller
+
+__all__ = ("SellerRecord", "SellerCache", "reliability_score")
+
+
+def reliability_score(statistics: Dict[str, Any]) -> float:
+    """
+    Доля успешных трейдов со сглаживанием Лапласа: (verified + 1) / (verified + failed + 2).
+    Новый продавец без истории получает 0.5, 98 успешных из 100 - около 0.97.
+    """
+    verified = statistics.get("total_verified_trades") or 0
+    failed = statistics.get("total_failed_trades") or 0
+    return (verified + 1) / (verified + failed + 2)
+
+
+class SellerRecord:
+    """
+    Закэшированный продавец: общий объект `Seller` и заранее посчитанные
+    поля для фильтров.
+    """
+
+    __slots__ = (
+        "_raw",
+        "_seller",
+        "_score",
+        "_verified_trades",
+        "_failed_trades",
+        "_median_trade_time",
+        "_trusted",
+    )
+
+    def __init__(self, raw: Dict[str, Any], score: float, trusted: bool):
+        statistics = raw.get("statistics") or {}
+        self._raw = raw
+        self._seller = Seller(data=raw, validate=False)
+        self._score = score
+        self._verified_trades = statistics.get("total_verified_trades") or 0
+        self._failed_trades = statistics.get("total_failed_trades") or 0
+        self._median_trade_time = statistics.get("median_trade_time")
+        self._trusted = trusted
+
+    @property
+    def seller(self) -> Seller:
+        return self._seller
+
+    @property
+    def score(self) -> float:
+        return self._score
+
+    @property
+    def verified_trades(self) -> int:
+        return self._verified_trades
+
+    @property
+    def failed_trades(self) -> int:
+        return self._failed_trades
+
+    @property
+    def median_trade_time(self) -> Optional[float]:
+        return self._median_trade_time
+
+    @property
+    def away(self) -> Optional[bool]:
+        return self._raw.get("away")
+
+    @property
+    def online(self) -> Optional[bool]:
+        return self._raw.get("online")
+
+    @property
+    def trusted(self) -> bool:
+        """Проходит ли продавец пороги `SellerCache`."""
+        return self._trusted
+
+
+class SellerCache:
+    """
+    Кэш продавцов по steam_id / obfuscated_id.
+
+    Один и тот же продавец встречается в тысячах листингов; кэш хранит по
+    одному `Seller` на продавца, а при `attach` листинги получают этот общий
+    объект вместо сборки нового на каждое обращение к `Listing.seller`.
+    Оценка надёжности и решение, проходит ли продавец пороги, считаются один
+    раз - при первой встрече и когда данные продавца в ответе меняются.
+
+        sellers = SellerCache(min_score=0.95, min_verified_trades=20)
+        client = Client(api_key, sellers=sellers)
+        listings = [listing for listing in client.get_all_listings(...) if sellers.trusted(listing)]
+    """
+
+    __slots__ = (
+        "_records",
+        "_aliases",
+        "_max_entries",
+        "_score",
+        "_min_score",
+        "_min_verified_trades",
+        "_max_median_trade_time",
+        "_allow_away",
+        "_hits",
+        "_misses",
+    )
+
+    def __init__(
+            self,
+            *,
+            max_entries: int = 50000,
+            score: Callable[[Dict[str, Any]], float] = reliability_score,
+            min_score: float = 0.0,
+            min_verified_trades: int = 0,
+            max_median_trade_time: Optional[float] = None,
+            allow_away: bool = True
+    ) -> None:
+        """
+        :param max_entries: Сколько продавцов держать (вытесняются давно не встречавшиеся)
+        :param score: Оценка надёжности по словарю statistics
+        :param min_score: Порог оценки для `trusted`
+        :param min_verified_trades: Минимум успешных трейдов для `trusted`
+        :param max_median_trade_time: Наибольшее медианное время трейда для `trusted` (в секундах)
+        :param allow_away: Считать ли надёжными продавцов со статусом away
+        """
+        self._records: "OrderedDict[str, SellerRecord]" = OrderedDict()
+        self._aliases: Dict[str, str] = {}
+        self._max_entries = max_entries
+        self._score = score
+        self._min_score = min_score
+        self._min_verified_trades = min_verified_trades
+        self._max_median_trade_time = max_median_trade_time
+        self._allow_away = allow_away
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Сколько раз продавец был новым или его данные изменились."""
+        return self._misses
+
+    @staticmethod
+    def _key(raw: Dict[str, Any]) -> Optional[str]:
+        key = raw.get("steam_id") or raw.get("obfuscated_id")
+        return None if key is None else str(key)
+
+    def _build(self, raw: Dict[str, Any]) -> SellerRecord:
+        statistics = raw.get("statistics") or {}
+        score = self._score(statistics)
+        verified = statistics.get("total_verified_trades") or 0
+        median = statistics.get("median_trade_time")
+        trusted = (
+            score >= self._min_score
+            and verified >= self._min_verified_trades
+            and (self._max_median_trade_time is None or (median is not None and median <= self._max_median_trade_time))
+            and (self._allow_away or not raw.get("away"))
+        )
+        return SellerRecord(raw, score, trusted)
+
+    def intern(self, raw: Optional[Dict[str, Any]]) -> Optional[SellerRecord]:
+        """
+        Запись продавца из сырого словаря `seller`; обновляется, если данные изменились.
+
+        :return: None, если у продавца нет ни steam_id, ни obfuscated_id
+        """
+        if not raw:
+            return None
+        key = self._key(raw)
+        if key is None:
+            return None
+        key = self._aliases.get(key, key)
+        record = self._records.get(key)
+        if record is not None and (record._raw is raw or record._raw == raw):
+            self._records.move_to_end(key)
+            self._hits += 1
+            return record
+
+        self._misses += 1
+        record = self._records[key] = self._build(raw)
+        self._records.move_to_end(key)
+        obfuscated_id = raw.get("obfuscated_id")
+        if obfuscated_id is not None and str(obfuscated_id) != key:
+            self._aliases[str(obfuscated_id)] = key
+            # Продавец раньше встречался только с obfuscated_id - его запись заменена этой
+            self._records.pop(str(obfuscated_id), None)
+        while len(self._records) > self._max_entries:
+            _, old = self._records.popitem(last=False)
+            alias = old._raw.get("obfuscated_id")
+            if alias is not None:
+                self._aliases.pop(str(alias), None)
+        return record
+
+    def get(self, seller_id) -> Optional[SellerRecord]:
+        """
+        :param seller_id: steam_id или obfuscated_id
+        """
+        key = str(seller_id)
+        return self._records.get(self._aliases.get(key, key))
+
+    def record(self, listing: Listing) -> Optional[SellerRecord]:
+        return self.intern(listing.seller_raw)
+
+    def attach(self, listings: Iterable[Listing]) -> List[Listing]:
+        """
+        Подставляет листингам общий объект продавца из кэша.
+
+        :return: Те же листинги списком
+        """
+        listings = list(listings)
+        for listing in listings:
+            record = self.intern(listing.seller_raw)
+            if record is not None:
+                listing._seller_model = record.seller
+        return listings
+
+    def score(self, listing: Listing) -> Optional[float]:
+        record = self.intern(listing.seller_raw)
+        return None if record is None else record.score
+
+    def trusted(self, listing: Listing) -> bool:
+        """Проходит ли продавец листинга пороги кэша; неизвестный продавец - нет."""
+        record = self.intern(listing.seller_raw)
+        return record is not None and record.trusted
+
+    def filter(self, listings: Iterable[Listing]) -> List[Listing]:
+        return [listing for listing in listings if self.trusted(listing)]
@@ -0,0 +1,229 @@
+import asyncio
+import json
+import os
+import time
+from typing import Iterable, Optional
+import pyarrow as pa
+import pyarrow.ipc as ipc
+from src.csfloat_api.models.listing import Listing
+from src.csfloat_api.columnar_export import listings_to_batch
+
+__all__ = ("Snapshot", "SnapshotPublisher", "SnapshotReader")
+
+_FORMAT = 1
+_HEAD = "HEAD"
+
+
+def _read_head(directory: str) -> Optional[dict]:
+    try:
+        with open(os.path.join(directory, _HEAD), encoding="utf-8") as file:
+            head = json.load(file)
+    except (FileNotFoundError, ValueError):
+        return None
+    if head.get("format") != _FORMAT:
+        raise ValueError(f"Unsupported snapshot format {head.get('format')}")
+    return head
+
+
+class Snapshot:
+    __slots__ = (
+        "_version",
+        "_published_at",
+        "_table",
+    )
+
+    def __init__(self, version: int, published_at: float, table: pa.Table):
+        self._version = version
+        self._published_at = published_at
+        self._table = table
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def published_at(self) -> float:
+        return self._published_at
+
+    @property
+    def table(self) -> pa.Table:
+        """Колонки по LISTING_SCHEMA; буферы указывают прямо в отображённый файл."""
+        return self._table
+
+    def __len__(self) -> int:
+        return self._table.num_rows
+
+
+class SnapshotPublisher:
+    """
+    Публикует текущий снимок листингов для других процессов.
+
+    Каждая версия - отдельный файл Arrow IPC (`snapshot-<version>.arrow`), он
+    пишется во временный файл и переименовывается целиком. После этого атомарно
+    заменяется заголовок HEAD (JSON с форматом, версией, именем сегмента и
+    числом строк), поэтому читатель видит либо старую, либо новую версию
+    полностью. Для настоящей общей памяти каталог стоит держать на tmpfs
+    (например, /dev/shm/csfloat).
+
+        publisher = SnapshotPublisher("/dev/shm/csfloat")
+        publisher.publish(listings)
+    """
+
+    __slots__ = (
+        "_directory",
+        "_keep",
+        "_version",
+    )
+
+    def __init__(self, directory: str, *, keep: int = 3) -> None:
+        """
+        :param directory: Каталог снимков
+        :param keep: Сколько последних сегментов оставлять на диске (старые читатели
+            продолжают работать со своими отображениями и после удаления файла)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._keep = keep
+        head = _read_head(directory)
+        self._version = head["version"] if head is not None else 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def _segment(self, version: int) -> str:
+        return f"snapshot-{version}.arrow"
+
+    def publish(self, listings: Iterable[Listing]) -> int:
+        """
+        :return: Номер опубликованной версии
+        """
+        return self.publish_batch(listings_to_batch(listings))
+
+    def publish_batch(self, batch: pa.RecordBatch) -> int:
+        version = self._version + 1
+        published_at = time.time()
+        segment = self._segment(version)
+        path = os.path.join(self._directory, segment)
+
+        schema = batch.schema.with_metadata({
+            "csfloat.version": str(version),
+            "csfloat.published_at": repr(published_at),
+        })
+        with pa.OSFile(path + ".tmp", "wb") as sink:
+            with ipc.new_file(sink, schema) as writer:
+                writer.write_batch(batch.replace_schema_metadata(schema.metadata))
+        os.replace(path + ".tmp", path)
+
+        head = {
+            "format": _FORMAT,
+            "version": version,
+            "segment": segment,
+            "rows": batch.num_rows,
+            "published_at": published_at,
+        }
+        head_path = os.path.join(self._directory, _HEAD)
+        with open(head_path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump(head, file)
+        os.replace(head_path + ".tmp", head_path)
+
+        self._version = version
+        self._cleanup()
+        return version
+
+    def _cleanup(self) -> None:
+        for old in range(self._version - self._keep, 0, -1):
+            path = os.path.join(self._directory, self._segment(old))
+            if not os.path.exists(path):
+                break
+            os.remove(path)
+
+
+class SnapshotReader:
+    """
+    Читает снимки `SnapshotPublisher` из другого процесса.
+
+    Сегмент отображается в память только для чтения, колонки не копируются,
+    поэтому N читателей одного снимка делят одни и те же страницы. О новой
+    версии читатель узнаёт по HEAD (`refresh`, `wait_for_version`).
+
+        reader = SnapshotReader("/dev/shm/csfloat")
+        snapshot = reader.wait_for_version(1, timeout=30)
+        prices = snapshot.table.column("price")
+    """
+
+    __slots__ = (
+        "_directory",
+        "_snapshot",
+        "_poll_interval",
+    )
+
+    def __init__(self, directory: str, *, poll_interval: float = 0.2) -> None:
+        """
+        :param directory: Каталог снимков
+        :param poll_interval: Как часто проверять HEAD при ожидании новой версии
+        """
+        self._directory = directory
+        self._snapshot: Optional[Snapshot] = None
+        self._poll_interval = poll_interval
+
+    @property
+    def version(self) -> int:
+        """Версия текущего загруженного снимка (0, если снимка ещё нет)."""
+        return self._snapshot.version if self._snapshot is not None else 0
+
+    @property
+    def snapshot(self) -> Optional[Snapshot]:
+        return self._snapshot
+
+    def refresh(self) -> bool:
+        """
+        Отображает новую версию, если она опубликована.
+
+        :return: True, если снимок сменился
+        """
+        head = _read_head(self._directory)
+        if head is None or head["version"] <= self.version:
+            return False
+        path = os.path.join(self._directory, head["segment"])
+        try:
+            source = pa.memory_map(path, "r")
+        except FileNotFoundError:
+            # Публикатор успел выпустить ещё версии и удалить этот сегмент
+            return False
+        table = ipc.open_file(source).read_all()
+        self._snapshot = Snapshot(head["version"], head["published_at"], table)
+        return True
+
+    def current(self) -> Optional[Snapshot]:
+        self.refresh()
+        return self._snapshot
+
+    def wait_for_version(self, version: Optional[int] = None, *, timeout: Optional[float] = None) -> Snapshot:
+        """
+        Ждёт снимок версии не ниже `version` (по умолчанию - следующей после текущей).
+
+        :raises TimeoutError: Версия не появилась за `timeout` секунд
+        """
+        target = self.version + 1 if version is None else version
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self.refresh()
+            if self._snapshot is not None and self._snapshot.version >= target:
+                return self._snapshot
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Snapshot version {target} was not published in {timeout}s")
+            time.sleep(self._poll_interval)
+
+    async def wait_for_version_async(
+            self, version: Optional[int] = None, *, timeout: Optional[float] = None
+    ) -> Snapshot:
+        target = self.version + 1 if version is None else version
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self.refresh()
+            if self._snapshot is not None and self._snapshot.version >= target:
+                return self._snapshot
+            if deadline is not None and time.monotonic() >= deadline:
+                raise asyncio.TimeoutError(f"Snapshot version {target} was not published in {timeout}s")
+            await asyncio.sleep(self._poll_interval)
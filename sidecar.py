@@ -0,0 +1,259 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from aiohttp import web
+from src.csfloat_api.client_config import ClientConfig
+from src.csfloat_api.csfloat_client import Client
+
+__all__ = ("DEFAULT_TTLS", "Sidecar", "main")
+
+logger = logging.getLogger(__name__)
+
+# Путь относительно корня API -> сколько секунд отдавать ответ из кэша
+DEFAULT_TTLS: Dict[str, float] = {
+    r"/listings": 5.0,
+    r"/listings/\d+": 5.0,
+    r"/listings/\d+/buy-orders": 10.0,
+    r"/meta/exchange-rates": 300.0,
+    r"/history/[^/]+/sales": 60.0,
+}
+
+# Заголовки ответа, которые передаются клиентам сайдкара. X-Ratelimit-* не передаются:
+# бюджетом управляет сайдкар, а в кэшированном ответе они устаревшие
+_FORWARDED_HEADERS = ("Content-Type",)
+
+
+class _Cached:
+    __slots__ = ("status", "headers", "body", "expires_at")
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes, expires_at: float):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.expires_at = expires_at
+
+
+class Sidecar:
+    """
+    Локальный HTTP-прокси к CSFloat для нескольких сервисов с одним ключом.
+
+    Сервисы ходят в сайдкар вместо csfloat.com (`Client(key, base_url="http://127.0.0.1:8787")`).
+    Сайдкар:
+      - отвечает из кэша на GET-запросы, путь которых подходит под одно из правил TTL;
+      - склеивает одинаковые GET-запросы, которые пришли, пока первый ещё в пути;
+      - ведёт один RateBudget на всех (через свой `Client`) и ставит в очередь
+        запросы при его исчерпании.
+
+    Все запросы идут в upstream через `Client._request` (бюджет, повторы,
+    дедлайны, профайлер, статистика сжатия) с ключом сайдкара, заголовок
+    Authorization клиентов игнорируется. Поэтому по умолчанию пропускаются
+    только GET: POST/PATCH/DELETE выполнялись бы от имени аккаунта сайдкара
+    для любого локального процесса и разрешаются только явно (`allow_writes`).
+    `/me/...` и подобные GET не кэшируются, если для них не задан TTL.
+    """
+
+    __slots__ = (
+        "_client",
+        "_ttls",
+        "_max_entries",
+        "_cache",
+        "_in_flight",
+        "_stats",
+        "_allow_writes",
+    )
+
+    def __init__(
+            self,
+            api_key: str,
+            *,
+            config: Optional[ClientConfig] = None,
+            upstream: Optional[str] = None,
+            ttls: Optional[Dict[str, float]] = None,
+            max_entries: Optional[int] = None,
+            proxy: Optional[str] = None,
+            allow_writes: bool = False
+    ) -> None:
+        """
+        :param api_key: Ключ, с которым сайдкар ходит в upstream
+        :param config: Настройки клиента, через который идут запросы в upstream
+        :param upstream: Корень API, например локальный тестовый сервер (вместо `config.base_url`)
+        :param ttls: Регулярное выражение пути -> TTL в секундах (по умолчанию DEFAULT_TTLS)
+        :param max_entries: Сколько ответов держать в кэше (по умолчанию `config.response_cache_size`)
+        :param proxy: Прокси для запросов в upstream
+        :param allow_writes: Пропускать POST/PATCH/DELETE (иначе на них отвечает 405)
+        """
+        self._client = Client(
+            api_key, config=config, proxy=proxy, base_url=upstream.rstrip("/") if upstream else None
+        )
+        rules = DEFAULT_TTLS if ttls is None else ttls
+        self._ttls: Tuple[Tuple[re.Pattern, float], ...] = tuple(
+            (re.compile(pattern), ttl) for pattern, ttl in rules.items()
+        )
+        self._max_entries = self._client.config.response_cache_size if max_entries is None else max_entries
+        self._cache: "OrderedDict[str, _Cached]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "upstream": 0, "uncached": 0, "rejected": 0}
+        self._allow_writes = allow_writes
+
+    @property
+    def client(self) -> Client:
+        return self._client
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+    def _ttl(self, path: str) -> float:
+        for pattern, ttl in self._ttls:
+            if pattern.fullmatch(path):
+                return ttl
+        return 0.0
+
+    async def _upstream(self, method: str, path_qs: str, json_data) -> _Cached:
+        self._stats["upstream"] += 1
+        response = await self._client._request(method, path_qs, json_data=json_data, raw=True)
+        headers = {name: response.headers[name] for name in _FORWARDED_HEADERS if name in response.headers}
+        return _Cached(response.status, headers, response.body, 0.0)
+
+    async def _cached_get(self, path_qs: str, ttl: float) -> Tuple[_Cached, str]:
+        now = time.monotonic()
+        cached = self._cache.get(path_qs)
+        if cached is not None and cached.expires_at > now:
+            self._cache.move_to_end(path_qs)
+            self._stats["hits"] += 1
+            return cached, "hit"
+
+        future = self._in_flight.get(path_qs)
+        while future is not None:
+            self._stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(future), "coalesced"
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    # Отменили сам ожидающий запрос
+                    raise
+            # Ведущий запрос отменён (клиент отключился) - идём в upstream сами или ждём нового ведущего
+            future = self._in_flight.get(path_qs)
+
+        self._stats["misses"] += 1
+        future = self._in_flight[path_qs] = asyncio.get_running_loop().create_future()
+        try:
+            result = await self._upstream("GET", path_qs, None)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            # Исключение уже передано ожидающим, само по себе оно не должно логироваться как потерянное
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(path_qs, None)
+
+        if result.status == 200:
+            result.expires_at = time.monotonic() + ttl
+            self._cache[path_qs] = result
+            self._cache.move_to_end(path_qs)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+        future.set_result(result)
+        return result, "miss"
+
+    def _allowed(self, method: str) -> bool:
+        if method == "GET":
+            return True
+        return self._allow_writes and method in Client._SUPPORTED_METHODS
+
+    async def handle(self, request: web.Request) -> web.Response:
+        path_qs = request.path_qs
+        if not self._allowed(request.method):
+            self._stats["rejected"] += 1
+            return web.json_response(
+                {"message": f"{request.method} is not allowed through the sidecar"},
+                status=405,
+                headers={"Allow": "GET, POST, PATCH, DELETE" if self._allow_writes else "GET"},
+            )
+        ttl = self._ttl(request.path) if request.method == "GET" else 0.0
+        json_data = None
+        if ttl <= 0:
+            body = await request.read()
+            try:
+                json_data = json.loads(body) if body else None
+            except ValueError:
+                return web.json_response({"message": "request body is not JSON"}, status=400)
+        try:
+            if ttl > 0:
+                result, source = await self._cached_get(path_qs, ttl)
+            else:
+                self._stats["uncached"] += 1
+                result, source = await self._upstream(request.method, path_qs, json_data), "bypass"
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            logger.warning(f"sidecar {request.method} {path_qs} failed: {error}")
+            return web.json_response({"message": f"upstream error: {error}"}, status=502)
+
+        headers = dict(result.headers)
+        headers["X-Sidecar-Cache"] = source
+        content_type = headers.pop("Content-Type", "application/json").split(";")[0]
+        return web.Response(status=result.status, body=result.body, headers=headers, content_type=content_type)
+
+    async def _on_startup(self, app: web.Application) -> None:
+        await self._client.open()
+
+    async def _on_cleanup(self, app: web.Application) -> None:
+        await self._client.close()
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self.handle)
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        return app
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Local caching proxy for the CSFloat API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--upstream", default=None, help="API root to forward to (default: $CSFLOAT_BASE_URL or csfloat.com)")
+    parser.add_argument("--api-key", default=os.environ.get("CSFLOT_API"), help="Defaults to $CSFLOT_API")
+    parser.add_argument("--proxy", default=None)
+    parser.add_argument("--max-entries", type=int, default=None)
+    parser.add_argument(
+        "--allow-writes", action="store_true",
+        help="Forward POST/PATCH/DELETE with the sidecar's key (only GET by default)"
+    )
+    parser.add_argument(
+        "--ttl", action="append", default=[], metavar="PATTERN=SECONDS",
+        help="Override or add a cache rule, e.g. --ttl '/listings=2'"
+    )
+    args = parser.parse_args(argv)
+    if not args.api_key:
+        parser.error("an API key is required (--api-key or $CSFLOT_API)")
+
+    ttls = dict(DEFAULT_TTLS)
+    for rule in args.ttl:
+        pattern, _, seconds = rule.rpartition("=")
+        ttls[pattern] = float(seconds)
+
+    sidecar = Sidecar(
+        args.api_key,
+        config=ClientConfig.from_env(),
+        upstream=args.upstream,
+        ttls=ttls,
+        max_entries=args.max_entries,
+        proxy=args.proxy,
+        allow_writes=args.allow_writes,
+    )
+    web.run_app(sidecar.make_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
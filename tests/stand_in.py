@@ -0,0 +1,81 @@
+import inspect
+import json
+from typing import Callable, Dict, List, Optional, Tuple
+from aiohttp import web
+
+__all__ = ("StandIn",)
+
+
+class StandIn:
+    """
+    Локальный aiohttp-сервер вместо CSFloat API для тестов.
+
+    Запоминает каждый запрос (метод, путь со строкой запроса, Authorization),
+    отвечает по маршрутам из `routes`, остальным - 200 с эхом запроса.
+    Бюджет отдаётся в X-Ratelimit-* (`remaining` по ключу, уменьшается на 1 за запрос).
+
+        async with StandIn(remaining={"key-a": 5, "key-b": 50}) as server:
+            client = Client("key-a", base_url=server.url)
+    """
+
+    def __init__(
+            self,
+            *,
+            routes: Optional[Dict[Tuple[str, str], Callable[[web.Request], object]]] = None,
+            remaining: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        :param routes: (метод, путь без /api/v1) -> функция, возвращающая JSON-ответ или `web.Response`
+            (или корутину с ними - для медленных ответов)
+        :param remaining: Остаток бюджета по API-ключу (по умолчанию 100 для любого ключа)
+        """
+        self.routes = routes or {}
+        self.remaining = dict(remaining or {})
+        self.requests: List[Tuple[str, str, Optional[str]]] = []
+        self._runner: Optional[web.AppRunner] = None
+        self.url = ""
+
+    def calls(self, method: Optional[str] = None, path: Optional[str] = None) -> List[Tuple[str, str, Optional[str]]]:
+        return [
+            call for call in self.requests
+            if (method is None or call[0] == method) and (path is None or call[1].split("?")[0] == path)
+        ]
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        path = request.path[len("/api/v1"):]
+        key = request.headers.get("Authorization")
+        self.requests.append((request.method, request.path_qs[len("/api/v1"):], key))
+        remaining = self.remaining.get(key, 100) - 1
+        self.remaining[key] = remaining
+        headers = {
+            "X-Ratelimit-Limit": "100",
+            "X-Ratelimit-Remaining": str(max(remaining, 0)),
+            "X-Ratelimit-Reset": "9999999999",
+        }
+
+        route = self.routes.get((request.method, path))
+        if route is None:
+            body = await request.read()
+            payload = {"method": request.method, "path": path, "body": json.loads(body) if body else None}
+        else:
+            payload = route(request)
+            if inspect.isawaitable(payload):
+                payload = await payload
+            if isinstance(payload, web.Response):
+                payload.headers.update(headers)
+                return payload
+        return web.json_response(payload, headers=headers)
+
+    async def __aenter__(self) -> "StandIn":
+        app = web.Application()
+        app.router.add_route("*", "/api/v1/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/api/v1"
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._runner.cleanup()
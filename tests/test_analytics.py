@@ -0,0 +1,76 @@
+import numpy as np
+from src.csfloat_api.analytics import SaleAnalytics, float_band_regression, rolling_median
+from src.csfloat_api.models.history_sale_info import ItemSale
+
+
+def _sale(i: int, price: int) -> ItemSale:
+    sold_at = f"2024-01-01T{i % 24:02d}:00:00+00:00"
+    return ItemSale(
+        data={"id": str(i), "price": price, "sold_at": sold_at, "item": {"float_value": 0.1, "stickers": []}},
+        validate=False,
+    )
+
+
+def test_static_cache_keeps_one_entry_per_item():
+    analytics = SaleAnalytics()
+    sales = [_sale(0, 1000), _sale(1, 1200)]
+    for i in range(2, 12):
+        sales.append(_sale(i, 1000 + i))
+        summary = analytics.summarize({"AK": sales}, now=1704100000)["AK"]
+        assert summary.last_sale_id == str(i)
+
+    assert len(analytics._static) == 1
+    assert summary.sales_count == 12
+    assert summary.median_price == 1006.5
+
+
+def _history(prices, floats):
+    return [
+        ItemSale(
+            data={
+                "id": str(i),
+                "price": price,
+                "sold_at": f"2024-{1 + i // 28:02d}-{1 + i % 28:02d}T00:00:00+00:00",
+                "item": {"float_value": float_value, "stickers": []},
+            },
+            validate=False,
+        )
+        for i, (price, float_value) in enumerate(zip(prices, floats))
+    ]
+
+
+def test_grouped_rolling_medians_match_per_item():
+    rng = np.random.default_rng(1)
+    histories = {
+        name: _history(rng.integers(100, 1000, size).tolist(), rng.uniform(0, 1, size).tolist())
+        for name, size in (("AK", 9), ("M4", 2), ("AWP", 5), ("empty", 0))
+    }
+    analytics = SaleAnalytics()
+
+    medians = analytics.rolling_medians(histories, 3)
+
+    assert list(medians) == list(histories)
+    for name, sales in histories.items():
+        expected = rolling_median(analytics.arrays(name, sales).price, 3)
+        np.testing.assert_array_equal(medians[name], expected)
+    # Окно не переходит через границу предметов
+    assert np.isnan(medians["AWP"][:2]).all() and not np.isnan(medians["AWP"][2:]).any()
+    assert np.isnan(medians["M4"]).all()
+
+
+def test_grouped_float_bands_match_per_item():
+    rng = np.random.default_rng(2)
+    bands = (0, 0.07, 0.15, 0.38, 0.45, 1)
+    histories = {
+        name: _history(rng.integers(100, 1000, size).tolist(), rng.uniform(0, 0.5, size).tolist())
+        for name, size in (("AK", 40), ("M4", 3), ("AWP", 25))
+    }
+    analytics = SaleAnalytics()
+
+    grouped = analytics.float_bands(histories, bands)
+
+    for name, sales in histories.items():
+        arrays = analytics.arrays(name, sales)
+        expected = float_band_regression(arrays.float_value, arrays.price, bands)
+        for actual, wanted in zip(grouped[name], expected):
+            np.testing.assert_allclose(actual, wanted, equal_nan=True)
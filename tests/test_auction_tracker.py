@@ -0,0 +1,93 @@
+import asyncio
+from datetime import datetime, timezone
+from src.csfloat_api.auction_tracker import AuctionTracker
+from src.csfloat_api.csfloat_client import Client
+from src.csfloat_api.models.listing import Listing
+from stand_in import StandIn
+
+T0 = 1_800_000_000
+
+
+def _auction(i: int, bid=None) -> dict:
+    expires_at = datetime.fromtimestamp(T0 + 7200 + i * 60, timezone.utc).isoformat()
+    details = {"expires_at": expires_at}
+    if bid is not None:
+        details["top_bid"] = {"id": bid, "price": 10, "obfuscated_buyer_id": "x"}
+    return {"id": str(i), "type": "auction", "price": 1, "item": {"market_hash_name": "A"}, "auction_details": details}
+
+
+def _pages(server: StandIn, total: int) -> None:
+    def listings(request):
+        page, limit = int(request.query["page"]), int(request.query["limit"])
+        return [_auction(i, bid=f"b{i}") for i in range(total)][page * limit:(page + 1) * limit]
+
+    server.routes[("GET", "/listings")] = listings
+
+
+def test_batch_pages_until_every_tracked_auction_is_found():
+    async def scenario():
+        async with StandIn() as server:
+            _pages(server, 200)
+            async with Client("key", base_url=server.url) as client:
+                bids = []
+                tracker = AuctionTracker(client, on_bid=lambda listing, previous: bids.append(listing.id))
+                for i in (10, 75, 120):
+                    await tracker.track(Listing(data=_auction(i), validate=False), now=T0)
+                requests = await tracker.run_once(now=T0 + 2000)
+                return server, requests, sorted(bids), tracker
+
+    server, requests, bids, tracker = asyncio.run(scenario())
+    # Страницы 0, 1, 2 по 50 листингов, запросов на отдельные аукционы нет
+    assert requests == 3
+    assert [call[1].split("?")[1].split("&")[0] for call in server.requests] == ["page=0", "page=1", "page=2"]
+    assert bids == ["10", "120", "75"]
+    assert all(auction.batch_misses == 0 for auction in tracker._auctions.values())
+
+
+def test_batch_stops_after_latest_tracked_expiry():
+    async def scenario():
+        async with StandIn() as server:
+            _pages(server, 500)
+            async with Client("key", base_url=server.url) as client:
+                tracker = AuctionTracker(client)
+                await tracker.track(Listing(data=_auction(5), validate=False), now=T0)
+                # Этого аукциона уже нет в выдаче
+                gone = _auction(60)
+                gone["id"] = "gone"
+                await tracker.track(Listing(data=gone, validate=False), now=T0)
+                requests = await tracker.run_once(now=T0 + 2000)
+                return requests, tracker
+
+    requests, tracker = asyncio.run(scenario())
+    # Вторая страница уже заканчивается позже "gone" - дальше не листаем
+    assert requests == 2
+    assert tracker._auctions["gone"].batch_misses == 1
+    assert tracker._auctions["5"].batch_misses == 0
+
+
+def test_retracked_auction_is_polled_once_per_interval():
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/listings/1")] = lambda request: _auction(1, bid="b1")
+            server.routes[("GET", "/listings/2")] = lambda request: dict(_auction(1, bid="b2"), id="2")
+            async with Client("key", base_url=server.url) as client:
+                tracker = AuctionTracker(client)
+                listing = Listing(data=_auction(1), validate=False)
+                for second in range(3):
+                    await tracker.track(listing, now=T0 + 6000 + second)
+                # Тот же срок окончания, чтобы оба аукциона опрашивались одновременно
+                other = Listing(data=dict(_auction(1), id="2"), validate=False)
+                await tracker.track(other, now=T0 + 6000)
+                tracker.untrack("2")
+                await tracker.track(other, now=T0 + 6002)
+
+                polls = []
+                for _ in range(5):
+                    polls.append(await tracker.run_once(now=tracker.next_poll_at()))
+                return server, polls
+
+    server, polls = asyncio.run(scenario())
+    # Каждый опрос - ровно по одному запросу на аукцион
+    assert polls == [2, 2, 2, 2, 2]
+    assert len(server.calls("GET", "/listings/1")) == 5
+    assert len(server.calls("GET", "/listings/2")) == 5
@@ -0,0 +1,65 @@
+import asyncio
+import json
+from src.csfloat_api.bulk_listing import ListingRequest, RepriceRequest, create_listings, reprice_listings
+from src.csfloat_api.csfloat_client import Client
+from stand_in import StandIn
+
+
+def _run(batch, *, journal_path=None, create=True):
+    async def scenario():
+        async with StandIn() as server:
+            async with Client("key", base_url=server.url) as client:
+                if create:
+                    outcomes = await create_listings(client, batch, journal_path=journal_path)
+                else:
+                    outcomes = await reprice_listings(client, batch, journal_path=journal_path)
+                return server, outcomes
+
+    return asyncio.run(scenario())
+
+
+def test_duplicate_assets_are_rejected_before_sending():
+    batch = [
+        ListingRequest("1", price=100),
+        ListingRequest("2", price=200),
+        ListingRequest("1", price=150),
+        ListingRequest("3", price=300, type_="auction", duration_days=2),
+    ]
+    server, outcomes = _run(batch)
+
+    assert [outcome.key for outcome in outcomes] == ["1", "2", "1", "3"]
+    assert [outcome.ok for outcome in outcomes] == [False, True, False, False]
+    assert "duplicate asset_id" in outcomes[0].error
+    assert outcomes[3].error.startswith("invalid:")
+    assert [call[1] for call in server.calls("POST")] == ["/listings"]
+
+
+def test_duplicate_listing_ids_are_not_repriced():
+    batch = [RepriceRequest(7, price=100), RepriceRequest(7, price=90), RepriceRequest(8, price=120)]
+    server, outcomes = _run(batch, create=False)
+
+    assert [outcome.ok for outcome in outcomes] == [False, False, True]
+    assert [call[1] for call in server.requests] == ["/listings/8"]
+
+
+def test_journal_skips_done_creations_on_resume(tmp_path):
+    journal = str(tmp_path / "listings.jsonl")
+    batch = [ListingRequest("1", price=100), ListingRequest("2", price=200)]
+    first, _ = _run(batch, journal_path=journal)
+    second, outcomes = _run(batch + [ListingRequest("3", price=300)], journal_path=journal)
+
+    assert len(first.calls("POST", "/listings")) == 2
+    assert len(second.calls("POST", "/listings")) == 1
+    assert [outcome.from_journal for outcome in outcomes] == [True, True, False]
+    with open(journal, encoding="utf-8") as file:
+        statuses = [json.loads(line)["status"] for line in file]
+    assert sorted(statuses) == ["done"] * 3 + ["started"] * 3
+
+
+def test_interrupted_creation_is_not_retried_by_default(tmp_path):
+    journal = tmp_path / "listings.jsonl"
+    journal.write_text(json.dumps({"op": "create", "key": "1", "status": "started", "args": {}}) + "\n")
+    server, outcomes = _run([ListingRequest("1", price=100)], journal_path=str(journal))
+
+    assert not outcomes[0].ok and outcomes[0].from_journal
+    assert server.requests == []
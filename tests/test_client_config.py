@@ -0,0 +1,58 @@
+import asyncio
+from dataclasses import replace
+import pytest
+from src.csfloat_api.client_config import API_URL, ClientConfig
+from src.csfloat_api.csfloat_client import Client
+from stand_in import StandIn
+
+
+def test_from_env_reads_prefixed_fields():
+    config = ClientConfig.from_env(environ={
+        "CSFLOAT_POOL_SIZE": "200",
+        "CSFLOAT_READ_TIMEOUT": "none",
+        "CSFLOAT_CONNECT_TIMEOUT": "2.5",
+        "CSFLOAT_HEDGING": "yes",
+        "CSFLOAT_COMPRESSION": "0",
+        "CSFLOAT_BASE_URL": "http://localhost:9000",
+        "OTHER_RETRIES": "9",
+    })
+    assert config == ClientConfig(
+        pool_size=200, read_timeout=None, connect_timeout=2.5, hedging=True, compression=False,
+        base_url="http://localhost:9000",
+    )
+    assert ClientConfig.from_env(prefix="OTHER_", environ={"OTHER_RETRIES": "9"}).retries == 9
+    assert ClientConfig.from_env(environ={}) == ClientConfig()
+
+
+@pytest.mark.parametrize("arguments", [
+    {"pool_size": 0}, {"retries": -1}, {"read_timeout": 0}, {"hedge_quantile": 1}, {"sync_pause": -0.1},
+])
+def test_invalid_values_raise(arguments):
+    with pytest.raises(ValueError):
+        ClientConfig(**arguments)
+
+
+def test_headers_and_timeouts():
+    config = ClientConfig(connect_timeout=1, read_timeout=None)
+    assert config.headers("key")["Authorization"] == "key"
+    assert "gzip" in config.headers(None)["Accept-Encoding"]
+    assert "Authorization" not in config.headers(None)
+    assert replace(config, compression=False).headers(None)["Accept-Encoding"] == "identity"
+    assert config.requests_timeout() == (1, None)
+    assert config.timeout().sock_connect == 1
+    # Неизменяемый и хешируемый - годится как ключ кэша сессий
+    assert hash(config) == hash(ClientConfig(connect_timeout=1, read_timeout=None))
+
+
+def test_client_keyword_arguments_override_config():
+    async def scenario():
+        async with StandIn() as server:
+            config = ClientConfig(base_url=API_URL, retries=5, compression=False)
+            async with Client("key", config=config, base_url=server.url, retries=0) as client:
+                await client.aio.get_exchange_rates()
+                return client.config, server.requests
+
+    config, requests = asyncio.run(scenario())
+    assert config.retries == 0 and not config.compression
+    assert config.base_url != API_URL
+    assert requests == [("GET", "/meta/exchange-rates", "key")]
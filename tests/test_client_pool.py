@@ -0,0 +1,58 @@
+import asyncio
+import pytest
+from src.csfloat_api.client_pool import ACCOUNT_METHODS, ClientPool, Identity
+from stand_in import StandIn
+
+
+def _warm_up(pool: ClientPool):
+    # Бюджет клиента известен только после первого ответа
+    return asyncio.gather(*(client.aio.get_exchange_rates() for client in pool.clients))
+
+
+def test_shared_calls_go_to_client_with_most_budget():
+    async def scenario():
+        async with StandIn(remaining={"key-a": 5, "key-b": 50}) as server:
+            server.routes[("GET", "/listings")] = lambda request: []
+            async with ClientPool([Identity("key-a"), Identity("key-b")], base_url=server.url) as pool:
+                await _warm_up(pool)
+                before = len(server.requests)
+                for _ in range(3):
+                    await pool.call("get_all_listings")
+                return [key for _, _, key in server.requests[before:]]
+
+    assert asyncio.run(scenario()) == ["key-b"] * 3
+
+
+def test_account_methods_stay_on_owner_key():
+    async def scenario():
+        async with StandIn(remaining={"key-a": 5, "key-b": 50}) as server:
+            async with ClientPool([Identity("key-a"), Identity("key-b")], base_url=server.url) as pool:
+                await _warm_up(pool)
+                before = len(server.requests)
+                await pool.call("get_me", api_key="key-a")
+                await pool.call("update_listing", listing_id=1, price=150, api_key="key-a")
+                await pool.call("make_offer", listing_id=2, price=100, api_key="key-a")
+                picked = {
+                    method: pool.pick(method, api_key="key-a").API_KEY
+                    for method in ("create_listings", "reprice_listings", "create_buy_order")
+                }
+                return server.requests[before:], picked
+
+    requests, picked = asyncio.run(scenario())
+    assert [(method, key) for method, _, key in requests] == [
+        ("GET", "key-a"),
+        ("PATCH", "key-a"),
+        ("POST", "key-a"),
+    ]
+    assert set(picked.values()) == {"key-a"}
+
+
+@pytest.mark.parametrize("method", sorted(ACCOUNT_METHODS))
+def test_account_methods_need_owner_key(method):
+    pool = ClientPool([Identity("key-a"), Identity("key-b")], base_url="http://127.0.0.1:1/api/v1")
+    with pytest.raises(ValueError):
+        pool.pick(method)
+
+
+def test_listing_writes_are_account_methods():
+    assert {"update_listing", "create_listings", "reprice_listings"} <= ACCOUNT_METHODS
@@ -0,0 +1,85 @@
+import pytest
+from src.csfloat_api.columnar_export import (
+    LISTING_SCHEMA,
+    SALE_SCHEMA,
+    ColumnarWriter,
+    listings_to_batch,
+    read_arrow,
+    read_parquet,
+    sales_to_batch,
+)
+from src.csfloat_api.models.history_sale_info import ItemSale
+from src.csfloat_api.models.listing import Listing
+
+_STICKER = {"name": "Sticker | Crown (Foil)", "slot": 1, "wear": 0.25, "reference": {"price": 90000}}
+
+
+def _listing(listing_id: int, price: int) -> Listing:
+    return Listing(
+        data={
+            "id": str(listing_id),
+            "type": "buy_now",
+            "price": price,
+            "state": "listed",
+            "seller": {"steam_id": "7656"},
+            "reference": {"predicted_price": price + 50},
+            "item": {"market_hash_name": "AK", "float_value": 0.15, "paint_seed": 661, "stickers": [_STICKER]},
+        },
+        validate=False,
+    )
+
+
+def _sale(sale_id: int) -> ItemSale:
+    return ItemSale(
+        data={
+            "id": str(sale_id),
+            "price": 1200,
+            "sold_at": "2024-01-02T03:04:05Z",
+            "reference": {"predicted_price": 1250},
+            "item": {"market_hash_name": "AK", "float_value": 0.2, "stickers": [_STICKER]},
+        },
+        validate=False,
+    )
+
+
+def test_listings_batch_reads_raw_nested_objects():
+    batch = listings_to_batch([_listing(1, 1000), Listing(data={"id": "2"}, validate=False)])
+    rows = batch.to_pylist()
+
+    assert batch.schema == LISTING_SCHEMA
+    assert rows[0]["seller_steam_id"] == "7656"
+    assert rows[0]["predicted_price"] == 1050
+    assert rows[0]["paint_seed"] == 661
+    assert rows[0]["stickers"] == [{"name": "Sticker | Crown (Foil)", "slot": 1, "wear": 0.25, "price": 90000}]
+    # Листинг без вложенных объектов даёт пустые колонки, а не ошибку
+    assert rows[1]["market_hash_name"] is None
+    assert rows[1]["stickers"] == []
+
+
+def test_sales_batch_converts_sold_at():
+    rows = sales_to_batch([_sale(1)]).to_pylist()
+    assert rows[0]["sold_at"].timestamp() == 1704164645
+    assert rows[0]["stickers"][0]["price"] == 90000
+
+
+@pytest.mark.parametrize("name", ["listings.arrow", "listings.parquet"])
+def test_writer_round_trip(tmp_path, name):
+    path = str(tmp_path / name)
+    with ColumnarWriter(path, LISTING_SCHEMA) as writer:
+        writer.write(listings_to_batch([_listing(1, 1000), _listing(2, 1100)]))
+        writer.write(listings_to_batch([]))
+        writer.write(listings_to_batch([_listing(3, 1200)]))
+
+    table = read_parquet(path) if name.endswith(".parquet") else read_arrow(path)
+    assert writer.rows == 3
+    assert table.column("price").to_pylist() == [1000, 1100, 1200]
+
+
+def test_parquet_reads_selected_columns(tmp_path):
+    path = str(tmp_path / "sales.parquet")
+    with ColumnarWriter(path, SALE_SCHEMA) as writer:
+        writer.write(sales_to_batch([_sale(1), _sale(2)]))
+
+    table = read_parquet(path, columns=["id", "price"])
+    assert table.column_names == ["id", "price"]
+    assert table.column("id").to_pylist() == ["1", "2"]
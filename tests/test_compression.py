@@ -0,0 +1,86 @@
+import asyncio
+import gzip
+import json
+import zlib
+import pytest
+from aiohttp import web
+from src.csfloat_api import parse_csgofloat_item
+from src.csfloat_api.client_config import ClientConfig
+from src.csfloat_api.compression import CompressionStats, decompress
+from src.csfloat_api.csfloat_client import Client
+from stand_in import StandIn
+
+_BODY = json.dumps([{"id": str(i), "price": 1000 + i} for i in range(200)]).encode()
+
+
+def test_decompress_encodings():
+    raw_deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    assert decompress(gzip.compress(_BODY), "gzip") == _BODY
+    assert decompress(zlib.compress(_BODY), "deflate") == _BODY
+    assert decompress(raw_deflate.compress(_BODY) + raw_deflate.flush(), "deflate") == _BODY
+    # Кодировки применены слева направо, снимаются в обратном порядке
+    assert decompress(gzip.compress(zlib.compress(_BODY)), "deflate, gzip") == _BODY
+    assert decompress(_BODY, None) == _BODY
+    assert decompress(_BODY, "identity") == _BODY
+
+
+def test_decompress_rejects_bad_input():
+    with pytest.raises(ValueError):
+        decompress(_BODY, "gzip")
+    with pytest.raises(ValueError):
+        decompress(_BODY, "zstd")
+
+
+def test_stats_report_sorted_by_wire_bytes():
+    stats = CompressionStats()
+    stats.record("/listings", 100, 1000)
+    stats.record("/listings", 100, 1000)
+    stats.record("/me", None, 300)
+
+    assert stats.ratio("/listings") == 0.1
+    assert stats.ratio("/me") == 1.0
+    assert stats.ratio("/unknown") is None
+    assert [row["endpoint"] for row in stats.report()] == ["/me", "/listings"]
+    stats.reset()
+    assert stats.report() == []
+
+
+def _gzip_listings(request: web.Request) -> web.Response:
+    response = web.Response(body=gzip.compress(_BODY), content_type="application/json")
+    response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
+def test_client_counts_wire_and_decoded_bytes():
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/listings")] = _gzip_listings
+            async with Client("key", base_url=server.url) as client:
+                listings = await client.aio.get_all_listings(raw_response=True)
+                return listings, client.compression.report()
+
+    listings, report = asyncio.run(scenario())
+    assert len(listings) == 200
+    assert report[0]["decoded"] == len(_BODY)
+    assert report[0]["wire"] == len(gzip.compress(_BODY))
+
+
+def test_sales_history_sends_browser_headers():
+    seen = []
+
+    def sales(request):
+        seen.append(dict(request.headers))
+        return []
+
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/history/AK/sales")] = sales
+            config = ClientConfig(base_url=server.url)
+            return await asyncio.to_thread(parse_csgofloat_item.parse_item_by_name, "AK", config=config)
+
+    assert asyncio.run(scenario()) == []
+    headers = seen[0]
+    assert headers["User-Agent"] == parse_csgofloat_item.headers["User-Agent"]
+    assert headers["Referer"] == parse_csgofloat_item.headers["Referer"]
+    assert headers["Accept"] == "application/json, text/plain, */*"
+    assert "gzip" in headers["Accept-Encoding"]
@@ -0,0 +1,118 @@
+import asyncio
+import pytest
+from aiohttp import web
+from src.csfloat_api.csfloat_client import Client, ResponseError
+from src.csfloat_api.deadline import DeadlineExceeded, current_deadline, deadline, sleep_within_deadline, within_deadline
+from src.csfloat_api.latency import LatencyTracker, endpoint_key
+from stand_in import StandIn
+
+
+def test_endpoint_key_replaces_numeric_ids():
+    assert endpoint_key("/listings/123?x=1") == "/listings/{id}"
+    assert endpoint_key("/listings/123/bids") == "/listings/{id}/bids"
+    assert endpoint_key("/history/AK-47/sales") == "/history/AK-47/sales"
+
+
+def test_latency_quantile_needs_enough_samples():
+    tracker = LatencyTracker(window=10, min_samples=5)
+    for seconds in (0.1, 0.2, 0.3, 0.4):
+        tracker.record("/me", seconds)
+    assert tracker.quantile("/me", 0.95) is None
+    assert tracker.quantile("/listings", 0.5) is None
+    for seconds in range(1, 11):
+        tracker.record("/me", seconds)
+    # В окне только последние 10 замеров
+    assert tracker.quantile("/me", 0.0) == 1
+    assert tracker.quantile("/me", 0.95) == 10
+
+
+def test_nested_deadline_cannot_outlive_outer():
+    assert current_deadline() is None
+    with deadline(0.5) as outer:
+        with deadline(10) as inner:
+            assert inner is outer and current_deadline() is outer
+        with deadline(0.1) as inner:
+            assert inner is not outer and inner.remaining() <= 0.1
+        assert current_deadline() is outer
+    assert current_deadline() is None
+
+
+def test_within_deadline_cancels_slow_awaitable():
+    async def scenario():
+        assert await within_deadline(asyncio.sleep(0, result=1)) == 1
+        with deadline(0.05):
+            with pytest.raises(DeadlineExceeded):
+                await within_deadline(asyncio.sleep(5))
+            with pytest.raises(DeadlineExceeded):
+                await sleep_within_deadline(1)
+
+    asyncio.run(scenario())
+
+
+def _flaky(failures: int):
+    calls = []
+
+    def route(request):
+        calls.append(request.method)
+        if len(calls) <= failures:
+            return web.json_response({"message": "busy"}, status=503)
+        return {"id": "5"}
+
+    return route, calls
+
+
+def test_only_idempotent_requests_are_retried():
+    route, calls = _flaky(2)
+    offer, offers = _flaky(10)
+
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/listings/5")] = route
+            server.routes[("POST", "/offers")] = offer
+            async with Client("key", base_url=server.url, retries=2, retry_backoff=0) as client:
+                listing = await client.aio.get_specific_listing(5)
+                with pytest.raises(ResponseError):
+                    await client.aio.make_offer(listing_id=5, price=100)
+                return listing
+
+    assert asyncio.run(scenario()).id == "5"
+    assert calls == ["GET"] * 3
+    assert offers == ["POST"]
+
+
+def test_deadline_stops_retries():
+    route, calls = _flaky(10)
+
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/listings/5")] = route
+            async with Client("key", base_url=server.url, retries=5, retry_backoff=1) as client:
+                with deadline(0.5):
+                    await client.aio.get_specific_listing(5)
+
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(scenario())
+    assert len(calls) == 1
+
+
+def test_slow_get_is_hedged_after_its_quantile():
+    calls = []
+
+    async def slow(request):
+        await asyncio.sleep(1)
+        return {"id": "slow"}
+
+    def route(request):
+        calls.append(request.method)
+        return slow(request) if len(calls) == 1 else {"id": "5"}
+
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/listings/5")] = route
+            async with Client("key", base_url=server.url, hedging=True) as client:
+                for _ in range(20):
+                    client.latency.record("/listings/{id}", 0.05)
+                return await client.aio.get_specific_listing(5)
+
+    assert asyncio.run(scenario()).id == "5"
+    assert calls == ["GET", "GET"]
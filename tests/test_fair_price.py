@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from src.csfloat_api.fair_price import FairPriceModel
+from src.csfloat_api.models.history_sale_info import ItemSale
+from src.csfloat_api.models.listing import Listing
+
+
+def _listing(name: str, float_value: float) -> Listing:
+    return Listing(
+        data={"id": "1", "price": 1000, "item": {"market_hash_name": name, "float_value": float_value}},
+        validate=False,
+    )
+
+
+def test_empty_model_estimates_nan():
+    model = FairPriceModel.fit({})
+    assert len(model) == 0
+    estimates = model.estimate([_listing("AK", 0.1), _listing("M4", 0.2)])
+    assert estimates.shape == (2,)
+    assert np.isnan(estimates).all()
+
+
+def test_unknown_items_estimate_nan():
+    model = FairPriceModel(
+        names=["AK"],
+        coefficients=np.array([[1000.0, -500.0, 0.5, 0.2]]),
+        samples=np.array([20]),
+    )
+    estimates = model.estimate([_listing("AK", 0.1), _listing("M4", 0.1)])
+    assert estimates[0] == pytest.approx(1050.0)
+    assert np.isnan(estimates[1])
+
+
+def _sale(i: int, float_value: float, price: int) -> ItemSale:
+    return ItemSale(
+        data={
+            "id": str(i),
+            "price": price,
+            "sold_at": f"2024-01-{1 + i % 28:02d}T00:00:00+00:00",
+            "item": {"float_value": float_value, "stickers": []},
+        },
+        validate=False,
+    )
+
+
+def test_fit_learns_float_adjustment():
+    # Цена падает на 20 центов за каждую 0.001 float: 1200 при 0.0, 1000 при 0.01
+    floats = np.linspace(0.0, 0.01, 12)
+    sales = [_sale(i, float(value), int(round(1200 - 20000 * value))) for i, value in enumerate(floats)]
+
+    model = FairPriceModel.fit({"AK": sales, "M4": sales[:3]})
+
+    assert model.names == ["AK"]
+    assert model.samples("AK") == 12
+    low, mid, high = model.estimate([_listing("AK", 0.0), _listing("AK", 0.005), _listing("AK", 0.01)])
+    assert low == pytest.approx(1200.0, abs=1.0)
+    assert mid == pytest.approx(1100.0, abs=1.0)
+    assert high == pytest.approx(1000.0, abs=1.0)
@@ -0,0 +1,73 @@
+import asyncio
+import pytest
+from src.csfloat_api.csfloat_client import Client
+from src.csfloat_api.listing_query import ListingQuery, listing_query
+from stand_in import StandIn
+
+
+def test_filters_are_percent_encoded_once():
+    query = ListingQuery(market_hash_name="AK-47 | Redline (Field-Tested)", def_index=[7, 9], min_float=0.1)
+    assert query.path == (
+        "/listings?page=0&limit=50&sort_by=best_deal&category=0&type=buy_now"
+        "&def_index=7,9&min_float=0.1&market_hash_name=AK-47%20%7C%20Redline%20%28Field-Tested%29"
+    )
+    assert query.filters == (
+        ("def_index", (7, 9)), ("min_float", 0.1), ("market_hash_name", "AK-47 | Redline (Field-Tested)"),
+    )
+
+
+def test_equal_filters_hash_equal():
+    first = ListingQuery(market_hash_name="AK", def_index=[7, 9])
+    second = ListingQuery(market_hash_name="AK", def_index=(7, 9))
+    assert first == second and hash(first) == hash(second)
+    assert first != ListingQuery(market_hash_name="AK", def_index=(7, 9), limit=10)
+    assert first != first.with_page(1)
+    assert len({first, second, first.with_page(1)}) == 2
+
+
+def test_next_page_keeps_filters():
+    query = ListingQuery(sort_by="expires_soon", type_="auction", limit=20)
+    following = query.next_page().next_page()
+    assert following.page == 2
+    assert following.path == query.path.replace("page=0", "page=2")
+    assert following == ListingQuery(sort_by="expires_soon", type_="auction", limit=20, page=2)
+    assert query.with_page(0) is query
+    with pytest.raises(ValueError):
+        query.with_page(-1)
+
+
+@pytest.mark.parametrize("arguments", [
+    {"limit": 0}, {"limit": 51}, {"page": -1}, {"sort_by": "cheapest"}, {"category": 4}, {"type_": "trade"},
+])
+def test_invalid_arguments_raise(arguments):
+    with pytest.raises(ValueError):
+        ListingQuery(**arguments)
+
+
+def test_listing_query_is_cached():
+    assert listing_query(market_hash_name="AK", def_index=[1, 2]) is listing_query(market_hash_name="AK", def_index=(1, 2))
+
+
+def test_unhashable_filter_falls_back_to_uncached_query():
+    first = listing_query(rarity=["a"])
+    second = listing_query(rarity=["a"])
+    assert first is not second
+    assert first.path.endswith("&rarity=%5B%27a%27%5D")
+    with pytest.raises(TypeError):
+        hash(first)
+
+
+def test_get_all_listings_rejects_out_of_range_limit():
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/listings")] = lambda request: []
+            async with Client("key", base_url=server.url) as client:
+                with pytest.raises(ValueError):
+                    await client.aio.get_all_listings(limit=100)
+                await client.aio.get_all_listings(query=ListingQuery(market_hash_name="AK", limit=5))
+            return server.requests
+
+    requests = asyncio.run(scenario())
+    assert [path for _, path, _ in requests] == [
+        "/listings?page=0&limit=5&sort_by=best_deal&category=0&type=buy_now&market_hash_name=AK",
+    ]
@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+import pytest
+from src.csfloat_api.models.base import ValidationError, parse_datetime
+from src.csfloat_api.models.history_sale_info import ItemSale
+from src.csfloat_api.models.item import Item
+from src.csfloat_api.models.my_trades_response import TradesResponse
+from src.csfloat_api.models.similar_buy_orders import SimilarBuyOrder, SimilarBuyOrders
+
+_SALE = {
+    "id": "1",
+    "created_at": "2024-12-06T23:35:14.672965Z",
+    "type": "buy_now",
+    "price": 1234,
+    "state": "sold",
+    "reference": {},
+    "item": {"market_hash_name": "AK", "float_value": 0.1},
+    "is_seller": False,
+    "is_watchlisted": False,
+    "watchers": 0,
+    "sold_at": "2024-12-07T01:00:00.5Z",
+}
+
+
+def test_parse_datetime_accepts_any_fraction_length():
+    assert parse_datetime("2024-12-07T01:00:00.5Z") == datetime(2024, 12, 7, 1, 0, 0, 500000, tzinfo=timezone.utc)
+    assert parse_datetime("2024-12-06T23:35:14.6729651Z").microsecond == 672965
+    assert parse_datetime(None) is None
+
+
+def test_schema_checks_required_fields_and_types():
+    with pytest.raises(ValidationError, match="SimilarBuyOrder.qty: field required"):
+        SimilarBuyOrder(data={"market_hash_name": "AK", "price": 1})
+    with pytest.raises(ValidationError, match="expected int, got str"):
+        SimilarBuyOrder(data={"market_hash_name": "AK", "price": "1", "qty": 1})
+    with pytest.raises(ValidationError, match="expected an object"):
+        SimilarBuyOrder.validate([])
+    # Без проверки модель собирается как есть
+    assert SimilarBuyOrder(data={"price": "1"}, validate=False).price == "1"
+
+
+def test_nested_objects_and_lists_are_validated():
+    with pytest.raises(ValidationError, match="SimilarBuyOrder"):
+        SimilarBuyOrders(data={"data": [{"market_hash_name": "AK", "qty": 1, "price": 1}, {"qty": 1}]})
+    with pytest.raises(ValidationError):
+        TradesResponse(data={"trades": [{"id": "1"}], "count": 1})
+
+
+def test_hand_rolled_models_do_not_validate_by_default():
+    item = Item(data={"float_value": "bad", "stickers": [{"reference": {"price": 150}}, {"reference": {}}]})
+    assert item.float_value == "bad"
+    assert item.total_sticker_price == 1.5
+
+
+def test_item_sale_fields():
+    sale = ItemSale(data=_SALE)
+    assert sale.sold_at_ts == int(datetime(2024, 12, 7, 1, tzinfo=timezone.utc).timestamp())
+    assert sale.price_normal == 12.34
+    assert sale.item.float_value == 0.1
+    with pytest.raises(ValidationError, match="ItemSale.watchers"):
+        ItemSale(data={**_SALE, "watchers": None})
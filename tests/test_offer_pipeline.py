@@ -0,0 +1,75 @@
+import asyncio
+from src.csfloat_api.csfloat_client import Client
+from src.csfloat_api.models.listing import Listing
+from src.csfloat_api.offer_pipeline import OfferPipeline
+from stand_in import StandIn
+
+
+def _listing(listing_id: int) -> Listing:
+    return Listing(data={"id": str(listing_id), "price": 1000, "type": "buy_now", "state": "listed"}, validate=False)
+
+
+def test_submit_without_open_closes_its_session_and_skips_warm_up():
+    async def scenario():
+        async with StandIn() as server:
+            async with Client("key", base_url=server.url) as client:
+                pipeline = OfferPipeline(client)
+                pipeline.remember([_listing(1)])
+                results = await pipeline.submit([(1, 900)])
+                return server, results, pipeline.is_open
+
+    server, results, is_open = asyncio.run(scenario())
+    assert results[0].ok and results[0].sent
+    assert not is_open
+    assert [(method, path) for method, path, _ in server.requests] == [("POST", "/offers")]
+
+
+def test_opened_pipeline_warms_up_once():
+    async def scenario():
+        async with StandIn() as server:
+            async with Client("key", base_url=server.url) as client:
+                pipeline = OfferPipeline(client)
+                pipeline.remember([_listing(1), _listing(2)])
+                async with pipeline:
+                    await pipeline.submit([(1, 900)])
+                    await pipeline.submit([(2, 950)])
+                    still_open = pipeline.is_open
+                return server, still_open
+
+    server, still_open = asyncio.run(scenario())
+    assert still_open
+    assert [path for _, path, _ in server.requests] == ["/meta/exchange-rates", "/offers", "/offers"]
+
+
+def test_away_seller_is_rejected_locally():
+    listing = Listing(
+        data={"id": "4", "price": 1000, "type": "buy_now", "state": "listed", "seller": {"away": True}},
+        validate=False,
+    )
+    assert listing.seller_raw == {"away": True}
+
+    async def scenario():
+        async with StandIn() as server:
+            async with Client("key", base_url=server.url) as client:
+                pipeline = OfferPipeline(client)
+                pipeline.remember([listing])
+                return server, await pipeline.submit_one(4, 900)
+
+    server, result = asyncio.run(scenario())
+    assert not result.ok and not result.sent
+    assert server.requests == []
+
+
+def test_make_offer_uses_given_session():
+    async def scenario():
+        async with StandIn() as server:
+            async with Client("key", base_url=server.url) as client:
+                session = client.make_session(limit=1)
+                try:
+                    response = await client.aio.make_offer(listing_id=7, price=500, session=session)
+                finally:
+                    await session.close()
+                return response
+
+    response = asyncio.run(scenario())
+    assert response["body"] == {"contract_id": "7", "price": 500, "cancel_previous_offer": False}
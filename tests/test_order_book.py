@@ -0,0 +1,61 @@
+import asyncio
+import logging
+from aiohttp import web
+from src.csfloat_api.csfloat_client import Client
+from src.csfloat_api.order_book import OrderBookMaintainer
+from stand_in import StandIn
+
+
+def test_failed_refresh_is_logged_with_key(caplog):
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/listings/1/buy-orders")] = lambda request: [{"price": 100, "qty": 2}]
+            server.routes[("GET", "/listings/2/buy-orders")] = lambda request: web.json_response(
+                {"message": "gone"}, status=404
+            )
+            async with Client("key", base_url=server.url) as client:
+                maintainer = OrderBookMaintainer(client)
+                good = maintainer.track_listing(1)
+                bad = maintainer.track_listing(2)
+                changes = await maintainer.run_once(now=0.0)
+                return good, bad, changes, maintainer
+
+    with caplog.at_level(logging.WARNING, logger="src.csfloat_api.order_book"):
+        good, bad, changes, maintainer = asyncio.run(scenario())
+
+    assert changes == {good: 1}
+    assert maintainer.book(good).best_bid == 100
+    assert any(repr(bad) in record.getMessage() for record in caplog.records)
+    # Ключ с ошибкой остаётся в расписании
+    assert maintainer.next_refresh_at() is not None
+
+
+def test_retracked_key_is_refreshed_once_on_simulated_clock():
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/listings/1/buy-orders")] = lambda request: [{"price": 100, "qty": 2}]
+            async with Client("key", base_url=server.url) as client:
+                maintainer = OrderBookMaintainer(client, min_interval=5.0, max_interval=60.0)
+                key = maintainer.track_listing(1)
+                await maintainer.run_once(now=1000.5)
+                scheduled = maintainer.next_refresh_at()
+                # Старая запись на 1005.5 остаётся в куче и должна пропускаться
+                maintainer.untrack(key)
+                maintainer.track_listing(1)
+                maintainer.track_listing(1)
+
+                times = []
+                while maintainer.next_refresh_at() <= 1100.0:
+                    now = maintainer.next_refresh_at()
+                    times.append(now)
+                    assert list(await maintainer.run_once(now=now)) == [key]
+                return server, key, scheduled, times, maintainer
+
+    server, key, scheduled, times, maintainer = asyncio.run(scenario())
+    # Расписание идёт по переданному now, а не по time.time()
+    assert scheduled == 1005.5
+    assert times[0] == 0.0
+    assert 1005.5 not in times
+    assert times == sorted(set(times))
+    assert maintainer.book(key).updated_at == times[-1]
+    assert len(server.requests) == len(times) + 1
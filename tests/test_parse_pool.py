@@ -0,0 +1,55 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from src.csfloat_api.csfloat_client import Client
+from src.csfloat_api.models.listing import Listing
+from src.csfloat_api.parse_pool import ParsePool, build_listing_columns, build_listings
+from stand_in import StandIn
+
+_LISTINGS = [{"id": str(i), "price": 100 + i, "item": {"market_hash_name": "AK", "paint_seed": i}} for i in range(50)]
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def test_small_bodies_are_parsed_inline():
+    executor = _CountingExecutor()
+    body = json.dumps(_LISTINGS).encode()
+    with ParsePool(executor=executor, threshold=len(body) + 1) as pool:
+        assert pool.parse_sync(body) == _LISTINGS
+        assert asyncio.run(pool.parse(body, build_listing_columns))["paint_seed"] == list(range(50))
+    assert executor.submitted == 0
+    executor.shutdown()
+
+
+def test_large_bodies_go_to_the_executor():
+    executor = _CountingExecutor()
+    body = json.dumps(_LISTINGS).encode()
+    with ParsePool(executor=executor, threshold=len(body)) as pool:
+        listings = pool.parse_sync(body, build_listings)
+        assert asyncio.run(pool.parse(body)) == _LISTINGS
+    assert [listing.price for listing in listings][:2] == [100, 101]
+    assert executor.submitted == 2
+    # Чужой executor пул не закрывает
+    assert executor.submit(int, "1").result() == 1
+    executor.shutdown()
+
+
+def test_client_builds_models_in_the_process_pool():
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/listings")] = lambda request: _LISTINGS
+            with ParsePool(max_workers=1, threshold=0) as pool:
+                async with Client("key", base_url=server.url, parse_pool=pool) as client:
+                    return await client.aio.get_all_listings()
+
+    listings = asyncio.run(scenario())
+    assert len(listings) == 50
+    assert isinstance(listings[0], Listing) and listings[0].item.paint_seed == 0
@@ -0,0 +1,76 @@
+import asyncio
+from src.csfloat_api.csfloat_client import Client
+from src.csfloat_api.listing_query import MAX_PAGE_LIMIT
+from src.csfloat_api.models.history_sale_info import ItemSale
+from src.csfloat_api.models.listing import Listing
+from src.csfloat_api.pattern_index import PatternIndex
+from stand_in import StandIn
+
+T0 = 1_800_000_000.0
+
+
+def _item(def_index, paint_seed, float_value=0.1):
+    return {"def_index": def_index, "paint_index": 44, "paint_seed": paint_seed, "float_value": float_value}
+
+
+def _listing(id, price, def_index=7, paint_seed=661):
+    return {"id": id, "price": price, "item": _item(def_index, paint_seed)}
+
+
+def test_listings_and_sales_are_indexed_by_pattern():
+    index = PatternIndex()
+    listings = [
+        Listing(data=_listing("1", 500), validate=False),
+        Listing(data=_listing("2", 300), validate=False),
+        Listing(data={"id": "3", "price": 1, "item": {"def_index": 7}}, validate=False),
+    ]
+    sales = [
+        ItemSale(data={"id": "s1", "price": 400, "sold_at": "2026-01-01T00:00:00Z", "item": _item(7, 661)}, validate=False),
+        ItemSale(data={"id": "s2", "price": 450, "sold_at": "2026-02-01T00:00:00Z", "item": _item(7, 661)}, validate=False),
+    ]
+
+    assert index.add_listings(listings) == 2
+    assert index.add_sales(sales) == 2
+    entry = index.get((7, 44, 661))
+    assert [listing.id for listing in entry.listings] == ["2", "1"]
+    assert entry.lowest_price == 300
+    assert entry.last_sale.id == "s2"
+    assert index.query_tiers(def_index=7, paint_index=44, tiers={"tier1": [661, 670]}) == {"tier1": [entry]}
+
+
+def test_plan_refresh_groups_def_indexes_by_seed():
+    index = PatternIndex(max_age=100)
+    index.add_listings([Listing(data=_listing("1", 100, def_index=1, paint_seed=5), validate=False)])
+    index.get((1, 44, 5))._refreshed_at = T0
+
+    keys = [(7, 44, 661), (9, 44, 661), (7, 44, 670), (1, 44, 5), (7, 44, 661)]
+    assert index.plan_refresh(keys, now=T0 + 50) == [(44, 661, (7, 9)), (44, 670, (7,))]
+    assert (44, 5, (1,)) in index.plan_refresh(keys, now=T0 + 100)
+
+
+def test_refresh_pages_and_replaces_listings():
+    pages = [
+        [_listing(str(i), 100 + i, def_index=7 + i % 2) for i in range(MAX_PAGE_LIMIT)],
+        [_listing("last", 99, def_index=9)],
+    ]
+
+    def listings(request):
+        return pages[int(request.query["page"])]
+
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/listings")] = listings
+            client = Client("key", base_url=server.url)
+            index = PatternIndex()
+            index.add_listings([Listing(data=_listing("sold", 50), validate=False)])
+            # Синхронный клиент делает свой asyncio.run, поэтому - в отдельном потоке
+            calls = await asyncio.to_thread(index.refresh, client, [(7, 44, 661), (9, 44, 661)], now=T0)
+            return index, calls, server.requests
+
+    index, calls, requests = asyncio.run(scenario())
+    assert calls == 2
+    assert "def_index=7,9&paint_seed=661&paint_index=44" in requests[0][1]
+    assert "page=1" in requests[1][1]
+    assert index.get((7, 44, 661)).lowest_price == 100
+    assert index.get((9, 44, 661)).lowest_price == 99
+    assert index.stale_keys([(7, 44, 661), (9, 44, 661)], now=T0 + 10) == []
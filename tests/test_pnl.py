@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+from src.csfloat_api.models.my_trades_response import Trade
+from src.csfloat_api.pnl import PnLLedger
+
+T0 = 1_700_000_000
+
+
+def _trade(trade_id: str, price: int, ts: int, *, asset_id: str, name: str = "AK") -> Trade:
+    accepted_at = datetime.fromtimestamp(T0 + ts, timezone.utc).isoformat()
+    return Trade(
+        data={
+            "id": trade_id,
+            "state": "verified",
+            "accepted_at": accepted_at,
+            "contract": {"price": price, "item": {"market_hash_name": name, "asset_id": asset_id}},
+        },
+        validate=False,
+    )
+
+
+def test_asset_match_takes_precedence_over_fifo():
+    ledger = PnLLedger()
+    ledger.add_trades([_trade("b1", 100, 0, asset_id="a1"), _trade("b2", 120, 10, asset_id="a2")], side="buy")
+    # Продан второй купленный предмет, затем первый
+    ledger.add_trades([_trade("s1", 150, 20, asset_id="a2")], side="sell")
+    ledger.add_trades([_trade("s2", 130, 30, asset_id="a3")], side="sell")
+
+    matches = ledger.matches()
+    assert matches["buy"].tolist() == [1, 0]
+    assert matches["pnl"].tolist() == [30.0, 30.0]
+    assert ledger.total.open_count == 0
+    assert ledger.total.realized == 60.0
+
+
+def test_late_buy_closes_waiting_sell():
+    ledger = PnLLedger(sell_fee=0.1)
+    ledger.add_trades([_trade("s1", 200, 50, asset_id="a1")], side="sell")
+    assert ledger.total.unmatched_sells == 1
+    ledger.add_trades([_trade("b1", 100, 0, asset_id="a1")], side="buy")
+
+    stats = ledger.stats("AK")
+    assert stats.unmatched_sells == 0
+    assert stats.matched == 1
+    assert stats.realized == 80.0
+    assert stats.average_holding == 50
+    # Повторно пришедшие трейды пропускаются
+    assert ledger.add_trades([_trade("b1", 100, 0, asset_id="a1")], side="buy") == 0
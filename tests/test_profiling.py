@@ -0,0 +1,58 @@
+import asyncio
+import pytest
+from src.csfloat_api.client_config import ClientConfig
+from src.csfloat_api.csfloat_client import Client
+from src.csfloat_api.profiling import Profiler, current_profiler
+from stand_in import StandIn
+
+
+def test_spans_are_summed_per_endpoint_and_phase():
+    profiler = Profiler()
+    profiler.add_span("/listings", "decode", (0.0, 0.0), (0.5, 0.25))
+    profiler.add_span("/listings", "decode", (1.0, 1.0), (1.5, 1.25))
+    profiler.add_span("/me", "connect", (0.0, 0.0), (0.1, 0.0))
+
+    assert profiler.report()[0] == {"endpoint": "/listings", "phase": "decode", "count": 2, "wall": 1.0, "cpu": 0.5}
+    assert profiler.folded() == ["csfloat;/listings;decode 1000000", "csfloat;/me;connect 100000"]
+    assert profiler.folded(metric="cpu") == ["csfloat;/listings;decode 500000"]
+    with pytest.raises(ValueError):
+        profiler.folded(metric="rss")
+
+
+def test_profiler_is_active_only_inside_its_block():
+    assert current_profiler() is None
+    with Profiler() as profiler:
+        assert current_profiler() is profiler
+    assert current_profiler() is None
+
+
+def test_request_phases_are_keyed_by_endpoint():
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/listings/5")] = lambda request: {"id": "5"}
+            async with Client("key", base_url=server.url) as client:
+                with Profiler() as profiler:
+                    await client.aio.get_specific_listing(5)
+                    await client.aio.get_specific_listing(6)
+                return profiler.report()
+
+    phases = {(row["endpoint"], row["phase"]): row["count"] for row in asyncio.run(scenario())}
+    assert phases[("/listings/{id}", "rate-wait")] == 2
+    assert phases[("/listings/{id}", "decode")] == 2
+    assert phases[("/listings/{id}", "model-build")] == 2
+
+
+def test_sync_sleep_row_is_keyed_by_method():
+    async def scenario():
+        async with StandIn() as server:
+            client = Client("key", config=ClientConfig(sync_pause=0.01), base_url=server.url)
+            with Profiler() as profiler:
+                # Синхронный вызов делает свой asyncio.run, поэтому - в отдельном потоке
+                await asyncio.to_thread(client.get_exchange_rates)
+            return profiler.report()
+
+    rows = {(row["endpoint"], row["phase"]): row for row in asyncio.run(scenario())}
+    sleep = rows[("get_exchange_rates()", "sync-sleep")]
+    assert sleep["count"] == 1
+    assert sleep["wall"] >= 0.01
+    assert ("/meta/exchange-rates", "rate-wait") in rows
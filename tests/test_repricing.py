@@ -0,0 +1,92 @@
+import asyncio
+from aiohttp import web
+from src.csfloat_api.csfloat_client import Client
+from src.csfloat_api.repricing import BuyOrderRepricer, RepriceTarget
+from stand_in import StandIn
+
+
+def _order(order_id: str, price: int) -> dict:
+    return {"id": order_id, "created_at": "2024-01-01T00:00:00Z", "market_hash_name": "A", "qty": 1, "price": price}
+
+
+def _stand_in(create) -> StandIn:
+    server = StandIn()
+    server.routes[("GET", "/me/buy-orders")] = lambda request: {"orders": [_order("o1", 100)], "count": 1}
+    server.routes[("POST", "/buy-orders/similar-orders")] = lambda request: {
+        "data": [{"price": 100, "qty": 1}, {"price": 120, "qty": 3}]
+    }
+    server.routes[("DELETE", "/buy-orders/o1")] = lambda request: {"message": "successfully removed the order"}
+    server.routes[("POST", "/buy-orders")] = create
+    return server
+
+
+def test_old_order_restored_when_create_fails():
+    created = []
+
+    def create(request):
+        # Новая цена отклоняется, восстановление старой проходит
+        created.append(request)
+        if len(created) == 1:
+            return web.json_response({"message": "insufficient balance"}, status=400)
+        return _order("o3", 100)
+
+    async def scenario():
+        async with _stand_in(create) as server:
+            async with Client("key", base_url=server.url) as client:
+                repricer = BuyOrderRepricer(client)
+                actions = await repricer.run_cycle([RepriceTarget("A", max_price=150)])
+                return server, actions, repricer
+
+    server, actions, repricer = asyncio.run(scenario())
+    assert [action.price for action in actions] == [121]
+    assert not actions[0].ok
+    assert len(server.calls("POST", "/buy-orders")) == 2
+    assert server.requests[-1][0] == "POST"
+    assert repricer.orders["A"].id == "o3"
+    assert repricer.orders["A"].price == 100
+
+
+def test_reprice_replaces_order():
+    async def scenario():
+        async with _stand_in(lambda request: _order("o2", 121)) as server:
+            async with Client("key", base_url=server.url) as client:
+                repricer = BuyOrderRepricer(client)
+                actions = await repricer.run_cycle([RepriceTarget("A", max_price=150)])
+                return server, actions, repricer
+
+    server, actions, repricer = asyncio.run(scenario())
+    assert actions[0].ok
+    assert len(server.calls("DELETE", "/buy-orders/o1")) == 1
+    assert len(server.calls("POST", "/buy-orders")) == 1
+    assert repricer.orders["A"].id == "o2"
+
+
+def test_competitor_at_own_price_is_not_skipped():
+    # Конкурент стоит на нашей цене 100: уровень (100, 3) содержит и наш ордер (qty 1)
+    server = _stand_in(lambda request: _order("o2", 101))
+    server.routes[("POST", "/buy-orders/similar-orders")] = lambda request: {"data": [{"price": 100, "qty": 3}]}
+
+    async def scenario():
+        async with server:
+            async with Client("key", base_url=server.url) as client:
+                repricer = BuyOrderRepricer(client)
+                return await repricer.run_cycle([RepriceTarget("A", max_price=150)])
+
+    actions = asyncio.run(scenario())
+    assert [action.price for action in actions] == [101]
+    assert actions[0].ok
+
+
+def test_own_order_alone_on_its_level_is_skipped():
+    server = _stand_in(lambda request: _order("o2", 90))
+    server.routes[("POST", "/buy-orders/similar-orders")] = lambda request: {"data": [{"price": 100, "qty": 1}]}
+
+    async def scenario():
+        async with server:
+            async with Client("key", base_url=server.url) as client:
+                repricer = BuyOrderRepricer(client)
+                return server, await repricer.run_cycle([RepriceTarget("A", min_price=90, max_price=150)])
+
+    server, actions = asyncio.run(scenario())
+    # Конкурентов нет - цена опускается до минимума
+    assert [action.price for action in actions] == [90]
@@ -0,0 +1,57 @@
+import asyncio
+import time
+from src.csfloat_api.rate_limit import RateBudget
+from src.csfloat_api.scheduler import BackgroundPreempted, Priority, RequestScheduler
+
+
+def _budget(remaining: int, reset_in: float) -> RateBudget:
+    budget = RateBudget()
+    budget.update({
+        "X-Ratelimit-Limit": "100",
+        "X-Ratelimit-Remaining": str(remaining),
+        "X-Ratelimit-Reset": str(time.time() + reset_in),
+    })
+    return budget
+
+
+def test_background_on_idle_scheduler_is_not_preempted():
+    async def scenario():
+        scheduler = RequestScheduler(_budget(50, 60), background_reserve=0, max_queued_background=0)
+        await asyncio.wait_for(scheduler.acquire(Priority.BACKGROUND), timeout=1)
+
+    asyncio.run(scenario())
+
+
+def test_background_is_not_preempted_while_budget_serves_everyone():
+    async def scenario():
+        scheduler = RequestScheduler(_budget(50, 60), background_reserve=0, max_queued_background=1)
+        jobs = [scheduler.acquire(Priority.BACKGROUND) for _ in range(3)]
+        jobs += [scheduler.acquire(Priority.INTERACTIVE) for _ in range(3)]
+        return await asyncio.wait_for(asyncio.gather(*jobs, return_exceptions=True), timeout=1)
+
+    assert all(result is None for result in asyncio.run(scenario()))
+
+
+def test_oldest_background_preempted_when_urgent_work_waits_on_budget():
+    async def scenario():
+        scheduler = RequestScheduler(_budget(0, 0.3), background_reserve=0, max_queued_background=1)
+        order = []
+
+        async def job(priority, name):
+            try:
+                await scheduler.acquire(priority)
+                order.append(name)
+            except BackgroundPreempted:
+                order.append(f"x{name}")
+
+        tasks = [asyncio.create_task(job(Priority.BACKGROUND, f"b{i}")) for i in range(3)]
+        await asyncio.sleep(0.05)
+        # Пока ждут только фоновые, никто не вытесняется
+        assert order == []
+        tasks.append(asyncio.create_task(job(Priority.CRITICAL, "c")))
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=2)
+        return order
+
+    order = asyncio.run(scenario())
+    assert order[:2] == ["xb0", "xb1"]
+    assert order[2:] == ["c", "b2"]
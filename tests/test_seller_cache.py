@@ -0,0 +1,78 @@
+from src.csfloat_api.models.listing import Listing
+from src.csfloat_api.models.seller import Seller
+from src.csfloat_api.seller_cache import SellerCache, reliability_score
+
+
+def _seller(steam_id=None, obfuscated_id="obf", verified=98, failed=2, **extra):
+    raw = {"obfuscated_id": obfuscated_id, "statistics": {"total_verified_trades": verified, "total_failed_trades": failed}}
+    if steam_id is not None:
+        raw["steam_id"] = steam_id
+    raw.update(extra)
+    return raw
+
+
+def _listing(seller):
+    return Listing(data={"id": "1", "price": 100, "seller": seller}, validate=False)
+
+
+def test_reliability_score_is_smoothed():
+    assert reliability_score({}) == 0.5
+    assert round(reliability_score({"total_verified_trades": 98, "total_failed_trades": 2}), 2) == 0.97
+
+
+def test_unchanged_seller_is_a_hit():
+    cache = SellerCache()
+    first = cache.intern(_seller("7"))
+    assert cache.intern(_seller("7")) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    updated = cache.intern(_seller("7", verified=99))
+    assert updated is not first and updated.verified_trades == 99
+    assert cache.misses == 2 and len(cache) == 1
+    assert cache.intern({}) is None and cache.intern({"username": "x"}) is None
+
+
+def test_obfuscated_only_record_is_merged_into_steam_id():
+    cache = SellerCache()
+    cache.intern(_seller(obfuscated_id="obf"))
+    record = cache.intern(_seller("7", obfuscated_id="obf"))
+
+    assert len(cache) == 1
+    assert cache.get("obf") is record and cache.get("7") is record
+    assert cache.intern(_seller("7", obfuscated_id="obf")) is record
+
+
+def test_thresholds_decide_trusted():
+    cache = SellerCache(min_score=0.9, min_verified_trades=20, max_median_trade_time=600, allow_away=False)
+    assert cache.intern(_seller("1", statistics={"total_verified_trades": 50, "median_trade_time": 300})).trusted
+    assert not cache.intern(_seller("2", verified=10, failed=0)).trusted
+    assert not cache.intern(_seller("3", verified=50, failed=20)).trusted
+    assert not cache.intern(_seller("4", statistics={"total_verified_trades": 50})).trusted
+    assert not cache.intern(_seller("5", statistics={"total_verified_trades": 50, "median_trade_time": 300}, away=True)).trusted
+
+
+def test_attach_shares_one_seller_and_filter_drops_unknown():
+    cache = SellerCache(min_verified_trades=20)
+    listings = cache.attach([_listing(_seller("7")), _listing(_seller("7")), _listing(None)])
+
+    assert listings[0].seller is listings[1].seller
+    assert isinstance(listings[0].seller, Seller)
+    assert cache.filter(listings) == listings[:2]
+    assert cache.score(listings[2]) is None
+
+
+def test_oldest_seller_and_its_alias_are_evicted():
+    cache = SellerCache(max_entries=2)
+    cache.intern(_seller("1", obfuscated_id="a"))
+    cache.intern(_seller("2", obfuscated_id="b"))
+    cache.intern(_seller("1", obfuscated_id="a"))
+    cache.intern(_seller("3", obfuscated_id="c"))
+
+    assert len(cache) == 2
+    assert cache.get("2") is None and cache.get("b") is None
+    assert cache.get("a") is cache.get("1")
+
+
+def test_missing_statistics_give_empty_statistics():
+    statistics = Seller(data={"steam_id": "7"}, validate=False).statistics
+    assert statistics.total_verified_trades is None
@@ -0,0 +1,68 @@
+import asyncio
+import json
+import os
+import threading
+import pytest
+from src.csfloat_api.models.listing import Listing
+from src.csfloat_api.shared_snapshot import SnapshotPublisher, SnapshotReader
+
+
+def _listings(*prices):
+    return [
+        Listing(data={"id": str(i), "price": price, "item": {"market_hash_name": "AK"}}, validate=False)
+        for i, price in enumerate(prices)
+    ]
+
+
+def test_reader_maps_the_published_version(tmp_path):
+    publisher = SnapshotPublisher(str(tmp_path))
+    reader = SnapshotReader(str(tmp_path))
+    assert reader.current() is None and reader.version == 0
+
+    assert publisher.publish(_listings(100, 200)) == 1
+    snapshot = reader.current()
+    assert snapshot.version == 1 and len(snapshot) == 2
+    assert snapshot.table.column("price").to_pylist() == [100, 200]
+    assert not reader.refresh()
+
+    publisher.publish(_listings(300))
+    assert reader.refresh()
+    # Старый снимок остаётся читаемым
+    assert snapshot.table.column("price").to_pylist() == [100, 200]
+    assert reader.snapshot.table.column("price").to_pylist() == [300]
+
+
+def test_old_segments_are_removed_and_versions_continue(tmp_path):
+    publisher = SnapshotPublisher(str(tmp_path), keep=2)
+    for price in (1, 2, 3, 4):
+        publisher.publish(_listings(price))
+    assert sorted(name for name in os.listdir(tmp_path) if name.endswith(".arrow")) == [
+        "snapshot-3.arrow", "snapshot-4.arrow",
+    ]
+    assert SnapshotPublisher(str(tmp_path)).publish(_listings(5)) == 5
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    (tmp_path / "HEAD").write_text(json.dumps({"format": 99, "version": 1}))
+    with pytest.raises(ValueError):
+        SnapshotReader(str(tmp_path)).refresh()
+
+
+def test_wait_for_version(tmp_path):
+    publisher = SnapshotPublisher(str(tmp_path))
+    reader = SnapshotReader(str(tmp_path), poll_interval=0.01)
+    with pytest.raises(TimeoutError):
+        reader.wait_for_version(timeout=0.05)
+
+    timer = threading.Timer(0.05, publisher.publish, args=(_listings(100),))
+    timer.start()
+    assert reader.wait_for_version(timeout=5).version == 1
+    timer.join()
+
+    async def scenario():
+        asyncio.get_running_loop().call_later(0.05, publisher.publish, _listings(200))
+        return await reader.wait_for_version_async(timeout=5)
+
+    assert asyncio.run(scenario()).version == 2
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(reader.wait_for_version_async(timeout=0.05))
@@ -0,0 +1,144 @@
+import asyncio
+import os
+import subprocess
+import sys
+import aiohttp
+from aiohttp import web
+from src.csfloat_api.sidecar import Sidecar
+from stand_in import StandIn
+
+
+async def _serve(sidecar: Sidecar):
+    runner = web.AppRunner(sidecar.make_app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def test_identical_gets_share_one_upstream_call():
+    async def scenario():
+        async with StandIn() as server:
+            calls = []
+
+            def listings(request):
+                calls.append(request.path_qs)
+                return [{"id": "1"}]
+
+            server.routes[("GET", "/listings")] = listings
+            sidecar = Sidecar("key", upstream=server.url, ttls={r"/listings": 5.0})
+            runner, url = await _serve(sidecar)
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async def get():
+                        async with session.get(f"{url}/listings?limit=3") as response:
+                            return response.status, response.headers["X-Sidecar-Cache"], await response.json()
+
+                    first = await asyncio.gather(*(get() for _ in range(10)))
+                    again = await get()
+            finally:
+                await runner.cleanup()
+            return calls, first, again, sidecar.stats
+
+    calls, first, again, stats = asyncio.run(scenario())
+    assert calls == ["/api/v1/listings?limit=3"]
+    assert all(status == 200 and body == [{"id": "1"}] for status, _, body in first)
+    assert again[1] == "hit"
+    assert stats["upstream"] == 1
+
+
+def test_upstream_goes_through_client_request():
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/listings/7")] = lambda request: web.json_response(
+                {"message": "not found"}, status=404
+            )
+            sidecar = Sidecar("key", upstream=server.url, ttls={r"/listings/\d+": 5.0})
+            runner, url = await _serve(sidecar)
+            try:
+                async with aiohttp.ClientSession() as session:
+                    statuses = []
+                    for _ in range(2):
+                        async with session.get(f"{url}/listings/7") as response:
+                            statuses.append(response.status)
+            finally:
+                await runner.cleanup()
+            return server, sidecar, statuses
+
+    server, sidecar, statuses = asyncio.run(scenario())
+    # Ошибка upstream передаётся как есть и не кэшируется
+    assert statuses == [404, 404]
+    assert len(server.calls("GET", "/listings/7")) == 2
+    assert all(key == "key" for _, _, key in server.requests)
+    # Запрос прошёл через Client._request: бюджет и статистика клиента обновлены
+    assert sidecar.client.rate_budget.remaining == 98
+    assert sidecar.client.compression.report()[0]["responses"] == 2
+
+
+def test_writes_are_rejected_unless_allowed():
+    async def scenario(allow_writes: bool):
+        async with StandIn() as server:
+            sidecar = Sidecar("key", upstream=server.url, allow_writes=allow_writes)
+            runner, url = await _serve(sidecar)
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with session.post(f"{url}/offers", json={"price": 3}) as response:
+                        status = response.status
+                    async with session.delete(f"{url}/listings/5") as response:
+                        deleted = response.status
+            finally:
+                await runner.cleanup()
+            return status, deleted, len(server.requests)
+
+    assert asyncio.run(scenario(False)) == (405, 405, 0)
+    assert asyncio.run(scenario(True)) == (200, 200, 2)
+
+
+def test_importing_sidecar_does_not_need_api_key_env():
+    env = {name: value for name, value in os.environ.items() if name != "CSFLOT_API"}
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    result = subprocess.run(
+        [sys.executable, "-c", "from src.csfloat_api.sidecar import main; main(['--api-key', 'x', '--help'])"],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "--allow-writes" in result.stdout
+
+
+class _HangingFirstCall(Sidecar):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.upstream_calls = 0
+
+    async def _upstream(self, method, path_qs, json_data):
+        self.upstream_calls += 1
+        if self.upstream_calls == 1:
+            await asyncio.Event().wait()
+        await asyncio.sleep(0.01)
+        return await super()._upstream(method, path_qs, json_data)
+
+
+def test_waiters_retry_when_leader_is_cancelled():
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/listings")] = lambda request: [{"id": "1"}]
+            sidecar = _HangingFirstCall("key", upstream=server.url)
+            async with sidecar.client:
+                leader = asyncio.ensure_future(sidecar._cached_get("/listings?limit=3", 5.0))
+                await asyncio.sleep(0.01)
+                waiters = [asyncio.ensure_future(sidecar._cached_get("/listings?limit=3", 5.0)) for _ in range(3)]
+                await asyncio.sleep(0.01)
+                # Клиент ведущего запроса отключился
+                leader.cancel()
+                results = await asyncio.wait_for(asyncio.gather(*waiters), timeout=10)
+            return leader, results, sidecar.upstream_calls
+
+    leader, results, upstream_calls = asyncio.run(scenario())
+    assert leader.cancelled()
+    assert all(result.status == 200 for result, _ in results)
+    assert sorted(source for _, source in results) == ["coalesced", "coalesced", "miss"]
+    assert upstream_calls == 2
@@ -0,0 +1,122 @@
+import asyncio
+import pytest
+from aiohttp import web
+from src.csfloat_api.csfloat_client import Client
+from src.csfloat_api.trade_watcher import TradeWatcher
+from stand_in import StandIn
+
+T0 = 1_000_000.0
+
+
+class _Account:
+    """Счётчики и незавершённые трейды, которые отдаёт StandIn."""
+
+    def __init__(self):
+        self.counters = (0, 0)
+        self.trades = []
+        self.failing = False
+
+    def me(self, request):
+        if self.failing:
+            return web.json_response({"message": "unavailable"}, status=503)
+        return {"user": {}, "actionable_trades": self.counters[0], "pending_offers": self.counters[1]}
+
+    def pending(self, request):
+        return {"trades": list(self.trades), "count": len(self.trades)}
+
+
+def _watch(steps, **options):
+    """
+    :param steps: [(now, изменение аккаунта или None)] - опросы по порядку
+    :return: (watcher, события колбэков, число запросов списка трейдов после каждого опроса)
+    """
+    account = _Account()
+    events = []
+
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/me")] = account.me
+            server.routes[("GET", "/me/trades")] = account.pending
+            async with Client("key", base_url=server.url) as client:
+                watcher = TradeWatcher(
+                    client,
+                    on_new=lambda trade: events.append(("new", trade.id)),
+                    on_state_changed=lambda trade, previous: events.append(("state", trade.id, previous, trade.state)),
+                    on_gone=lambda trade: events.append(("gone", trade.id)),
+                    on_counters=lambda actionable, pending: events.append(("counters", actionable, pending)),
+                    **options
+                )
+                fetches = []
+                for now, change in steps:
+                    if change is not None:
+                        change(account)
+                    await watcher.run_once(now=now)
+                    fetches.append(len(server.calls("GET", "/me/trades")))
+                return watcher, fetches
+
+    watcher, fetches = asyncio.run(scenario())
+    return watcher, events, fetches
+
+
+def _set(counters=None, trades=None, failing=False):
+    def change(account):
+        if counters is not None:
+            account.counters = counters
+        if trades is not None:
+            account.trades = trades
+        account.failing = failing
+
+    return change
+
+
+def test_unchanged_counters_skip_the_trade_list():
+    watcher, _, fetches = _watch([(T0, None), (T0 + 5, None), (T0 + 20, None)])
+    assert fetches == [1, 1, 1]
+    assert watcher.counters == (0, 0)
+
+
+def test_full_sync_runs_even_with_unchanged_counters():
+    trades = [{"id": "1", "state": "pending"}]
+    watcher, events, fetches = _watch(
+        [(T0, None), (T0 + 5, _set(trades=trades)), (T0 + 120, None)],
+        full_sync_every=100,
+    )
+    assert fetches == [1, 1, 2]
+    assert events == [("counters", 0, 0), ("new", "1")]
+    assert list(watcher.trades) == ["1"]
+
+
+def test_trade_list_is_diffed_by_id_and_state():
+    _, events, _ = _watch([
+        (T0, _set(counters=(1, 0), trades=[{"id": "1", "state": "queued"}, {"id": "2", "state": "pending"}])),
+        (T0 + 5, _set(counters=(1, 1), trades=[{"id": "1", "state": "pending"}, {"id": "3", "state": "pending"}])),
+    ])
+    assert events == [
+        ("counters", 1, 0), ("new", "1"), ("new", "2"),
+        ("counters", 1, 1), ("state", "1", "queued", "pending"), ("new", "3"), ("gone", "2"),
+    ]
+
+
+def test_interval_backs_off_and_resets_on_change():
+    watcher, _, _ = _watch(
+        [(T0, None), (T0 + 5, None), (T0 + 15, None), (T0 + 35, None), (T0 + 75, _set(counters=(1, 0)))],
+        min_interval=5, max_interval=30, backoff=2,
+    )
+    assert watcher.interval == 5
+    assert watcher.next_poll_at() == T0 + 80
+
+
+def test_interval_caps_at_max_and_failed_poll_keeps_it():
+    watcher, _, fetches = _watch(
+        [(T0, None), (T0 + 5, None), (T0 + 15, None), (T0 + 35, None), (T0 + 65, _set(failing=True))],
+        min_interval=5, max_interval=30, backoff=2,
+    )
+    assert watcher.interval == 30
+    assert watcher.next_poll_at() == T0 + 95
+    assert fetches[-1] == 1
+
+
+@pytest.mark.parametrize("options", [{"min_interval": 0}, {"min_interval": 10, "max_interval": 5}, {"backoff": 0.5}])
+def test_invalid_intervals_raise(options):
+    with pytest.raises(ValueError):
+        TradeWatcher(None, **options)
@@ -0,0 +1,64 @@
+import asyncio
+import gzip
+import json
+import pytest
+from src.csfloat_api.csfloat_client import Client
+from src.csfloat_api.transport import RecordingTransport, ReplayMiss, ReplayTransport, Transport
+from stand_in import StandIn
+
+
+def test_transport_is_abstract():
+    with pytest.raises(TypeError):
+        Transport()
+
+    class Incomplete(Transport):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def _record(path: str):
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/listings")] = lambda request: [{"id": request.query["page"]}]
+            with RecordingTransport(path) as recorder:
+                async with Client("secret-key", base_url=server.url, transport=recorder) as client:
+                    pages = [await client.aio.get_all_listings(page=page, raw_response=True) for page in (0, 1)]
+                    await client.aio.make_offer(listing_id=3, price=100)
+            return pages, recorder.records
+
+    return asyncio.run(scenario())
+
+
+def test_replay_returns_recorded_responses(tmp_path):
+    path = str(tmp_path / "scan.jsonl.gz")
+    pages, records = _record(path)
+    assert records == 3
+
+    async def scenario():
+        replay = ReplayTransport(path, speed=None)
+        async with Client("other-key", base_url="http://replay.invalid/api/v1", transport=replay) as client:
+            replayed = [await client.aio.get_all_listings(page=page, raw_response=True) for page in (0, 1)]
+            offer = await client.aio.make_offer(listing_id=3, price=100)
+            with pytest.raises(ReplayMiss):
+                await client.aio.make_offer(listing_id=4, price=100)
+            return replayed, offer
+
+    replayed, offer = asyncio.run(scenario())
+    assert replayed == pages == [[{"id": "0"}], [{"id": "1"}]]
+    assert offer["body"] == {"contract_id": "3", "price": 100, "cancel_previous_offer": False}
+
+
+def test_archive_has_no_request_headers(tmp_path):
+    path = str(tmp_path / "scan.jsonl.gz")
+    _record(path)
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        text = file.read()
+    records = [json.loads(line) for line in text.splitlines()[1:]]
+
+    assert "secret-key" not in text
+    assert [record["target"].split("&")[0] for record in records] == [
+        "/api/v1/listings?page=0", "/api/v1/listings?page=1", "/api/v1/offers",
+    ]
+    assert all("offset" not in record for record in records)
@@ -0,0 +1,62 @@
+import asyncio
+import pytest
+from src.csfloat_api import parse_csgofloat_item
+from src.csfloat_api.client_config import ClientConfig
+from src.csfloat_api.csfloat_client import Client
+from src.csfloat_api.models.base import ValidationError
+from src.csfloat_api.models.history_sale_info import ItemSale
+from stand_in import StandIn
+
+
+def test_trusted_sale_parses_dates_on_first_access():
+    sale = ItemSale(data={"id": "1", "price": 100, "sold_at": "not a date", "created_at": "2024-12-06T23:35:14Z"},
+                    validate=False)
+    assert sale.price == 100
+    assert sale.created_at.year == 2024
+    with pytest.raises(ValueError):
+        sale.sold_at
+
+
+def test_validated_sale_rejects_bad_dates_up_front():
+    with pytest.raises(ValidationError, match="ItemSale"):
+        ItemSale(data={
+            "id": "1", "created_at": "bad", "type": "buy_now", "price": 1, "state": "sold", "reference": {},
+            "item": {"market_hash_name": "AK"}, "is_seller": False, "is_watchlisted": False, "watchers": 0, "sold_at": "bad",
+        })
+
+
+def test_trusted_calls_skip_schema_validation():
+    async def scenario():
+        async with StandIn() as server:
+            # qty строкой не проходит схему
+            server.routes[("POST", "/buy-orders/similar-orders")] = lambda request: {
+                "data": [{"market_hash_name": "AK", "qty": "1", "price": 100}]
+            }
+            server.routes[("GET", "/me/buy-orders")] = lambda request: {"orders": [{"id": 1}], "count": "1"}
+            async with Client("key", base_url=server.url) as client:
+                with pytest.raises(ValidationError):
+                    await client.aio.get_similar_buy_orders("AK")
+                with pytest.raises(ValidationError):
+                    await client.aio.get_my_buy_orders()
+                similar = await client.aio.get_similar_buy_orders("AK", trusted=True)
+                mine = await client.aio.get_my_buy_orders(trusted=True)
+                return similar, mine
+
+    similar, mine = asyncio.run(scenario())
+    assert similar[0].qty == "1"
+    assert mine.count == "1"
+
+
+def test_trusted_sales_history():
+    sale = {"id": "1", "price": 100, "sold_at": "2024-12-07T01:00:00Z"}
+
+    async def scenario():
+        async with StandIn() as server:
+            server.routes[("GET", "/history/AK/sales")] = lambda request: [sale]
+            config = ClientConfig(base_url=server.url)
+            with pytest.raises(ValidationError):
+                await asyncio.to_thread(parse_csgofloat_item.parse_item_by_name, "AK", config=config)
+            return await asyncio.to_thread(parse_csgofloat_item.parse_item_by_name, "AK", trusted=True, config=config)
+
+    sales = asyncio.run(scenario())
+    assert sales[0].sold_at.day == 7
@@ -0,0 +1,210 @@
+import asyncio
+import inspect
+import logging
+import time
+from typing import Callable, Dict, Optional, Tuple
+from src.csfloat_api.models.my_trades_response import Trade, TradesResponse
+
+__all__ = ("TradeWatcher",)
+
+logger = logging.getLogger(__name__)
+
+_PAGE_LIMIT = 500
+
+
+class TradeWatcher:
+    """
+    Следит за незавершёнными трейдами аккаунта.
+
+    Каждый опрос - один дешёвый `get_me()`: счётчики `actionable_trades` и
+    `pending_offers`. Список трейдов (`get_pending_trades`) запрашивается только
+    когда счётчики изменились, при первом опросе и раз в `full_sync_every`
+    секунд (счётчики могут совпасть, если один трейд закрылся, а другой
+    появился). Новый список сравнивается с предыдущим по id и state.
+
+    Интервал опроса адаптивный: после любого изменения он сбрасывается до
+    `min_interval`, пока изменений нет - растёт в `backoff` раз до `max_interval`.
+
+    Колбэки могут быть обычными функциями или корутинами:
+        on_new(trade) - появился трейд;
+        on_state_changed(trade, previous_state) - у трейда сменился state;
+        on_gone(trade) - трейд пропал из незавершённых (последнее известное состояние);
+        on_counters(actionable_trades, pending_offers) - изменились счётчики.
+
+        watcher = TradeWatcher(client, on_new=accept_trade)
+        await watcher.run(stop_event)
+    """
+
+    __slots__ = (
+        "_client",
+        "_trades",
+        "_counters",
+        "_synced_at",
+        "_interval",
+        "_next_poll_at",
+        "_min_interval",
+        "_max_interval",
+        "_backoff",
+        "_full_sync_every",
+        "_on_new",
+        "_on_state_changed",
+        "_on_gone",
+        "_on_counters",
+    )
+
+    def __init__(
+            self,
+            client,
+            *,
+            min_interval: float = 5.0,
+            max_interval: float = 60.0,
+            backoff: float = 1.5,
+            full_sync_every: float = 600.0,
+            on_new: Optional[Callable] = None,
+            on_state_changed: Optional[Callable] = None,
+            on_gone: Optional[Callable] = None,
+            on_counters: Optional[Callable] = None
+    ) -> None:
+        """
+        :param client: Экземпляр `Client` (используются его async-версии методов)
+        :param min_interval: Интервал опроса сразу после изменения, в секундах
+        :param max_interval: Наибольший интервал опроса, когда ничего не меняется
+        :param backoff: Во сколько раз увеличивать интервал после опроса без изменений
+        :param full_sync_every: Как часто запрашивать список трейдов при неизменных счётчиках
+        """
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Expected 0 < min_interval <= max_interval")
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        self._client = client
+        self._trades: Dict[str, Trade] = {}
+        self._counters: Optional[Tuple[Optional[int], Optional[int]]] = None
+        self._synced_at: Optional[float] = None
+        self._interval = min_interval
+        self._next_poll_at: Optional[float] = None
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._full_sync_every = full_sync_every
+        self._on_new = on_new
+        self._on_state_changed = on_state_changed
+        self._on_gone = on_gone
+        self._on_counters = on_counters
+
+    @property
+    def trades(self) -> Dict[str, Trade]:
+        """Незавершённые трейды по id на момент последней синхронизации."""
+        return dict(self._trades)
+
+    @property
+    def counters(self) -> Optional[Tuple[Optional[int], Optional[int]]]:
+        """(actionable_trades, pending_offers) из последнего `get_me`."""
+        return self._counters
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    def next_poll_at(self) -> Optional[float]:
+        return self._next_poll_at
+
+    @staticmethod
+    async def _fire(callback: Optional[Callable], *args) -> None:
+        if callback is None:
+            return
+        try:
+            result = callback(*args)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as error:
+            logger.warning(f"trade callback {callback!r} failed: {error}")
+
+    async def _fetch_pending(self) -> Tuple[Dict[str, Trade], int]:
+        """
+        :return: (трейды по id, число запросов)
+        """
+        trades: Dict[str, Trade] = {}
+        page = 0
+        while True:
+            response = await self._client.aio.get_pending_trades(limit=_PAGE_LIMIT, page=page)
+            # У незавершённых трейдов нет accepted_at, схема Trade для них не подходит
+            batch = TradesResponse(data=response, validate=False).trades
+            for trade in batch:
+                trades[str(trade.id)] = trade
+            page += 1
+            if len(batch) < _PAGE_LIMIT:
+                return trades, page
+
+    async def _apply(self, trades: Dict[str, Trade]) -> bool:
+        """
+        :return: Было ли хоть одно изменение
+        """
+        previous = self._trades
+        self._trades = trades
+        changed = False
+        for key, trade in trades.items():
+            old = previous.get(key)
+            if old is None:
+                changed = True
+                await self._fire(self._on_new, trade)
+            elif old.state != trade.state:
+                changed = True
+                await self._fire(self._on_state_changed, trade, old.state)
+        for key, trade in previous.items():
+            if key not in trades:
+                changed = True
+                await self._fire(self._on_gone, trade)
+        return changed
+
+    async def run_once(self, *, now: Optional[float] = None) -> int:
+        """
+        Один опрос: счётчики и, если нужно, список трейдов.
+
+        :return: Количество сделанных запросов
+        """
+        now = time.time() if now is None else now
+        calls = 1
+        try:
+            me = await self._client.aio.get_me()
+        except Exception as error:
+            logger.warning(f"trade watcher get_me failed: {error}")
+            self._next_poll_at = now + self._interval
+            return calls
+
+        counters = (me.actionable_trades, me.pending_offers)
+        counters_changed = counters != self._counters
+        self._counters = counters
+        if counters_changed:
+            await self._fire(self._on_counters, *counters)
+
+        stale = self._synced_at is None or now - self._synced_at >= self._full_sync_every
+        changed = counters_changed
+        if counters_changed or stale:
+            try:
+                trades, requests = await self._fetch_pending()
+            except Exception as error:
+                logger.warning(f"trade watcher pending trades failed: {error}")
+                # Повторить загрузку списка на следующем опросе
+                self._synced_at = None
+                calls += 1
+            else:
+                calls += requests
+                self._synced_at = now
+                changed = await self._apply(trades) or changed
+
+        if changed:
+            self._interval = self._min_interval
+        else:
+            self._interval = min(self._interval * self._backoff, self._max_interval)
+        self._next_poll_at = now + self._interval
+        return calls
+
+    async def run(self, stop: Optional[asyncio.Event] = None) -> None:
+        stop = stop if stop is not None else asyncio.Event()
+        while not stop.is_set():
+            await self.run_once()
+            delay = max(self._next_poll_at - time.time(), 0.0)
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,340 @@
+import abc
+import asyncio
+import base64
+import gzip
+import json
+import time
+from collections import deque
+from typing import Deque, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+import aiohttp
+from src.csfloat_api.compression import decompress
+from src.csfloat_api.profiling import Mark, mark
+
+__all__ = (
+    "TransportResponse",
+    "Transport",
+    "AiohttpTransport",
+    "RecordingTransport",
+    "ReplayTransport",
+    "ReplayMiss",
+)
+
+_ARCHIVE_VERSION = 1
+
+
+class TransportResponse:
+    __slots__ = (
+        "_status",
+        "_headers",
+        "_content_type",
+        "_body",
+        "_headers_at",
+        "_wire_size",
+    )
+
+    def __init__(
+            self,
+            *,
+            status: int,
+            headers: Mapping[str, str],
+            content_type: str,
+            body: bytes,
+            headers_at: Optional[Mark] = None,
+            wire_size: Optional[int] = None
+    ):
+        self._status = status
+        self._headers = headers
+        self._content_type = content_type
+        self._body = body
+        self._headers_at = headers_at
+        self._wire_size = wire_size
+
+    @property
+    def status(self) -> int:
+        return self._status
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._headers
+
+    @property
+    def content_type(self) -> str:
+        return self._content_type
+
+    @property
+    def body(self) -> bytes:
+        return self._body
+
+    @property
+    def headers_at(self) -> Optional[Mark]:
+        """Отметка `profiling.mark()` в момент получения заголовков, если транспорт её знает."""
+        return self._headers_at
+
+    @property
+    def wire_size(self) -> Optional[int]:
+        """Размер тела на проводе до распаковки, если транспорт его знает."""
+        return self._wire_size
+
+
+class Transport(abc.ABC):
+    """
+    Отправка одного HTTP-запроса под `Client._request`.
+
+    Бюджет, повторы, дедлайны и разбор ответа остаются в клиенте, транспорт
+    только обменивается байтами. `needs_session = False` означает, что клиенту
+    не нужно открывать aiohttp-сессию (например, при воспроизведении записи).
+    """
+
+    __slots__ = ()
+
+    needs_session = True
+
+    @abc.abstractmethod
+    async def request(
+            self,
+            session: Optional[aiohttp.ClientSession],
+            method: str,
+            url: str,
+            *,
+            json_data=None,
+            proxy: Optional[str] = None
+    ) -> TransportResponse:
+        """
+        :param session: Сессия клиента (None, если `needs_session = False`)
+        :param json_data: JSON-тело запроса
+        :param proxy: Прокси клиента
+        """
+
+
+class AiohttpTransport(Transport):
+    """
+    Транспорт по умолчанию: запрос через сессию клиента.
+
+    Сессии клиента создаются с `auto_decompress=False`, и тело разжимается
+    здесь уже после возврата соединения в пул; большие тела можно разжимать
+    в отдельном потоке, чтобы не держать цикл событий.
+    """
+
+    __slots__ = ("_thread_threshold",)
+
+    def __init__(self, *, decompress_in_thread_above: Optional[int] = None) -> None:
+        """
+        :param decompress_in_thread_above: С какого размера сжатого тела (в байтах) разжимать
+            его в потоке (None - всегда в цикле событий)
+        """
+        self._thread_threshold = decompress_in_thread_above
+
+    async def request(self, session, method, url, *, json_data=None, proxy=None) -> TransportResponse:
+        async with session.request(method=method, url=url, json=json_data, proxy=proxy) as response:
+            headers_at = mark()
+            body = await response.read()
+
+        wire_size = len(body)
+        encoding = response.headers.get("Content-Encoding")
+        if encoding and session.auto_decompress:
+            # aiohttp уже разжал тело, размер на проводе неизвестен
+            wire_size = None
+        elif encoding:
+            if self._thread_threshold is not None and wire_size >= self._thread_threshold:
+                body = await asyncio.to_thread(decompress, body, encoding)
+            else:
+                body = decompress(body, encoding)
+
+        return TransportResponse(
+            status=response.status,
+            headers=response.headers,
+            content_type=response.content_type,
+            body=body,
+            headers_at=headers_at,
+            wire_size=wire_size,
+        )
+
+
+def _request_key(method: str, url: str, json_data) -> Tuple[str, str, Optional[str]]:
+    # Без схемы и хоста, чтобы запись воспроизводилась с любым base_url
+    parts = urlsplit(url)
+    target = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    body = None if json_data is None else json.dumps(json_data, sort_keys=True, separators=(",", ":"))
+    return method, target, body
+
+
+def _encode_body(body: bytes) -> dict:
+    try:
+        return {"body": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_b64": base64.b64encode(body).decode("ascii")}
+
+
+def _decode_body(record: dict) -> bytes:
+    if "body_b64" in record:
+        return base64.b64decode(record["body_b64"])
+    return record["body"].encode("utf-8")
+
+
+class RecordingTransport(Transport):
+    """
+    Пишет каждую пару запрос/ответ вместе с заголовками ответа и временем
+    ответа в gzip-архив JSON Lines, пропуская запросы через `inner` транспорт.
+
+    Заголовки запроса не записываются: они задаются сессией клиента, а не
+    транспортом, и содержат API-ключ. Поэтому ReplayTransport сопоставляет
+    запросы только по методу, пути с query и JSON-телу.
+
+        recorder = RecordingTransport("scan.jsonl.gz")
+        client = Client(api_key, transport=recorder)
+        ...
+        recorder.close()
+    """
+
+    __slots__ = (
+        "_inner",
+        "_file",
+        "_records",
+    )
+
+    def __init__(self, path: str, inner: Optional[Transport] = None, *, compresslevel: int = 6) -> None:
+        """
+        :param path: Путь к архиву
+        :param inner: Транспорт, через который идут запросы (по умолчанию AiohttpTransport)
+        :param compresslevel: Уровень сжатия gzip
+        """
+        self._inner = inner if inner is not None else AiohttpTransport()
+        self._file = gzip.open(path, "wt", encoding="utf-8", compresslevel=compresslevel)
+        self._records = 0
+        self._file.write(json.dumps({"version": _ARCHIVE_VERSION, "recorded_at": time.time()}) + "\n")
+
+    @property
+    def needs_session(self) -> bool:
+        return self._inner.needs_session
+
+    @property
+    def records(self) -> int:
+        return self._records
+
+    async def request(self, session, method, url, *, json_data=None, proxy=None) -> TransportResponse:
+        started = time.monotonic()
+        response = await self._inner.request(session, method, url, json_data=json_data, proxy=proxy)
+        elapsed = time.monotonic() - started
+
+        _, target, body = _request_key(method, url, json_data)
+        record = {
+            "method": method,
+            "target": target,
+            "request": body,
+            "elapsed": round(elapsed, 6),
+            "wall": time.time(),
+            "status": response.status,
+            "headers": list(response.headers.items()),
+            "content_type": response.content_type,
+            "wire": response.wire_size,
+            **_encode_body(response.body),
+        }
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._records += 1
+        return response
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "RecordingTransport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ReplayMiss(LookupError):
+    """В архиве нет ответа на такой запрос."""
+
+
+class _ReplayHeaders(dict):
+    """Заголовки без учёта регистра, как у aiohttp."""
+
+    def __init__(self, pairs) -> None:
+        super().__init__((name.lower(), value) for name, value in pairs)
+
+    def get(self, name, default=None):
+        return super().get(name.lower(), default)
+
+    def __getitem__(self, name):
+        return super().__getitem__(name.lower())
+
+    def __contains__(self, name) -> bool:
+        return super().__contains__(name.lower())
+
+
+class ReplayTransport(Transport):
+    """
+    Отдаёт ответы из архива `RecordingTransport` без сети.
+
+    Ответы на одинаковые запросы (метод, путь с query, JSON-тело) отдаются в
+    порядке записи; после последнего повторяется последний (`repeat=True`)
+    или поднимается ReplayMiss. Каждый ответ задерживается на записанное время
+    ответа, делённое на `speed`; `speed=None` отдаёт ответы сразу.
+    X-Ratelimit-Reset сдвигается к текущему времени с тем же ускорением,
+    поэтому RateBudget клиента видит те же окна, что и при записи.
+
+        client = Client(api_key, transport=ReplayTransport("scan.jsonl.gz", speed=10))
+    """
+
+    needs_session = False
+
+    __slots__ = (
+        "_responses",
+        "_speed",
+        "_repeat",
+    )
+
+    def __init__(self, path: str, *, speed: Optional[float] = 1.0, repeat: bool = True) -> None:
+        """
+        :param path: Архив `RecordingTransport`
+        :param speed: Во сколько раз ускорить ответы (None - без задержек)
+        :param repeat: Повторять последний ответ, когда записанные закончились
+        """
+        self._responses: Dict[tuple, Deque[dict]] = {}
+        self._speed = speed
+        self._repeat = repeat
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            header = json.loads(file.readline())
+            if header.get("version") != _ARCHIVE_VERSION:
+                raise ValueError(f"Unsupported archive version {header.get('version')}")
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                key = (record["method"], record["target"], record["request"])
+                self._responses.setdefault(key, deque()).append(record)
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self._responses.values())
+
+    def _next(self, key: tuple) -> dict:
+        records = self._responses.get(key)
+        if not records:
+            raise ReplayMiss(f"No recorded response for {key[0]} {key[1]}")
+        if len(records) == 1 and self._repeat:
+            return records[0]
+        return records.popleft()
+
+    def _headers(self, record: dict) -> _ReplayHeaders:
+        headers = _ReplayHeaders(record["headers"])
+        reset = headers.get("X-Ratelimit-Reset")
+        if reset is not None:
+            left = float(reset) - record["wall"]
+            if self._speed:
+                left /= self._speed
+            headers["x-ratelimit-reset"] = str(time.time() + left)
+        return headers
+
+    async def request(self, session, method, url, *, json_data=None, proxy=None) -> TransportResponse:
+        record = self._next(_request_key(method, url, json_data))
+        if self._speed:
+            await asyncio.sleep(record["elapsed"] / self._speed)
+        return TransportResponse(
+            status=record["status"],
+            headers=self._headers(record),
+            content_type=record["content_type"],
+            body=_decode_body(record),
+            wire_size=record.get("wire"),
+        )